@@ -1,5 +1,6 @@
 """Ambeo Soundbar integration setup."""
 
+import asyncio
 import logging
 from dataclasses import dataclass
 
@@ -8,14 +9,17 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import device_registry as dr
-from homeassistant.helpers.aiohttp_client import async_create_clientsession
 
+from .api.const import Capability
 from .api.exceptions import AmbeoConnectionError
 from .api.factory import AmbeoAPIFactory
+from .api.pool import AmbeoConnectionPool
 from .const import (
     CONFIG_CONCURRENT_REQUESTS,
     CONFIG_CONCURRENT_REQUESTS_DEFAULT,
     CONFIG_HOST,
+    CONFIG_SPLIT_PLAYBACK_EVENTS,
+    CONFIG_SPLIT_PLAYBACK_EVENTS_DEFAULT,
     CONFIG_UPDATE_INTERVAL,
     CONFIG_UPDATE_INTERVAL_DEFAULT,
     DEFAULT_PORT,
@@ -25,9 +29,18 @@ from .const import (
     TIMEOUT,
 )
 from .coordinator import AmbeoCoordinator
+from .store import (
+    AmbeoMetadataStore,
+    AmbeoSnapshotStore,
+    DeviceMetadata,
+    async_fetch_metadata,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Seconds between attempts to revalidate the metadata cache.
+METADATA_RETRY_DELAY = 60
+
 type AmbeoConfigEntry = ConfigEntry["AmbeoData"]
 
 
@@ -37,6 +50,7 @@ class AmbeoData:
 
     coordinator: AmbeoCoordinator
     device: "AmbeoDevice"
+    pool: AmbeoConnectionPool
 
 
 class AmbeoDevice:
@@ -87,30 +101,80 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         CONFIG_CONCURRENT_REQUESTS,
         entry.data.get(CONFIG_CONCURRENT_REQUESTS, CONFIG_CONCURRENT_REQUESTS_DEFAULT),
     )
-    session = async_create_clientsession(hass)
+    split_playback_events = entry.options.get(
+        CONFIG_SPLIT_PLAYBACK_EVENTS, CONFIG_SPLIT_PLAYBACK_EVENTS_DEFAULT
+    )
+    pool = AmbeoConnectionPool(
+        hass,
+        control_connections=concurrent_requests,
+        # One more long poll when playback events have their own queue.
+        event_connections=AmbeoConnectionPool.EVENT_CONNECTIONS_DEFAULT
+        + (1 if split_playback_events else 0),
+    )
+    entry.async_on_unload(pool.async_close)
 
-    try:
-        ambeo_api = await AmbeoAPIFactory.create_api(
-            host, DEFAULT_PORT, TIMEOUT, session
+    store = AmbeoMetadataStore(hass, entry.entry_id)
+    snapshot_store = AmbeoSnapshotStore(hass, entry.entry_id)
+    cached, snapshot = await asyncio.gather(
+        store.async_load(), snapshot_store.async_load()
+    )
+    if cached is not None:
+        # Come up from the cache and the last known data without touching
+        # the network; both are refreshed once the platforms are set up.
+        api_class = AmbeoAPIFactory.api_class_for_model(cached.model)
+        ambeo_api = api_class(
+            host, DEFAULT_PORT, TIMEOUT, pool.session, pool.event_session
         )
-        serial = await ambeo_api.get_serial() or "unknown_serial"
-        model = await ambeo_api.get_model()
-        name = await ambeo_api.get_name()
-        version = await ambeo_api.get_version()
-        sources = await ambeo_api.get_all_sources() or []
-        presets = await ambeo_api.get_all_presets() or []
-    except (AmbeoConnectionError, aiohttp.ClientError) as ex:
-        raise ConfigEntryNotReady(f"Could not connect to {host}: {ex}") from ex
-
-    device = AmbeoDevice(serial, name, MANUFACTURER, model, version, host, DEFAULT_PORT)
+        serial, name = cached.serial, cached.name
+        model, version = cached.model, cached.version
+        coordinator = AmbeoCoordinator(
+            hass,
+            ambeo_api,
+            cached.sources,
+            cached.presets,
+            update_interval,
+            concurrent_requests,
+            split_playback_events,
+        )
+        coordinator.set_has_subwoofer(cached.has_subwoofer)
+        if snapshot:
+            coordinator.restore_snapshot(snapshot)
+    else:
+        try:
+            ambeo_api, identity = await AmbeoAPIFactory.bootstrap(
+                host, DEFAULT_PORT, TIMEOUT, pool.session, pool.event_session
+            )
+        except (AmbeoConnectionError, aiohttp.ClientError) as ex:
+            raise ConfigEntryNotReady(f"Could not connect to {host}: {ex}") from ex
 
-    coordinator = AmbeoCoordinator(
-        hass, ambeo_api, sources, presets, update_interval, concurrent_requests
+        serial = identity.serial or "unknown_serial"
+        name, model, version = identity.name, identity.model, identity.version
+        coordinator = AmbeoCoordinator(
+            hass,
+            ambeo_api,
+            [],
+            [],
+            update_interval,
+            concurrent_requests,
+            split_playback_events,
+        )
+        # Sources and presets are only needed once the platforms are set up,
+        # so load them alongside the first refresh.
+        try:
+            await asyncio.gather(
+                coordinator.async_config_entry_first_refresh(),
+                coordinator.async_load_sources_and_presets(),
+            )
+        except (AmbeoConnectionError, aiohttp.ClientError) as ex:
+            raise ConfigEntryNotReady(f"Could not connect to {host}: {ex}") from ex
+    entry.async_on_unload(
+        coordinator.async_add_listener(
+            lambda: snapshot_store.async_delay_save(coordinator.get_snapshot())
+        )
     )
-    await coordinator.async_config_entry_first_refresh()
-    await coordinator.async_start_event_listener()
 
-    entry.runtime_data = AmbeoData(coordinator=coordinator, device=device)
+    device = AmbeoDevice(serial, name, MANUFACTURER, model, version, host, DEFAULT_PORT)
+    entry.runtime_data = AmbeoData(coordinator=coordinator, device=device, pool=pool)
     _LOGGER.debug("Data initialized")
 
     device_registry = dr.async_get(hass)
@@ -124,11 +188,70 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    # Subscribe only once the entities, and so the keys in use, are known.
+    coordinator.async_enable_pruning()
+    await coordinator.async_start_event_listener()
+
+    if cached is None:
+        # Setup has just read everything the cache holds; the platforms
+        # looked up the subwoofer if the model has one.
+        has_subwoofer = None
+        if coordinator.has_capability(Capability.SUBWOOFER):
+            has_subwoofer = await coordinator.has_subwoofer()
+        await store.async_save(
+            DeviceMetadata(
+                serial=serial,
+                model=model,
+                name=name,
+                version=version,
+                sources=coordinator.sources,
+                presets=coordinator.presets,
+                has_subwoofer=has_subwoofer,
+            )
+        )
+    else:
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN}_initial_refresh"
+        )
+        entry.async_create_background_task(
+            hass,
+            _async_revalidate_metadata(hass, entry, store, cached),
+            f"{DOMAIN}_revalidate_metadata",
+        )
 
     return True
 
 
+async def _async_revalidate_metadata(
+    hass: HomeAssistant,
+    entry: AmbeoConfigEntry,
+    store: AmbeoMetadataStore,
+    cached: DeviceMetadata,
+) -> None:
+    """Refresh the metadata cache, reloading the entry if it was stale."""
+    api = entry.runtime_data.coordinator.api
+    while True:
+        try:
+            current = await async_fetch_metadata(api)
+            break
+        except (AmbeoConnectionError, aiohttp.ClientError) as ex:
+            _LOGGER.debug("Could not revalidate device metadata: %s", ex)
+            await asyncio.sleep(METADATA_RETRY_DELAY)
+    if current == cached:
+        return
+    await store.async_save(current)
+    _LOGGER.info("Device metadata changed, reloading %s", entry.title)
+    # Not an entry task: the reload cancels those.
+    hass.async_create_task(hass.config_entries.async_reload(entry.entry_id))
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: AmbeoConfigEntry) -> bool:
     """Handle integration unload."""
     await entry.runtime_data.coordinator.async_stop()
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: AmbeoConfigEntry) -> None:
+    """Delete the caches of a removed entry."""
+    await AmbeoMetadataStore(hass, entry.entry_id).async_remove()
+    await AmbeoSnapshotStore(hass, entry.entry_id).async_remove()
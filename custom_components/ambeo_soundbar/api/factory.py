@@ -1,6 +1,8 @@
 """Factory for Ambeo Soundbar API instances."""
 
+import asyncio
 import logging
+from typing import NamedTuple
 
 from aiohttp import ClientSession
 
@@ -12,20 +14,54 @@ from .impl.popcorn_api import AmbeoPopcornApi
 _LOGGER = logging.getLogger(__name__)
 
 
+class DeviceIdentity(NamedTuple):
+    """Identity of a soundbar, read once during setup."""
+
+    serial: str | None
+    model: str | None
+    name: str | None
+    version: str | None
+
+
 class AmbeoAPIFactory:
     """Factory to get the correct API depending on model."""
 
     @staticmethod
-    async def create_api(
-        ip: str, port, timeout: int, session: ClientSession
-    ) -> AmbeoApi:
-        """Create and return the appropriate API instance for the given device model."""
-        ambeo_api = AmbeoApi(ip, port, timeout, session)
-        model = await ambeo_api.get_model()
-        _LOGGER.debug("Setting up the API for %s", model)
+    def api_class_for_model(model: str | None) -> type[AmbeoApi]:
+        """Return the API class implementing the given device model."""
         if model in POPCORN_API_MODELS:
-            return AmbeoPopcornApi(ip, port, timeout, session)
-        elif model in ESPRESSO_API_MODELS:
-            return AmbeoEspressoApi(ip, port, timeout, session)
-        else:
-            raise ValueError(f"Unsupported model : {model}")
+            return AmbeoPopcornApi
+        if model in ESPRESSO_API_MODELS:
+            return AmbeoEspressoApi
+        raise ValueError(f"Unsupported model : {model}")
+
+    @staticmethod
+    async def read_identity(api: AmbeoApi) -> DeviceIdentity:
+        """Read the identity fields concurrently."""
+        return DeviceIdentity(
+            *await asyncio.gather(
+                api.get_serial(),
+                api.get_model(),
+                api.get_name(),
+                api.get_version(),
+            )
+        )
+
+    @staticmethod
+    async def bootstrap(
+        ip: str,
+        port,
+        timeout: int,
+        session: ClientSession,
+        event_session: ClientSession | None = None,
+    ) -> tuple[AmbeoApi, DeviceIdentity]:
+        """Read the device identity and create the matching API instance.
+
+        The identity fields are generic, so they are all fetched concurrently
+        in a single round trip before the model is known.
+        """
+        probe = AmbeoApi(ip, port, timeout, session)
+        identity = await AmbeoAPIFactory.read_identity(probe)
+        _LOGGER.debug("Setting up the API for %s", identity.model)
+        api_class = AmbeoAPIFactory.api_class_for_model(identity.model)
+        return api_class(ip, port, timeout, session, event_session), identity
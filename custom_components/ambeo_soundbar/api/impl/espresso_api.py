@@ -1,6 +1,8 @@
 """API implementation for Ambeo Soundbar Max (Espresso)."""
 
 import asyncio
+import time
+from collections.abc import Collection
 from typing import Any
 
 from ..const import (
@@ -11,7 +13,7 @@ from ..const import (
     Capability,
     PathSub,
 )
-from .generic_api import AmbeoApi, _extract_from_subs
+from .generic_api import AmbeoApi, EventExtractor
 
 
 class AmbeoEspressoApi(AmbeoApi):
@@ -78,6 +80,14 @@ class AmbeoEspressoApi(AmbeoApi):
         ),
     ]
 
+    # Parents of the polled settings; ui:/settings/subwoofer is left out as
+    # the subwoofer probe needs roles the rows may not carry.
+    _BULK_READ_PARENTS = ("settings:/espresso", "ui:/settings/audio")
+    # Seconds a known brightness composite may be reused for a write while no
+    # event queue delivers its changes; older values may have been changed on
+    # the device without us noticing.
+    BRIGHTNESS_CACHE_TTL = 10
+
     capabilities = [
         Capability.AMBEO_MODE_LEVEL,
         Capability.CENTER_SPEAKER_LEVEL,
@@ -97,6 +107,10 @@ class AmbeoEspressoApi(AmbeoApi):
         """Initialize and set up instance variables."""
         super().__init__(*args, **kwargs)
         self._has_subwoofer: bool | None = None
+        # Last known espressoBrightness composite, fed by reads, events and
+        # writes so setting one half needs no read of the other.
+        self._brightness: dict[str, Any] | None = None
+        self._brightness_at = 0.0
 
     def get_volume_max(self) -> int:
         """Get the maximum native volume value."""
@@ -197,36 +211,71 @@ class AmbeoEspressoApi(AmbeoApi):
             {"title": "Music", "id": 4},
         ]
 
+    async def _read_brightness(self) -> dict[str, Any] | None:
+        """Read the espressoBrightness composite and refresh the cache."""
+        brightness = await self.get_value(self._BRIGHTNESS_PATH, "espressoBrightness")
+        if brightness:
+            self._cache_brightness(brightness)
+        return brightness
+
+    def _cache_brightness(self, brightness: dict[str, Any] | None) -> None:
+        """Remember the composite last seen on the device, or forget it."""
+        self._brightness = None if brightness is None else dict(brightness)
+        self._brightness_at = time.monotonic()
+
+    def _cached_brightness(self) -> dict[str, Any] | None:
+        """Return the cached composite unless it may have changed unseen.
+
+        While the brightness events are delivered the cache follows the
+        device; otherwise it is only trusted for BRIGHTNESS_CACHE_TTL.
+        """
+        if self._BRIGHTNESS_PATH in self._live_event_paths:
+            return self._brightness
+        if time.monotonic() - self._brightness_at > self.BRIGHTNESS_CACHE_TTL:
+            return None
+        return self._brightness
+
+    def set_live_event_paths(self, paths: Collection[str]) -> None:
+        """Set the live event paths, dropping a composite too old to trust."""
+        if self._BRIGHTNESS_PATH in paths:
+            # Changes made before the queue went live were never delivered.
+            self._brightness = self._cached_brightness()
+        super().set_live_event_paths(paths)
+
+    async def _write_brightness(self, **changes: Any) -> None:
+        """Write the brightness composite with the given fields changed."""
+        current = self._cached_brightness() or await self._read_brightness() or {}
+        value = {
+            "ambeologo": current.get("ambeologo"),
+            "display": current.get("display"),
+            **changes,
+        }
+        try:
+            await self.set_value(self._BRIGHTNESS_PATH, "espressoBrightness", value)
+        except Exception:
+            # The device state is unknown, read it again on the next write.
+            self._cache_brightness(None)
+            raise
+        self._cache_brightness(value)
+
     async def get_display_brightness(self):
         """Get the display brightness."""
-        espressoBrightness = await self.get_value(
-            "settings:/espresso/brightnessSensor", "espressoBrightness"
-        )
+        espressoBrightness = await self._read_brightness()
         if espressoBrightness:
             return espressoBrightness["display"]
         return None
 
     async def set_display_brightness(self, brightness):
         """Set the display brightness."""
-        logo_brightness = await self.get_logo_brightness()
-        value = {"ambeologo": logo_brightness, "display": brightness}
-        await self.set_value(
-            "settings:/espresso/brightnessSensor", "espressoBrightness", value
-        )
+        await self._write_brightness(display=brightness)
 
     async def set_logo_brightness(self, brightness):
         """Set the Ambeo logo brightness."""
-        display_brightness = await self.get_display_brightness()
-        value = {"ambeologo": brightness, "display": display_brightness}
-        await self.set_value(
-            "settings:/espresso/brightnessSensor", "espressoBrightness", value
-        )
+        await self._write_brightness(ambeologo=brightness)
 
     async def get_logo_brightness(self):
         """Get the Ambeo logo brightness."""
-        espressoBrightness = await self.get_value(
-            "settings:/espresso/brightnessSensor", "espressoBrightness"
-        )
+        espressoBrightness = await self._read_brightness()
         if espressoBrightness:
             return espressoBrightness["ambeologo"]
         return None
@@ -323,30 +372,52 @@ class AmbeoEspressoApi(AmbeoApi):
         """Set the subwoofer enabled status."""
         await self.set_value("ui:/settings/subwoofer/enabled", "bool_", status)
 
-    def get_subscribed_paths(self) -> list[str]:
-        """Return paths to subscribe to, filtered by device capabilities."""
-        paths = super().get_subscribed_paths()
-        paths.extend(
-            s.path
+    def _active_subscriptions(self) -> list[PathSub]:
+        """Return subscriptions filtered by device capabilities."""
+        subs = super()._active_subscriptions()
+        subs.extend(
+            s
             for s in self._SUBSCRIPTIONS
             if s.capability is None or self.has_capability(s.capability)
         )
-        if self.has_capability(Capability.MAX_DISPLAY) or self.has_capability(
-            Capability.MAX_LOGO
-        ):
-            paths.append(self._BRIGHTNESS_PATH)
-        return paths
-
-    def process_event(self, path: str, item_value: dict) -> dict[str, Any]:
-        """Map an event path + itemValue to coordinator data updates."""
-        if result := super().process_event(path, item_value):
-            return result
-        if path == self._BRIGHTNESS_PATH:
-            brightness = item_value.get("espressoBrightness", {})
-            updates: dict[str, Any] = {}
-            if "ambeologo" in brightness:
-                updates["logo_brightness"] = brightness["ambeologo"]
-            if "display" in brightness:
-                updates["display_brightness"] = brightness["display"]
-            return updates
-        return _extract_from_subs(self._SUBSCRIPTIONS, path, item_value)
+        return subs
+
+    def _data_key_paths(self) -> dict[str, str]:
+        """Return the device path read for each data key, with brightness."""
+        return {
+            **super()._data_key_paths(),
+            "display_brightness": self._BRIGHTNESS_PATH,
+            "logo_brightness": self._BRIGHTNESS_PATH,
+        }
+
+    def _build_dispatch_table(self) -> dict[str, EventExtractor]:
+        """Compile the dispatch table, adding the two-key brightness path."""
+        table = super()._build_dispatch_table()
+        if self._brightness_keys():
+            table[self._BRIGHTNESS_PATH] = self._extract_brightness
+        return table
+
+    def _brightness_keys(self) -> set[str]:
+        """Return the wanted data keys carried by the brightness path."""
+        keys = set()
+        if self.has_capability(Capability.MAX_DISPLAY):
+            keys.add("display_brightness")
+        if self.has_capability(Capability.MAX_LOGO):
+            keys.add("logo_brightness")
+        return {key for key in keys if self._is_wanted(key)}
+
+    def get_subscribed_keys(self) -> set[str]:
+        """Return data keys kept up to date by events, filtered by capabilities."""
+        return super().get_subscribed_keys() | self._brightness_keys()
+
+    def _extract_brightness(self, item_value: dict) -> dict[str, Any]:
+        """Split an espressoBrightness value into logo and display updates."""
+        brightness = item_value.get("espressoBrightness", {})
+        if "ambeologo" in brightness and "display" in brightness:
+            self._cache_brightness(brightness)
+        updates: dict[str, Any] = {}
+        if "ambeologo" in brightness:
+            updates["logo_brightness"] = brightness["ambeologo"]
+        if "display" in brightness:
+            updates["display_brightness"] = brightness["display"]
+        return updates
@@ -1,8 +1,12 @@
 """Generic API base class for Ambeo Soundbar integration."""
 
+import asyncio
+import contextlib
 import json
 import logging
 import time
+from collections.abc import Callable, Collection, Iterator
+from contextvars import ContextVar
 from typing import Any
 from urllib.parse import quote
 
@@ -11,21 +15,50 @@ import yarl
 
 from ..const import BRIGHTNESS_RANGE_DEFAULT, PathSub
 from ..exceptions import AmbeoConnectionError
+from ..scheduler import (
+    AimdLimiter,
+    RequestPriority,
+    RequestScheduler,
+    current_priority,
+)
+from ..timing import RttEstimator
 
 _LOGGER = logging.getLogger(__name__)
 
 
-def _extract_from_subs(
-    subs: list[PathSub], path: str, item_value: dict
-) -> dict[str, Any]:
-    """Return coordinator updates for the first PathSub whose path matches."""
-    for sub in subs:
-        if sub.path == path:
-            value = item_value.get(sub.type_key)
-            if sub.sub_key and isinstance(value, dict):
-                value = value.get(sub.sub_key)
-            return {sub.data_key: value} if value is not None else {}
-    return {}
+EventExtractor = Callable[[dict], dict[str, Any]]
+
+
+def _compile_extractor(sub: PathSub) -> EventExtractor:
+    """Return a callable mapping an event itemValue to coordinator updates."""
+    data_key, type_key, sub_key = sub.data_key, sub.type_key, sub.sub_key
+
+    def extract(item_value: dict) -> dict[str, Any]:
+        value = item_value.get(type_key)
+        if sub_key and isinstance(value, dict):
+            value = value.get(sub_key)
+        return {data_key: value} if value is not None else {}
+
+    return extract
+
+
+class _RefreshMemo:
+    """Read results shared by all getters during one refresh cycle."""
+
+    def __init__(self, api: "AmbeoApi") -> None:
+        """Initialize an empty memo for the given API."""
+        self.api = api
+        self.generation = api._write_generation
+        self.values: dict[tuple, Any] = {}
+        self.hits = 0
+
+
+# The memo of the refresh cycle running in the current task, if any. Being a
+# context variable, it is inherited by the tasks the refresh fans out to but
+# not seen by unrelated tasks such as the event listener.
+_refresh_memo: ContextVar[_RefreshMemo | None] = ContextVar(
+    "ambeo_refresh_memo", default=None
+)
 
 
 class AmbeoApi:
@@ -33,14 +66,62 @@ class AmbeoApi:
 
     capabilities: list[str] = []
 
+    # Lowest adaptive timeout, in seconds, per operation class.
+    _TIMEOUT_FLOORS = {"getData": 0.5, "getRows": 1.0, "setData": 1.0}
+
+    # Read-only functions whose identical in-flight requests are shared.
+    _COALESCED_FUNCTIONS = frozenset({"getData", "getRows"})
+
+    # Parent nodes of polled settings, read with getRows once per refresh.
+    _BULK_READ_PARENTS: tuple[str, ...] = ()
+    _BULK_READ_ROWS = 50
+    # Due settings under a parent for its getRows to save requests.
+    _BULK_READ_MIN_PATHS = 2
+
     def __init__(
-        self, ip: str, port: int, timeout: int, session: aiohttp.ClientSession
+        self,
+        ip: str,
+        port: int,
+        timeout: int,
+        session: aiohttp.ClientSession,
+        event_session: aiohttp.ClientSession | None = None,
     ):
-        """Initialize the API with the given IP, port, session, and Home Assistant instance."""
+        """Initialize the API with the given IP, port and sessions.
+
+        event_session carries the event queue requests, including the
+        long-lived pollQueue calls; it defaults to session.
+        """
         self.session = session
+        self.event_session = event_session or session
         self.port = port
         self.set_endpoint(ip)
         self.timeout = timeout
+        # Adaptive timeouts per operation class; self.timeout is the ceiling.
+        self._rtt: dict[str, RttEstimator] = {
+            function: RttEstimator(floor, timeout)
+            for function, floor in self._TIMEOUT_FLOORS.items()
+        }
+        # Data keys worth subscribing to; None subscribes to everything.
+        self._wanted_keys: frozenset[str] | None = None
+        # Path -> extractor, built once so event routing is a single lookup.
+        self._dispatch: dict[str, EventExtractor] = self._build_dispatch_table()
+        # Subscribed paths whose event queue is currently delivering events.
+        self._live_event_paths: frozenset[str] = frozenset()
+        # Single-flight registry of in-flight read requests.
+        self._inflight: dict[tuple, asyncio.Task] = {}
+        # Orders getData/getRows/setData requests, commands first, under the
+        # cap from set_request_limit; event queue requests bypass it.
+        self._scheduler = RequestScheduler()
+        # Adapts the scheduler's cap below that bound; None until it is set.
+        self._limiter: AimdLimiter | None = None
+        self.requests_issued = 0
+        self.requests_coalesced = 0
+        # Bumped around every write so shared reads and refresh memos never
+        # answer with a value read before it.
+        self._write_generation = 0
+        self.memo_hits = 0
+        self.last_cycle_memo_hits = 0
+        self.bulk_rows = 0
 
     def set_endpoint(self, host: str) -> None:
         """Set the API endpoint host."""
@@ -48,7 +129,11 @@ class AmbeoApi:
         self.endpoint = f"http://{host}:{self.port}/api"
 
     async def fetch_data(
-        self, url: str, http_timeout: int | None = None, encoded: bool = False
+        self,
+        url: str,
+        http_timeout: int | None = None,
+        encoded: bool = False,
+        session: aiohttp.ClientSession | None = None,
     ):
         """Fetch data from a given URL.
 
@@ -58,17 +143,33 @@ class AmbeoApi:
             encoded: If True, treat the URL as already percent-encoded and pass
                 it to aiohttp as a yarl.URL(…, encoded=True) to prevent
                 double-encoding of special characters such as { and }.
+            session: Session to use instead of self.session.
 
         """
         full_url = f"{self.endpoint}/{url}"
+        estimator = (
+            self._rtt.get(url.partition("?")[0]) if http_timeout is None else None
+        )
         try:
-            total = http_timeout if http_timeout is not None else self.timeout
-            timeout = aiohttp.ClientTimeout(total=total)
+            if estimator is not None:
+                # The adaptive budget bounds the wait for the response, while
+                # self.timeout still caps the whole request.
+                timeout = aiohttp.ClientTimeout(
+                    total=self.timeout, sock_read=estimator.timeout
+                )
+            else:
+                total = http_timeout if http_timeout is not None else self.timeout
+                timeout = aiohttp.ClientTimeout(total=total)
+            start = time.monotonic()
             _LOGGER.debug("Executing URL fetch: %s", full_url)
             request_url: str | yarl.URL = (
                 yarl.URL(full_url, encoded=True) if encoded else full_url
             )
-            async with self.session.get(request_url, timeout=timeout) as response:
+            async with (session or self.session).get(
+                request_url, timeout=timeout
+            ) as response:
+                if estimator is not None:
+                    estimator.observe(time.monotonic() - start)
                 if response.status != 200:
                     _LOGGER.error(
                         "HTTP request failed with status: %s for url: %s",
@@ -81,10 +182,14 @@ class AmbeoApi:
                 return json_data
 
         except aiohttp.ClientError as e:
+            if estimator is not None and isinstance(e, TimeoutError):
+                estimator.on_timeout()
             raise AmbeoConnectionError(
                 f"Client error during HTTP request for url: {full_url}. Exception: {e}"
             ) from e
         except TimeoutError as e:
+            if estimator is not None:
+                estimator.on_timeout()
             raise AmbeoConnectionError(
                 f"Timeout error while fetching data from url: {full_url}"
             ) from e
@@ -93,18 +198,48 @@ class AmbeoApi:
                 f"Unexpected exception with url: {full_url}. Exception: {e}"
             ) from e
 
+    @staticmethod
+    def _encode_subscriptions(paths: Collection[str]) -> str:
+        """Return the URL-encoded modifyQueue subscription list for paths."""
+        return quote(
+            json.dumps([{"path": p, "type": "itemWithValue"} for p in paths]), safe=""
+        )
+
     async def create_event_queue(self, paths: list[str]) -> str | None:
         """Create an event subscription queue and return the queue ID."""
-        subscribe_json = json.dumps(
-            [{"path": p, "type": "itemWithValue"} for p in paths]
-        )
-        subscribe_encoded = quote(subscribe_json, safe="")
+        subscribe_encoded = self._encode_subscriptions(paths)
         url = f"event/modifyQueue?subscribe={subscribe_encoded}&_nocache={self.generate_nocache()}"
-        result = await self.fetch_data(url, encoded=True)
+        result = await self.fetch_data(url, encoded=True, session=self.event_session)
         if isinstance(result, str):
             return result
         return None
 
+    async def modify_event_queue(
+        self,
+        queue_id: str,
+        subscribe: Collection[str] = (),
+        unsubscribe: Collection[str] = (),
+    ) -> bool:
+        """Add and remove paths on an existing event queue.
+
+        Returns False if the device rejected the change, e.g. because the
+        queue expired; the caller should recreate the queue in that case.
+        """
+        url = f"event/modifyQueue?queueId={quote(queue_id, safe='')}"
+        if subscribe:
+            url += f"&subscribe={self._encode_subscriptions(subscribe)}"
+        if unsubscribe:
+            url += f"&unsubscribe={self._encode_subscriptions(unsubscribe)}"
+        url += f"&_nocache={self.generate_nocache()}"
+        try:
+            result = await self.fetch_data(
+                url, encoded=True, session=self.event_session
+            )
+        except AmbeoConnectionError as e:
+            _LOGGER.debug("Failed to modify event queue %s: %s", queue_id, e)
+            return False
+        return result is not None
+
     async def poll_event_queue(
         self, queue_id: str, timeout_ms: int = 30000
     ) -> list | None:
@@ -117,7 +252,12 @@ class AmbeoApi:
         http_timeout = timeout_ms // 1000 + 10
         url = f"event/pollQueue?queueId={queue_id_encoded}&timeout={timeout_ms}&_nocache={self.generate_nocache()}"
         try:
-            result = await self.fetch_data(url, http_timeout=http_timeout, encoded=True)
+            result = await self.fetch_data(
+                url,
+                http_timeout=http_timeout,
+                encoded=True,
+                session=self.event_session,
+            )
         except AmbeoConnectionError as e:
             # HTTP timeout = poll simply expired, queue is still valid on the device.
             if isinstance(e.__cause__, TimeoutError):
@@ -136,13 +276,82 @@ class AmbeoApi:
         PathSub("powermanager:target", "state", "powerTarget", sub_key="target"),
     ]
 
+    def _active_subscriptions(self) -> list[PathSub]:
+        """Return the subscriptions supported by this device."""
+        return list(self._BASE_SUBSCRIPTIONS)
+
+    def _is_wanted(self, data_key: str) -> bool:
+        """Return True if events for the data key should be subscribed to."""
+        return self._wanted_keys is None or data_key in self._wanted_keys
+
+    def _wanted_subscriptions(self) -> list[PathSub]:
+        """Return the active subscriptions for wanted data keys."""
+        return [s for s in self._active_subscriptions() if self._is_wanted(s.data_key)]
+
+    def _build_dispatch_table(self) -> dict[str, EventExtractor]:
+        """Compile the path -> extractor table for the wanted subscriptions."""
+        table: dict[str, EventExtractor] = {}
+        for sub in self._wanted_subscriptions():
+            table.setdefault(sub.path, _compile_extractor(sub))
+        return table
+
+    def set_wanted_keys(self, keys: frozenset[str] | None) -> bool:
+        """Only subscribe to events for the given data keys (None for all).
+
+        Returns True if the subscribed paths changed.
+        """
+        self._wanted_keys = keys
+        previous = self._dispatch
+        self._dispatch = self._build_dispatch_table()
+        return previous.keys() != self._dispatch.keys()
+
+    def set_live_event_paths(self, paths: Collection[str]) -> None:
+        """Set the subscribed paths whose event queue is delivering events."""
+        self._live_event_paths = frozenset(paths)
+
     def get_subscribed_paths(self) -> list[str]:
         """Return the list of paths to subscribe to for event-driven updates."""
-        return [s.path for s in self._BASE_SUBSCRIPTIONS]
+        return list(self._dispatch)
+
+    def get_subscribed_keys(self) -> set[str]:
+        """Return the coordinator data keys kept up to date by events."""
+        return {s.data_key for s in self._wanted_subscriptions()}
+
+    def partition_subscribed_paths(
+        self, data_keys: Collection[str]
+    ) -> tuple[list[str], list[str]]:
+        """Split the subscribed paths into those carrying data_keys and the rest."""
+        selected = {
+            s.path for s in self._wanted_subscriptions() if s.data_key in data_keys
+        }
+        return (
+            [path for path in self._dispatch if path in selected],
+            [path for path in self._dispatch if path not in selected],
+        )
 
     def process_event(self, path: str, item_value: dict) -> dict[str, Any]:
         """Process an event and return coordinator data key-value updates."""
-        return _extract_from_subs(self._BASE_SUBSCRIPTIONS, path, item_value)
+        extractor = self._dispatch.get(path)
+        return extractor(item_value) if extractor else {}
+
+    async def read_subscribed_paths(self, paths: list[str]) -> dict[str, Any]:
+        """Read the given subscribed paths concurrently, as event updates.
+
+        Each path is read once and its value routed through the event dispatch
+        table; paths that fail to read are left out.
+        """
+        results = await asyncio.gather(
+            *(self.execute_request("getData", path, "@all") for path in paths),
+            return_exceptions=True,
+        )
+        updates: dict[str, Any] = {}
+        for path, result in zip(paths, results, strict=True):
+            if isinstance(result, BaseException):
+                _LOGGER.debug("Failed to read %s: %s", path, result)
+                continue
+            if isinstance(result, dict) and isinstance(result.get("value"), dict):
+                updates.update(self.process_event(path, result["value"]))
+        return updates
 
     def extract_data(self, json_data: Any, key_path: list[str]) -> Any:
         """Extract data from JSON using a specified key path."""
@@ -181,7 +390,187 @@ class AmbeoApi:
         if to_idx is not None:
             url += f"&to={to_idx}"
         url += f"&_nocache={self.generate_nocache()}"
-        return await self.fetch_data(url)
+        if function not in self._COALESCED_FUNCTIONS or value is not None:
+            self.requests_issued += 1
+            # Reads sent before or during the write must not be shared with
+            # reads issued after it, so bump the generation on both ends.
+            self._write_generation += 1
+            try:
+                return await self._scheduled_fetch(
+                    url,
+                    f"{function} {path}",
+                    current_priority(RequestPriority.INTERACTIVE),
+                )
+            finally:
+                self._write_generation += 1
+
+        key = (function, path, role, from_idx, to_idx)
+        memo = self._current_memo()
+        if memo is not None and key in memo.values:
+            memo.hits += 1
+            return memo.values[key]
+        inflight_key = (*key, self._write_generation)
+        task = self._inflight.get(inflight_key)
+        if task is None:
+            self.requests_issued += 1
+            task = asyncio.get_running_loop().create_task(
+                self._scheduled_fetch(
+                    url,
+                    f"{function} {path}",
+                    current_priority(RequestPriority.BACKGROUND),
+                )
+            )
+            self._inflight[inflight_key] = task
+            task.add_done_callback(lambda t: self._request_done(inflight_key, t))
+        else:
+            self.requests_coalesced += 1
+        # Shield so one cancelled caller does not cancel the shared request.
+        result = await asyncio.shield(task)
+        if (
+            memo is not None
+            and result is not None
+            and memo.generation == self._write_generation
+        ):
+            memo.values[key] = result
+        return result
+
+    async def _scheduled_fetch(self, url: str, kind: str, priority: RequestPriority):
+        """Fetch a URL once the scheduler grants a request slot.
+
+        kind names the request, function and path, for the limiter to judge
+        its latency against earlier requests of the same kind.
+        """
+        async with self._scheduler.slot(priority):
+            start = time.monotonic()
+            try:
+                result = await self.fetch_data(url)
+            except AmbeoConnectionError:
+                if self._limiter is not None:
+                    self._limiter.on_error()
+                    self._scheduler.limit = self._limiter.limit
+                raise
+            if self._limiter is not None:
+                self._limiter.on_success(kind, time.monotonic() - start)
+                self._scheduler.limit = self._limiter.limit
+            return result
+
+    def set_request_limit(self, limit: int) -> None:
+        """Set the upper bound for concurrent device requests.
+
+        The actual limit adapts below it to the latency and errors observed.
+        """
+        if self._limiter is None:
+            self._limiter = AimdLimiter(limit)
+        else:
+            self._limiter.set_max_limit(limit)
+        self._scheduler.limit = self._limiter.limit
+
+    def get_scheduler_stats(self) -> dict[str, Any]:
+        """Return the request scheduler state and waits per priority."""
+        return {
+            **self._scheduler.as_dict(),
+            "adaptive": self._limiter.as_dict() if self._limiter else None,
+        }
+
+    def _current_memo(self) -> _RefreshMemo | None:
+        """Return this API's memo for the running refresh cycle, if any."""
+        memo = _refresh_memo.get()
+        if memo is None or memo.api is not self:
+            return None
+        if memo.generation != self._write_generation:
+            memo.values.clear()
+            memo.generation = self._write_generation
+        return memo
+
+    @contextlib.contextmanager
+    def refresh_cycle(self) -> Iterator[None]:
+        """Share read results between the getters called within the block.
+
+        Each getData/getRows request is sent at most once per cycle; a write
+        made meanwhile discards the results read before it.
+        """
+        memo = _RefreshMemo(self)
+        token = _refresh_memo.set(memo)
+        try:
+            yield
+        finally:
+            _refresh_memo.reset(token)
+            self.memo_hits += memo.hits
+            self.last_cycle_memo_hits = memo.hits
+
+    def _data_key_paths(self) -> dict[str, str]:
+        """Return the device path read for each data key, where known."""
+        return {sub.data_key: sub.path for sub in self._active_subscriptions()}
+
+    async def bulk_read(self, data_keys: Collection[str]) -> int:
+        """Read the parents of due settings into the refresh cycle's memo.
+
+        Only parents with at least _BULK_READ_MIN_PATHS of the paths behind
+        data_keys as children are read; for fewer, the getRows would not
+        replace more requests than it costs. Each row that carries its path
+        and value is stored as the getData result for that path, so getters
+        later in the cycle are answered without a request; anything missing
+        is still read individually. Returns the number of rows stored.
+        """
+        memo = self._current_memo()
+        if memo is None:
+            return 0
+        key_paths = self._data_key_paths()
+        due = {key_paths[key] for key in data_keys if key in key_paths}
+        parents = [
+            parent
+            for parent in self._BULK_READ_PARENTS
+            if sum(path.rpartition("/")[0] == parent for path in due)
+            >= self._BULK_READ_MIN_PATHS
+        ]
+        if not parents:
+            return 0
+        results = await asyncio.gather(
+            *(
+                self.execute_request(
+                    "getRows", parent, "@all", None, 0, self._BULK_READ_ROWS
+                )
+                for parent in parents
+            ),
+            return_exceptions=True,
+        )
+        if memo.generation != self._write_generation:
+            # A write landed meanwhile; the rows may predate it.
+            return 0
+        stored = 0
+        for parent, result in zip(parents, results, strict=True):
+            if isinstance(result, BaseException) or not isinstance(result, dict):
+                _LOGGER.debug("Bulk read of %s failed: %s", parent, result)
+                continue
+            for row in result.get("rows") or []:
+                path = row.get("path") if isinstance(row, dict) else None
+                key = ("getData", path, "@all", None, None)
+                if path and "value" in row and key not in memo.values:
+                    memo.values[key] = row
+                    stored += 1
+        self.bulk_rows += stored
+        return stored
+
+    def _request_done(self, key: tuple, task: asyncio.Task) -> None:
+        """Forget a finished shared request and mark its error as retrieved."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()
+
+    def get_timing_stats(self) -> dict[str, dict]:
+        """Return the round-trip time estimates per operation class."""
+        return {function: rtt.as_dict() for function, rtt in self._rtt.items()}
+
+    def get_request_stats(self) -> dict[str, int]:
+        """Return counters describing the HTTP requests made by this API."""
+        return {
+            "issued": self.requests_issued,
+            "coalesced": self.requests_coalesced,
+            "memo_hits": self.memo_hits,
+            "last_cycle_memo_hits": self.last_cycle_memo_hits,
+            "bulk_rows": self.bulk_rows,
+        }
 
     async def get_value(self, path: str, data_type: str, role: str = "@all"):
         """Get a value of a specified type from a specified path."""
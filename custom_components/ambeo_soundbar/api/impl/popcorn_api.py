@@ -1,10 +1,9 @@
 """API implementation for Ambeo Soundbar Plus and Mini (Popcorn)."""
 
 import json
-from typing import Any
 
 from ..const import AMBEO_POPCORN_VOLUME_STEP, Capability, PathSub
-from .generic_api import AmbeoApi, _extract_from_subs
+from .generic_api import AmbeoApi
 
 
 class AmbeoPopcornApi(AmbeoApi):
@@ -86,6 +85,11 @@ class AmbeoPopcornApi(AmbeoApi):
         ),
     ]
 
+    # Parents of the polled settings. ui:/settings/subwoofer is left out: it
+    # holds just the subwoofer status and volume, so a getRows of it would
+    # save one request at most.
+    _BULK_READ_PARENTS = ("settings:/popcorn/audio", "ui:/settings/interface")
+
     additional_inputs = [
         {"id": "airplay", "title": "AirPlay"},
         {"id": "googlecast", "title": "Google Cast"},
@@ -200,8 +204,8 @@ class AmbeoPopcornApi(AmbeoApi):
             rows = self.extract_data(data, ["rows"])
             if rows is None:
                 return None
-            rows.extend(self.additional_inputs)
-            return rows
+            # Build a new list: the response may be shared with other callers.
+            return [*rows, *self.additional_inputs]
         return None
 
     async def set_source(self, source_id):
@@ -324,18 +328,12 @@ class AmbeoPopcornApi(AmbeoApi):
         """Get the eco mode state."""
         return await self.get_value("uipopcorn:ecoModeState", "bool_")
 
-    def get_subscribed_paths(self) -> list[str]:
-        """Return paths to subscribe to, filtered by device capabilities."""
-        paths = super().get_subscribed_paths()
-        paths.extend(
-            s.path
+    def _active_subscriptions(self) -> list[PathSub]:
+        """Return subscriptions filtered by device capabilities."""
+        subs = super()._active_subscriptions()
+        subs.extend(
+            s
             for s in self._SUBSCRIPTIONS
             if s.capability is None or self.has_capability(s.capability)
         )
-        return paths
-
-    def process_event(self, path: str, item_value: dict) -> dict[str, Any]:
-        """Map an event path + itemValue to coordinator data updates."""
-        return super().process_event(path, item_value) or _extract_from_subs(
-            self._SUBSCRIPTIONS, path, item_value
-        )
+        return subs
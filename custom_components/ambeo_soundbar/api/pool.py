@@ -0,0 +1,96 @@
+"""Per-device HTTP connection pool for the Ambeo Soundbar API."""
+
+import logging
+from dataclasses import asdict, dataclass
+
+import aiohttp
+from aiohttp_asyncmdnsresolver.api import AsyncDualMDNSResolver
+from homeassistant.components import zeroconf
+from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class _ConnectionStats:
+    """Connection counters collected through aiohttp tracing."""
+
+    created: int = 0
+    reused: int = 0
+
+
+class AmbeoConnectionPool:
+    """Own the keep-alive HTTP connections to a single soundbar.
+
+    Short getData/setData calls and event queue requests go through separate
+    connectors, so event polling can never occupy the connections used by
+    control requests. Both resolve names like Home Assistant's own sessions
+    do, so .local hosts work.
+    """
+
+    # The device web server handles only a few requests at once.
+    CONTROL_CONNECTIONS_DEFAULT = 3
+    # One long poll plus room for modifyQueue requests.
+    EVENT_CONNECTIONS_DEFAULT = 2
+    KEEPALIVE_TIMEOUT = 60
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        control_connections: int = CONTROL_CONNECTIONS_DEFAULT,
+        event_connections: int = EVENT_CONNECTIONS_DEFAULT,
+    ) -> None:
+        """Create the control and event sessions."""
+        self._hass = hass
+        self._stats = {"control": _ConnectionStats(), "events": _ConnectionStats()}
+        self.session = self._create_session(control_connections, "control")
+        self.event_session = self._create_session(event_connections, "events")
+
+    def _create_session(self, limit: int, name: str) -> aiohttp.ClientSession:
+        """Create a session with a dedicated, size-limited keep-alive connector."""
+        stats = self._stats[name]
+
+        async def on_create(session, context, params) -> None:
+            stats.created += 1
+
+        async def on_reuse(session, context, params) -> None:
+            stats.reused += 1
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_end.append(on_create)
+        trace_config.on_connection_reuseconn.append(on_reuse)
+        connector = aiohttp.TCPConnector(
+            limit=max(1, limit),
+            keepalive_timeout=self.KEEPALIVE_TIMEOUT,
+            # aiohttp's default resolver cannot resolve mDNS names.
+            resolver=AsyncDualMDNSResolver(
+                async_zeroconf=zeroconf.async_get_async_zeroconf(self._hass)
+            ),
+        )
+        return aiohttp.ClientSession(connector=connector, trace_configs=[trace_config])
+
+    def get_stats(self) -> dict[str, dict[str, int]]:
+        """Return open, idle and reuse counters for each connector."""
+        stats = {}
+        for name, session in (
+            ("control", self.session),
+            ("events", self.event_session),
+        ):
+            connector = session.connector
+            # aiohttp has no public API for these counts.
+            conns = getattr(connector, "_conns", {})
+            idle = sum(len(host_conns) for host_conns in conns.values())
+            in_use = len(getattr(connector, "_acquired", ()))
+            stats[name] = {
+                "limit": getattr(connector, "limit", 0),
+                "open": idle + in_use,
+                "idle": idle,
+                **asdict(self._stats[name]),
+            }
+        return stats
+
+    async def async_close(self) -> None:
+        """Close both sessions and their connections."""
+        _LOGGER.debug("Closing connection pool")
+        await self.session.close()
+        await self.event_session.close()
@@ -0,0 +1,269 @@
+"""Prioritized request scheduling for the Ambeo Soundbar API."""
+
+import asyncio
+import contextlib
+import heapq
+import itertools
+import math
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Any
+
+from .timing import RttEstimator
+
+
+class RequestPriority(IntEnum):
+    """Request classes, most urgent first."""
+
+    INTERACTIVE = 0
+    RESYNC = 1
+    BACKGROUND = 2
+
+
+# Priority requested by the current task; None picks it from the request kind.
+_request_priority: ContextVar[RequestPriority | None] = ContextVar(
+    "ambeo_request_priority", default=None
+)
+
+
+@contextlib.contextmanager
+def request_priority(priority: RequestPriority) -> Iterator[None]:
+    """Send the requests made within the block with the given priority."""
+    token = _request_priority.set(priority)
+    try:
+        yield
+    finally:
+        _request_priority.reset(token)
+
+
+def current_priority(default: RequestPriority) -> RequestPriority:
+    """Return the priority requested by the current task, or default."""
+    priority = _request_priority.get()
+    return default if priority is None else priority
+
+
+@dataclass
+class _PriorityStats:
+    """Queueing statistics for one priority class."""
+
+    requests: int = 0
+    queued: int = 0
+    wait_total: float = 0.0
+    wait_max: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics for diagnostics, waits in milliseconds."""
+        return {
+            "requests": self.requests,
+            "queued": self.queued,
+            "wait_mean_ms": (
+                round(self.wait_total / self.queued * 1000, 1) if self.queued else None
+            ),
+            "wait_max_ms": round(self.wait_max * 1000, 1),
+        }
+
+
+class RequestScheduler:
+    """Limit concurrent requests to a device and serve waiters by priority.
+
+    Requests start immediately while fewer than `limit` are running, or
+    always while there is no limit. Beyond that they wait, and each freed slot
+    goes to the most urgent waiter, in arrival order within a priority class.
+    """
+
+    def __init__(self, limit: int | None = None) -> None:
+        """Initialize the scheduler with the given concurrency cap."""
+        self._limit = limit if limit is None else max(1, limit)
+        self._active = 0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self._stats = {priority: _PriorityStats() for priority in RequestPriority}
+
+    @property
+    def limit(self) -> int | None:
+        """Return the maximum number of concurrent requests, None for no cap."""
+        return self._limit
+
+    @limit.setter
+    def limit(self, limit: int | None) -> None:
+        """Change the concurrency cap, starting waiters if it grew."""
+        self._limit = limit if limit is None else max(1, limit)
+        self._wake()
+
+    def _has_free_slot(self) -> bool:
+        """Return True if another request may start now."""
+        return self._limit is None or self._active < self._limit
+
+    @property
+    def active(self) -> int:
+        """Return the number of running requests."""
+        return self._active
+
+    async def acquire(self, priority: RequestPriority) -> None:
+        """Wait for a request slot."""
+        stats = self._stats[priority]
+        stats.requests += 1
+        if self._has_free_slot() and not self._waiters:
+            self._active += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        entry = (priority, next(self._sequence), waiter)
+        heapq.heappush(self._waiters, entry)
+        start = time.monotonic()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just before the cancellation.
+                self.release()
+            else:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+            raise
+        wait = time.monotonic() - start
+        stats.queued += 1
+        stats.wait_total += wait
+        stats.wait_max = max(stats.wait_max, wait)
+
+    def release(self) -> None:
+        """Free a request slot for the next waiter."""
+        self._active -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        """Hand free slots to the most urgent waiters."""
+        while self._waiters and self._has_free_slot():
+            _, _, waiter = heapq.heappop(self._waiters)
+            self._active += 1
+            waiter.set_result(None)
+
+    @contextlib.asynccontextmanager
+    async def slot(self, priority: RequestPriority):
+        """Hold a request slot for the duration of the block."""
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the scheduler state for diagnostics."""
+        return {
+            "limit": self._limit,
+            "active": self._active,
+            "waiting": len(self._waiters),
+            **{
+                priority.name.lower(): stats.as_dict()
+                for priority, stats in self._stats.items()
+            },
+        }
+
+
+class AimdLimiter:
+    """Adapt a concurrency limit to the device with AIMD.
+
+    The limit grows by one after a full window of healthy requests, one per
+    request slot, and halves on an error or a sustained slowdown: at least
+    SLOW_STREAK requests in a row slower than the smoothed latency of their
+    kind plus RttEstimator.K times its variance. Kinds are kept apart, so
+    a large player-data read is never judged against a single flag, and
+    slow samples only update the estimates once the streak ends, so they
+    cannot hide the slowdown they are part of. After a decrease, the
+    requests already in flight cannot cause another one. The limit never
+    exceeds the configured upper bound.
+    """
+
+    DECREASE_FACTOR = 0.5
+    # Samples of a kind needed before its latency is judged.
+    MIN_SAMPLES = 5
+    # Consecutive slow requests that count as a slowdown.
+    SLOW_STREAK = 3
+    HISTORY_SIZE = 20
+
+    def __init__(self, max_limit: int) -> None:
+        """Initialize the limiter at its upper bound."""
+        self.max_limit = max(1, max_limit)
+        self.limit = self.max_limit
+        # Smoothed latency per request kind; only srtt and rttvar are used.
+        self._latencies: dict[str, RttEstimator] = {}
+        # Slow samples of the current streak, not yet observed.
+        self._slow: list[tuple[RttEstimator, float]] = []
+        self._successes = 0
+        # Requests to complete before another decrease is allowed.
+        self._cooldown = 0
+        self.history: deque[dict[str, Any]] = deque(maxlen=self.HISTORY_SIZE)
+
+    def set_max_limit(self, max_limit: int) -> None:
+        """Change the upper bound, lowering the limit if needed."""
+        self.max_limit = max(1, max_limit)
+        if self.limit > self.max_limit:
+            self._adjust(self.max_limit, "bound")
+
+    def on_success(self, kind: str, latency: float) -> None:
+        """Record a completed request of the given kind, in seconds."""
+        estimator = self._latencies.get(kind)
+        if estimator is None:
+            estimator = self._latencies[kind] = RttEstimator(0.0, math.inf)
+        if (
+            estimator.samples >= self.MIN_SAMPLES
+            and latency > estimator.srtt + RttEstimator.K * estimator.rttvar
+        ):
+            self._slow.append((estimator, latency))
+            if len(self._slow) >= self.SLOW_STREAK:
+                self._observe_slow()
+                self._decrease("latency")
+            return
+        self._observe_slow()
+        estimator.observe(latency)
+        self._cooldown = max(0, self._cooldown - 1)
+        self._successes += 1
+        if self._successes >= self.limit and self.limit < self.max_limit:
+            self._adjust(self.limit + 1, "increase")
+
+    def _observe_slow(self) -> None:
+        """Feed the held back slow samples into their estimates."""
+        for estimator, latency in self._slow:
+            estimator.observe(latency)
+        self._slow.clear()
+
+    def on_error(self) -> None:
+        """Record a request that failed to reach the device."""
+        self._decrease("error")
+
+    def _decrease(self, reason: str) -> None:
+        """Cut the limit unless a decrease is still taking effect."""
+        if self._cooldown:
+            self._cooldown -= 1
+            return
+        self._adjust(max(1, int(self.limit * self.DECREASE_FACTOR)), reason)
+        self._cooldown = self.limit
+
+    def _adjust(self, limit: int, reason: str) -> None:
+        """Set a new limit and record why."""
+        self._successes = 0
+        if limit == self.limit:
+            return
+        self.limit = limit
+        self.history.append(
+            {"at": round(time.time(), 3), "limit": limit, "reason": reason}
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the limiter state for diagnostics."""
+        return {
+            "max_limit": self.max_limit,
+            "limit": self.limit,
+            "latency_ms": {
+                kind: {
+                    "srtt": round(estimator.srtt * 1000, 1),
+                    "rttvar": round(estimator.rttvar * 1000, 1),
+                }
+                for kind, estimator in self._latencies.items()
+                if estimator.srtt is not None
+            },
+            "history": list(self.history),
+        }
@@ -0,0 +1,60 @@
+"""Round-trip time tracking for the Ambeo Soundbar API."""
+
+
+class RttEstimator:
+    """Derive a request timeout from measured round-trip times.
+
+    Uses the smoothed RTT and RTT variance estimators from RFC 6298: the
+    timeout is SRTT + 4 * RTTVAR, clamped between a floor and a ceiling, and
+    doubled after each timeout until a new sample arrives.
+    """
+
+    ALPHA = 1 / 8
+    BETA = 1 / 4
+    K = 4
+
+    def __init__(self, floor: float, ceiling: float) -> None:
+        """Initialize the estimator; the ceiling is used until samples exist."""
+        self.floor = floor
+        self.ceiling = ceiling
+        self.srtt: float | None = None
+        self.rttvar = 0.0
+        self.samples = 0
+        self.timeouts = 0
+        self._backoff = 1
+
+    def observe(self, rtt: float) -> None:
+        """Record the round-trip time of a completed request, in seconds."""
+        if self.srtt is None:
+            self.srtt = rtt
+            self.rttvar = rtt / 2
+        else:
+            self.rttvar = (1 - self.BETA) * self.rttvar + self.BETA * abs(
+                self.srtt - rtt
+            )
+            self.srtt = (1 - self.ALPHA) * self.srtt + self.ALPHA * rtt
+        self.samples += 1
+        self._backoff = 1
+
+    def on_timeout(self) -> None:
+        """Back off after a request timed out."""
+        self.timeouts += 1
+        self._backoff *= 2
+
+    @property
+    def timeout(self) -> float:
+        """Return the timeout to use for the next request, in seconds."""
+        if self.srtt is None:
+            return self.ceiling
+        rto = (self.srtt + self.K * self.rttvar) * self._backoff
+        return min(max(rto, self.floor), self.ceiling)
+
+    def as_dict(self) -> dict[str, float | int | None]:
+        """Return the estimator state for diagnostics, in milliseconds."""
+        return {
+            "srtt_ms": round(self.srtt * 1000, 1) if self.srtt is not None else None,
+            "rttvar_ms": round(self.rttvar * 1000, 1),
+            "timeout_ms": round(self.timeout * 1000),
+            "samples": self.samples,
+            "timeouts": self.timeouts,
+        }
@@ -6,15 +6,17 @@ import aiohttp
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_create_clientsession
 
 from .api.exceptions import AmbeoConnectionError
 from .api.factory import AmbeoAPIFactory
+from .api.pool import AmbeoConnectionPool
 from .const import (
     CONFIG_CONCURRENT_REQUESTS,
     CONFIG_CONCURRENT_REQUESTS_DEFAULT,
     CONFIG_HOST,
     CONFIG_HOST_DEFAULT,
+    CONFIG_SPLIT_PLAYBACK_EVENTS,
+    CONFIG_SPLIT_PLAYBACK_EVENTS_DEFAULT,
     CONFIG_UPDATE_INTERVAL,
     CONFIG_UPDATE_INTERVAL_DEFAULT,
     DEFAULT_PORT,
@@ -29,17 +31,15 @@ async def validate_connection(
     hass: HomeAssistant, host: str, port: int = DEFAULT_PORT
 ) -> tuple[str | None, str | None, str | None]:
     """Validate connection to Ambeo device and return name if successful."""
-    client_session = async_create_clientsession(hass)
+    pool = AmbeoConnectionPool(hass)
     try:
-        ambeo_api = await AmbeoAPIFactory.create_api(
-            host, port, TIMEOUT, client_session
-        )
-        name = await ambeo_api.get_name()
-        serial = await ambeo_api.get_serial()
-        return name, serial, None
+        _, identity = await AmbeoAPIFactory.bootstrap(host, port, TIMEOUT, pool.session)
+        return identity.name, identity.serial, None
     except (AmbeoConnectionError, aiohttp.ClientError) as error:
         _LOGGER.error("Connection error to %s: %s", host, error)
         return None, None, "cannot_connect"
+    finally:
+        await pool.async_close()
 
 
 class AmbeoOptionsFlowHandler(config_entries.OptionsFlow):
@@ -78,6 +78,12 @@ class AmbeoOptionsFlowHandler(config_entries.OptionsFlow):
                     CONFIG_CONCURRENT_REQUESTS, CONFIG_CONCURRENT_REQUESTS_DEFAULT
                 ),
             ): int,
+            vol.Optional(
+                CONFIG_SPLIT_PLAYBACK_EVENTS,
+                default=self.config_entry.options.get(
+                    CONFIG_SPLIT_PLAYBACK_EVENTS, CONFIG_SPLIT_PLAYBACK_EVENTS_DEFAULT
+                ),
+            ): bool,
         }
 
         return self.async_show_form(
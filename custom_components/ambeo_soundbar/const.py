@@ -22,3 +22,5 @@ CONFIG_UPDATE_INTERVAL = "update_interval"
 CONFIG_UPDATE_INTERVAL_DEFAULT = 30
 CONFIG_CONCURRENT_REQUESTS = "concurrent_requests"
 CONFIG_CONCURRENT_REQUESTS_DEFAULT = 3
+CONFIG_SPLIT_PLAYBACK_EVENTS = "split_playback_events"
+CONFIG_SPLIT_PLAYBACK_EVENTS_DEFAULT = False
@@ -3,6 +3,10 @@
 import asyncio
 import contextlib
 import logging
+import random
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from datetime import timedelta
 from typing import Any, NamedTuple
 
@@ -13,24 +17,291 @@ from homeassistant.const import (
     STATE_PLAYING,
     STATE_STANDBY,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
 
 from .api.const import Capability
 from .api.impl.generic_api import AmbeoApi
+from .api.scheduler import RequestPriority, request_priority
 from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
 
+class RefreshTier:
+    """How often polling refreshes a feature."""
+
+    HOT = "hot"  # Playback state, on every update.
+    WARM = "warm"  # Sound settings, every few updates.
+    COLD = "cold"  # Rarely changed settings, on full refreshes only.
+
+
 class FeatureDef(NamedTuple):
-    """Definition of an optional feature fetched during coordinator update."""
+    """Definition of a feature fetched during coordinator update."""
 
     data_key: str
     api_method: str
     label: str
     capability: str | None = None
+    tier: str = RefreshTier.WARM
+
+
+# Cheap request sent first to detect an unreachable device.
+LIVENESS_PROBE = FeatureDef("state", "get_state", "State", tier=RefreshTier.HOT)
+
+# Core media player data; a failure here fails the whole refresh.
+CORE_FEATURES: tuple[FeatureDef, ...] = (
+    FeatureDef("volume", "get_volume", "Volume", tier=RefreshTier.HOT),
+    FeatureDef("muted", "is_mute", "Mute", tier=RefreshTier.HOT),
+    LIVENESS_PROBE,
+    FeatureDef(
+        "current_source", "get_current_source", "Current source", tier=RefreshTier.HOT
+    ),
+    FeatureDef(
+        "current_preset", "get_current_preset", "Current preset", tier=RefreshTier.HOT
+    ),
+    FeatureDef("player_data", "player_data", "Player data", tier=RefreshTier.HOT),
+)
+
+# Optional features fetched in parallel, filtered by capability.
+OPTIONAL_FEATURES: tuple[FeatureDef, ...] = (
+    FeatureDef("play_time", "get_play_time", "Play time", tier=RefreshTier.HOT),
+    FeatureDef(
+        "led_bar_brightness",
+        "get_led_bar_brightness",
+        "LED bar",
+        Capability.LED_BAR,
+        tier=RefreshTier.COLD,
+    ),
+    FeatureDef(
+        "codec_led_brightness",
+        "get_codec_led_brightness",
+        "Codec LED",
+        Capability.CODEC_LED,
+        tier=RefreshTier.COLD,
+    ),
+    FeatureDef(
+        "logo_brightness",
+        "get_logo_brightness",
+        "Logo brightness",
+        Capability.AMBEO_LOGO,
+        tier=RefreshTier.COLD,
+    ),
+    FeatureDef(
+        "logo_state",
+        "get_logo_state",
+        "Logo state",
+        Capability.AMBEO_LOGO,
+        tier=RefreshTier.COLD,
+    ),
+    FeatureDef(
+        "display_brightness",
+        "get_display_brightness",
+        "Display",
+        Capability.MAX_DISPLAY,
+        tier=RefreshTier.COLD,
+    ),
+    FeatureDef("night_mode", "get_night_mode", "Night mode"),
+    FeatureDef("ambeo_mode", "get_ambeo_mode", "Ambeo mode"),
+    FeatureDef(
+        "sound_feedback", "get_sound_feedback", "Sound feedback", tier=RefreshTier.COLD
+    ),
+    FeatureDef(
+        "voice_enhancement",
+        "get_voice_enhancement",
+        "Voice enhancement",
+        Capability.VOICE_ENHANCEMENT_TOGGLE,
+    ),
+    FeatureDef(
+        "bluetooth_pairing",
+        "get_bluetooth_pairing_state",
+        "Bluetooth pairing",
+        Capability.BLUETOOTH_PAIRING,
+    ),
+    FeatureDef(
+        "subwoofer_status",
+        "get_subwoofer_status",
+        "Subwoofer status",
+        Capability.SUBWOOFER,
+    ),
+    FeatureDef(
+        "subwoofer_volume",
+        "get_subwoofer_volume",
+        "Subwoofer volume",
+        Capability.SUBWOOFER,
+    ),
+    FeatureDef(
+        "voice_enhancement_level",
+        "get_voice_enhancement_level",
+        "Voice enhancement level",
+        Capability.VOICE_ENHANCEMENT_LEVEL,
+    ),
+    FeatureDef(
+        "center_speaker_level",
+        "get_center_speaker_level",
+        "Center speaker level",
+        Capability.CENTER_SPEAKER_LEVEL,
+    ),
+    FeatureDef(
+        "side_firing_level",
+        "get_side_firing_level",
+        "Side firing level",
+        Capability.SIDE_FIRING_LEVEL,
+    ),
+    FeatureDef(
+        "up_firing_level",
+        "get_up_firing_level",
+        "Up firing level",
+        Capability.UP_FIRING_LEVEL,
+    ),
+    FeatureDef(
+        "center_volume",
+        "get_center_volume",
+        "Center volume",
+        Capability.CENTER_VOLUME,
+    ),
+    FeatureDef(
+        "eco_mode",
+        "get_eco_mode",
+        "Eco mode",
+        Capability.ECO_MODE,
+        tier=RefreshTier.COLD,
+    ),
+    FeatureDef(
+        "decoder_status",
+        "get_decoder_status",
+        "Decoder status",
+        Capability.DECODER_STATUS,
+        tier=RefreshTier.HOT,
+    ),
+    FeatureDef(
+        "ambeo_mode_level",
+        "get_ambeo_mode_level",
+        "Ambeo mode level",
+        Capability.AMBEO_MODE_LEVEL,
+    ),
+)
+
+
+class PlannedFetch(NamedTuple):
+    """A feature with its API getter bound to one device."""
+
+    feature: FeatureDef
+    fetch: Callable[[], Awaitable[Any]]
+
+
+class RefreshPlan(NamedTuple):
+    """Features a device supports, with their getters resolved in advance."""
+
+    capabilities: frozenset[str]
+    probe: PlannedFetch
+    core: tuple[PlannedFetch, ...]
+    optional: tuple[PlannedFetch, ...]
+
+
+def compile_refresh_plan(
+    api: AmbeoApi, used_keys: frozenset[str] | None = None
+) -> RefreshPlan:
+    """Build the refresh plan for the capabilities of the given API.
+
+    When used_keys is given, features for other data keys are left out; the
+    liveness probe is always kept.
+    """
+    capabilities = frozenset(api.capabilities)
+
+    def bind(feature: FeatureDef) -> PlannedFetch:
+        return PlannedFetch(feature, getattr(api, feature.api_method))
+
+    def used(feature: FeatureDef) -> bool:
+        return used_keys is None or feature.data_key in used_keys
+
+    return RefreshPlan(
+        capabilities=capabilities,
+        probe=bind(LIVENESS_PROBE),
+        core=tuple(
+            bind(f) for f in CORE_FEATURES if f is not LIVENESS_PROBE and used(f)
+        ),
+        optional=tuple(
+            bind(f)
+            for f in OPTIONAL_FEATURES
+            if (f.capability is None or f.capability in capabilities) and used(f)
+        ),
+    )
+
+
+# High-frequency playback keys, polled on their own event queue when
+# playback events are split from control events.
+PLAYBACK_EVENT_KEYS = frozenset({"play_time", "player_data"})
+
+# Result of an optional fetch that failed or is paused.
+_UNAVAILABLE = object()
+
+
+@dataclass
+class _EventShardStats:
+    """Delivery statistics for one event queue."""
+
+    paths: int
+    batches: int = 0
+    events: int = 0
+    max_batch: int = 0
+    # Most polled batches waiting to be applied at once.
+    max_backlog: int = 0
+    # Reads of the subscribed paths after re-subscribing.
+    resyncs: int = 0
+    # Time from receiving a batch to applying it to the data.
+    deliveries: int = 0
+    delivery_total: float = 0.0
+    delivery_max: float = 0.0
+    # Time from sending a write to receiving its confirming event.
+    echoes: int = 0
+    echo_total: float = 0.0
+    echo_max: float = 0.0
+
+    def record_echo(self, latency: float) -> None:
+        """Record the event-to-state latency of one write."""
+        self.echoes += 1
+        self.echo_total += latency
+        self.echo_max = max(self.echo_max, latency)
+
+    def record_delivery(self, latency: float) -> None:
+        """Record the delivery latency of one polled batch."""
+        self.deliveries += 1
+        self.delivery_total += latency
+        self.delivery_max = max(self.delivery_max, latency)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics for diagnostics, latencies in milliseconds."""
+        return {
+            "paths": self.paths,
+            "batches": self.batches,
+            "events": self.events,
+            "max_batch": self.max_batch,
+            "max_backlog": self.max_backlog,
+            "resyncs": self.resyncs,
+            "deliveries": self.deliveries,
+            "delivery_mean_ms": (
+                round(self.delivery_total / self.deliveries * 1000, 1)
+                if self.deliveries
+                else None
+            ),
+            "delivery_max_ms": round(self.delivery_max * 1000, 1),
+            "echoes": self.echoes,
+            "echo_mean_ms": (
+                round(self.echo_total / self.echoes * 1000, 1) if self.echoes else None
+            ),
+            "echo_max_ms": round(self.echo_max * 1000, 1),
+        }
+
+
+@dataclass
+class _FeatureHealth:
+    """Failure tracking for one optional feature."""
+
+    failures: int = 0
+    paused_until: float = 0.0
+    unsupported: bool = False
 
 
 class AmbeoCoordinator(DataUpdateCoordinator):
@@ -38,7 +309,31 @@ class AmbeoCoordinator(DataUpdateCoordinator):
 
     # Event listener settings.
     POLL_TIMEOUT_MS = 30000
-    EVENT_LISTENER_RETRY_DELAY = 30  # Seconds to wait before retrying after error.
+    # Seconds between event queue retries: the first backoff step and the cap.
+    EVENT_RETRY_BASE_DELAY = 1
+    EVENT_LISTENER_RETRY_DELAY = 30
+    # Seconds between full refreshes, which also reconcile event-driven keys.
+    RECONCILE_INTERVAL = 600
+    # Minimum seconds between refreshes of each tier; cold features are only
+    # fetched by full refreshes.
+    TIER_INTERVALS = {
+        RefreshTier.HOT: 0,
+        RefreshTier.WARM: 120,
+        RefreshTier.COLD: RECONCILE_INTERVAL,
+    }
+    # Ceiling, in seconds, for the refresh interval backoff while offline.
+    MAX_BACKOFF_INTERVAL = 300
+    # Consecutive failures before an optional feature is paused, and the
+    # bounds in seconds of its exponentially growing pause.
+    FEATURE_FAILURE_THRESHOLD = 3
+    FEATURE_PAUSE_BASE = 60
+    FEATURE_PAUSE_MAX = 3600
+    # Polled event batches that may wait for processing before polling pauses.
+    EVENT_BACKLOG_SIZE = 8
+    # Seconds within which an event is taken as the echo of a write.
+    ECHO_WINDOW = 10
+    # Keys that are meaningless after a restart and never persisted.
+    VOLATILE_KEYS = frozenset({"play_time", "play_time_updated_at"})
 
     def __init__(
         self,
@@ -48,6 +343,7 @@ class AmbeoCoordinator(DataUpdateCoordinator):
         presets: list[dict],
         update_interval_seconds: int = 30,
         concurrent_requests: int = 3,
+        split_playback_events: bool = False,
     ):
         """Initialize the coordinator."""
         super().__init__(
@@ -57,278 +353,754 @@ class AmbeoCoordinator(DataUpdateCoordinator):
             update_interval=timedelta(seconds=update_interval_seconds),
         )
         self.api = api
-        self.sources = sources
-        self.presets = presets
-        self._event_listener_task: asyncio.Task | None = None
-        self._request_semaphore = asyncio.Semaphore(concurrent_requests)
-        # Lookup dicts for O(1) source/preset resolution.
-        self._source_title_by_id: dict = {
-            s["id"]: s["title"] for s in sources if "id" in s and "title" in s
-        }
-        self._source_id_by_title: dict = {
-            s["title"]: s["id"] for s in sources if "id" in s and "title" in s
-        }
-        self._preset_title_by_id: dict = {
-            p["id"]: p["title"] for p in presets if "id" in p and "title" in p
-        }
-        self._preset_id_by_title: dict = {
-            p["title"]: p["id"] for p in presets if "id" in p and "title" in p
-        }
-
-    async def _safe_fetch(self, coro, label: str):
-        """Fetch data safely with concurrency limiting, returning None on failure."""
+        self._base_update_interval = timedelta(seconds=update_interval_seconds)
+        self._consecutive_failures = 0
+        self._split_playback_events = split_playback_events
+        self._event_listener_tasks: list[asyncio.Task] = []
+        self._healthy_shards: set[str] = set()
+        self._shard_stats: dict[str, _EventShardStats] = {}
+        # Paths subscribed per event queue, and the ID of each live queue.
+        # Guarded by the lock so queue creation and modifyQueue don't race.
+        self._shard_paths: dict[str, list[str]] = {}
+        self._shard_queues: dict[str, str] = {}
+        self._subscription_lock = asyncio.Lock()
+        # Send time of the latest write per data key, to time its event.
+        self._write_started: dict[str, float] = {}
+        # Change count at the latest event or optimistic update per data key,
+        # so a refresh doesn't revert values that changed during its reads.
+        self._change_count = 0
+        self._key_changes: dict[str, int] = {}
+        self._event_listener_wanted = False
+        self._event_queue_healthy = False
+        self._last_full_refresh: float | None = None
+        self._tier_refreshed_at: dict[str, float] = {}
+        self._feature_health: dict[str, _FeatureHealth] = {}
+        # Data keys used by the registered entities; None until pruning is
+        # enabled, which means every supported key is polled.
+        self._used_keys: frozenset[str] | None = None
+        self._pruning_enabled = False
+        self._prune_scheduled = False
+        self._plan = compile_refresh_plan(api)
+        self._data_stale = False
+        # Snapshot of the data listeners were last notified with.
+        self._notified_data: dict[str, Any] | None = None
+        self._notified_success = True
+        self._notified_stale = False
+        # Latest-wins write coalescing for slider-driven setters, per data key.
+        self._writes_in_flight: set[str] = set()
+        # Queued write per data key: API method, value and optimistic value.
+        self._queued_writes: dict[str, tuple[str, Any, Any]] = {}
+        self.writes_elided = 0
+        self.api.set_request_limit(concurrent_requests)
+        self._has_subwoofer: bool | None = None
+        self.set_sources(sources)
+        self.set_presets(presets)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify only the listeners whose data keys changed.
+
+        Listeners register the data keys they depend on as their context (see
+        AmbeoBaseEntity). Listeners without a context, and all listeners after
+        an availability or staleness change, are always notified.
+        """
+        data = self.data or {}
+        previous = self._notified_data
+        changed: set[str] | None = None
+        if (
+            previous is not None
+            and self.last_update_success == self._notified_success
+            and self._data_stale == self._notified_stale
+        ):
+            changed = {
+                key
+                for key in data.keys() | previous.keys()
+                if key not in data or key not in previous or data[key] != previous[key]
+            }
+            if not changed:
+                return
+        self._notified_data = dict(data)
+        self._notified_success = self.last_update_success
+        self._notified_stale = self._data_stale
+        for update_callback, context in list(self._listeners.values()):
+            if changed is None or context is None or not changed.isdisjoint(context):
+                update_callback()
+
+    async def _safe_fetch(self, planned: PlannedFetch):
+        """Fetch data safely, returning None on failure.
+
+        Failures are counted per feature: a feature that keeps failing is
+        paused with exponential backoff, and one the API does not implement
+        is never requested again.
+        """
+        feature = planned.feature
+        health = self._feature_health.setdefault(feature.data_key, _FeatureHealth())
         try:
-            async with self._request_semaphore:
-                return await coro
+            value = await planned.fetch()
+        except NotImplementedError:
+            _LOGGER.debug("%s not supported, no longer polling it", feature.label)
+            health.unsupported = True
+            return None
         except Exception as e:
-            _LOGGER.debug("%s not available: %s", label, e)
+            health.failures += 1
+            if health.failures >= self.FEATURE_FAILURE_THRESHOLD:
+                pause = min(
+                    self.FEATURE_PAUSE_BASE
+                    * 2 ** (health.failures - self.FEATURE_FAILURE_THRESHOLD),
+                    self.FEATURE_PAUSE_MAX,
+                )
+                health.paused_until = time.monotonic() + pause
+                _LOGGER.debug(
+                    "%s not available (%d failures), pausing for %ds: %s",
+                    feature.label,
+                    health.failures,
+                    pause,
+                    e,
+                )
+            else:
+                _LOGGER.debug("%s not available: %s", feature.label, e)
             return None
-
-    async def _async_update_data(self) -> dict[str, Any]:
-        """Fetch data from API."""
-        try:
-            # Core media player data (required).
-            (
-                volume,
-                muted,
-                state,
-                current_source,
-                current_preset,
-                player_data,
-            ) = await asyncio.gather(
-                self.api.get_volume(),
-                self.api.is_mute(),
-                self.api.get_state(),
-                self.api.get_current_source(),
-                self.api.get_current_preset(),
-                self.api.player_data(),
+        health.failures = 0
+        health.paused_until = 0.0
+        return value
+
+    def rebuild_refresh_plan(self) -> None:
+        """Recompile the refresh plan after the API's capabilities changed."""
+        self._plan = compile_refresh_plan(self.api, self._used_keys)
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for data updates, pruning polling to the keys in use."""
+        remove_listener = super().async_add_listener(update_callback, context)
+        self._async_schedule_prune()
+
+        @callback
+        def remove() -> None:
+            remove_listener()
+            self._async_schedule_prune()
+
+        return remove
+
+    @callback
+    def async_enable_pruning(self) -> None:
+        """Stop polling and subscribing to keys no listener uses.
+
+        Call once the platforms are set up; from then on the pruning follows
+        entities being added and removed (e.g. disabled in the registry).
+        """
+        self._pruning_enabled = True
+        self._async_prune()
+
+    @callback
+    def _async_schedule_prune(self) -> None:
+        """Prune once the current burst of listener changes is done."""
+        if self._pruning_enabled and not self._prune_scheduled:
+            self._prune_scheduled = True
+            self.hass.loop.call_soon(self._async_prune)
+
+    @callback
+    def _async_prune(self) -> None:
+        """Limit the refresh plan and subscriptions to the keys in use.
+
+        Entities register the keys they use as their listener context.
+        Listeners without a context observe every change but keep no key
+        polled; without any keyed listener nothing is pruned.
+        """
+        self._prune_scheduled = False
+        contexts = [
+            context for _, context in self._listeners.values() if context is not None
+        ]
+        used_keys = (
+            frozenset({LIVENESS_PROBE.data_key}).union(*contexts) if contexts else None
+        )
+        if used_keys == self._used_keys:
+            return
+        self._used_keys = used_keys
+        self.rebuild_refresh_plan()
+        _LOGGER.debug("Polling restricted to keys in use: %s", used_keys)
+        if self.api.set_wanted_keys(used_keys) and self._event_listener_wanted:
+            self.hass.async_create_background_task(
+                self._async_update_subscriptions(),
+                name=f"{DOMAIN}_event_subscriptions",
             )
-            data = {
-                "volume": volume,
-                "muted": muted,
-                "state": state,
-                "current_source": current_source,
-                "current_preset": current_preset,
-                "player_data": player_data,
-            }
 
-            # Optional features fetched in parallel, filtered by capability.
-            all_optional_features = [
-                FeatureDef("play_time", "get_play_time", "Play time"),
-                FeatureDef(
-                    "led_bar_brightness",
-                    "get_led_bar_brightness",
-                    "LED bar",
-                    Capability.LED_BAR,
-                ),
-                FeatureDef(
-                    "codec_led_brightness",
-                    "get_codec_led_brightness",
-                    "Codec LED",
-                    Capability.CODEC_LED,
-                ),
-                FeatureDef(
-                    "logo_brightness",
-                    "get_logo_brightness",
-                    "Logo brightness",
-                    Capability.AMBEO_LOGO,
-                ),
-                FeatureDef(
-                    "logo_state", "get_logo_state", "Logo state", Capability.AMBEO_LOGO
-                ),
-                FeatureDef(
-                    "display_brightness",
-                    "get_display_brightness",
-                    "Display",
-                    Capability.MAX_DISPLAY,
-                ),
-                FeatureDef("night_mode", "get_night_mode", "Night mode"),
-                FeatureDef("ambeo_mode", "get_ambeo_mode", "Ambeo mode"),
-                FeatureDef("sound_feedback", "get_sound_feedback", "Sound feedback"),
-                FeatureDef(
-                    "voice_enhancement",
-                    "get_voice_enhancement",
-                    "Voice enhancement",
-                    Capability.VOICE_ENHANCEMENT_TOGGLE,
-                ),
-                FeatureDef(
-                    "bluetooth_pairing",
-                    "get_bluetooth_pairing_state",
-                    "Bluetooth pairing",
-                    Capability.BLUETOOTH_PAIRING,
-                ),
-                FeatureDef(
-                    "subwoofer_status",
-                    "get_subwoofer_status",
-                    "Subwoofer status",
-                    Capability.SUBWOOFER,
-                ),
-                FeatureDef(
-                    "subwoofer_volume",
-                    "get_subwoofer_volume",
-                    "Subwoofer volume",
-                    Capability.SUBWOOFER,
-                ),
-                FeatureDef(
-                    "voice_enhancement_level",
-                    "get_voice_enhancement_level",
-                    "Voice enhancement level",
-                    Capability.VOICE_ENHANCEMENT_LEVEL,
-                ),
-                FeatureDef(
-                    "center_speaker_level",
-                    "get_center_speaker_level",
-                    "Center speaker level",
-                    Capability.CENTER_SPEAKER_LEVEL,
-                ),
-                FeatureDef(
-                    "side_firing_level",
-                    "get_side_firing_level",
-                    "Side firing level",
-                    Capability.SIDE_FIRING_LEVEL,
-                ),
-                FeatureDef(
-                    "up_firing_level",
-                    "get_up_firing_level",
-                    "Up firing level",
-                    Capability.UP_FIRING_LEVEL,
-                ),
-                FeatureDef(
-                    "center_volume",
-                    "get_center_volume",
-                    "Center volume",
-                    Capability.CENTER_VOLUME,
-                ),
-                FeatureDef("eco_mode", "get_eco_mode", "Eco mode", Capability.ECO_MODE),
-                FeatureDef(
-                    "decoder_status",
-                    "get_decoder_status",
-                    "Decoder status",
-                    Capability.DECODER_STATUS,
-                ),
-                FeatureDef(
-                    "ambeo_mode_level",
-                    "get_ambeo_mode_level",
-                    "Ambeo mode level",
-                    Capability.AMBEO_MODE_LEVEL,
-                ),
-            ]
-
-            optional_features = [
-                f
-                for f in all_optional_features
-                if f.capability is None or self.api.has_capability(f.capability)
-            ]
-
-            results = await asyncio.gather(
-                *(
-                    self._safe_fetch(getattr(self.api, f.api_method)(), f.label)
-                    for f in optional_features
-                )
-            )
+    def get_pruned_keys(self) -> list[str]:
+        """Return the supported data keys that are not polled as nobody uses them."""
+        if self._used_keys is None:
+            return []
+        supported = compile_refresh_plan(self.api)
+        return sorted(
+            p.feature.data_key
+            for p in (*supported.core, *supported.optional)
+            if p.feature.data_key not in self._used_keys
+        )
 
-            for feature, value in zip(optional_features, results, strict=True):
-                if value is not None:
-                    data[feature.data_key] = value
+    def _is_feature_active(self, feature: FeatureDef, now: float) -> bool:
+        """Return False for unsupported features and paused failing ones."""
+        health = self._feature_health.get(feature.data_key)
+        return health is None or (not health.unsupported and now >= health.paused_until)
+
+    def get_feature_health(self) -> dict[str, dict[str, Any]]:
+        """Return the failing and unsupported features for diagnostics."""
+        now = time.monotonic()
+        return {
+            key: {
+                "failures": health.failures,
+                "paused_for": max(0, round(health.paused_until - now)),
+                "unsupported": health.unsupported,
+            }
+            for key, health in self._feature_health.items()
+            if health.failures or health.unsupported
+        }
 
-            if "play_time" in data:
-                data["play_time_updated_at"] = dt_util.utcnow()
+    def _is_full_refresh_due(self) -> bool:
+        """Return True when every feature must be fetched."""
+        if self.data is None or self._last_full_refresh is None:
+            return True
+        elapsed = time.monotonic() - self._last_full_refresh
+        return elapsed >= self.RECONCILE_INTERVAL
+
+    def _due_tiers(self, now: float) -> set[str]:
+        """Return the refresh tiers whose interval has elapsed."""
+        return {
+            tier
+            for tier, interval in self.TIER_INTERVALS.items()
+            if tier not in self._tier_refreshed_at
+            or now - self._tier_refreshed_at[tier] >= interval
+        }
+
+    def _select_fetches(
+        self, tiers: set[str], skipped: set[str], now: float
+    ) -> tuple[list[PlannedFetch], list[PlannedFetch]]:
+        """Return the core and optional fetches this refresh has to make."""
+        core = [
+            p
+            for p in self._plan.core
+            if p.feature.tier in tiers and p.feature.data_key not in skipped
+        ]
+        optional = [
+            p
+            for p in self._plan.optional
+            if p.feature.tier in tiers
+            and p.feature.data_key not in skipped
+            and self._is_feature_active(p.feature, now)
+        ]
+        return core, optional
 
-            _LOGGER.debug("Data updated successfully: %s", data)
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch data from API, reading each device node at most once."""
+        with self.api.refresh_cycle():
+            return await self._async_fetch_data()
+
+    async def _async_fetch_data(self) -> dict[str, Any]:
+        """Fetch the due data for one refresh cycle.
+
+        Each refresh only fetches the tiers that are due and keeps previous
+        values for the others; a periodic full refresh fetches everything.
+        While the event queue is healthy, keys kept up to date by events are
+        skipped outside of full refreshes.
+
+        The fetched values are merged into the data as it stands once the
+        reads are done, so events and optimistic writes that landed while
+        they were in flight are kept rather than reverted.
+        """
+        now = time.monotonic()
+        full = self._is_full_refresh_due()
+        tiers = set(self.TIER_INTERVALS) if full else self._due_tiers(now)
+        event_first = not full and self._event_queue_healthy
+        skipped = self.api.get_subscribed_keys() if event_first else set()
+        # Fetched value per data key, with the change count its read started at.
+        fetched: dict[str, tuple[Any, int]] = {}
+        probe = self._plan.probe
+        if probe.feature.data_key not in skipped:
+            # Probe with a single request before fanning out, so an
+            # unreachable device costs one timeout instead of ~26.
+            started = self._change_count
+            try:
+                fetched[probe.feature.data_key] = (await probe.fetch(), started)
+            except Exception as err:
+                self._async_backoff()
+                raise UpdateFailed(f"Device unreachable: {err}") from err
+        try:
+            core, optional = self._select_fetches(tiers, skipped, now)
+            started = self._change_count
+            # Prime the cycle's memo with getRows of the parent nodes holding
+            # several due settings; their getters below then skip the request.
+            await self.api.bulk_read([p.feature.data_key for p in (*core, *optional)])
+            core_results = await asyncio.gather(*(p.fetch() for p in core))
+            for planned, value in zip(core, core_results, strict=True):
+                fetched[planned.feature.data_key] = (value, started)
+
+            results = await asyncio.gather(*(self._safe_fetch(p) for p in optional))
+            for planned, value in zip(optional, results, strict=True):
+                # A failed optional fetch drops the key until it recovers.
+                value = _UNAVAILABLE if value is None else value
+                fetched[planned.feature.data_key] = (value, started)
+
+            data = self._merge_fetched(fetched, full)
+
+            for tier in tiers:
+                self._tier_refreshed_at[tier] = now
+            if full:
+                self._last_full_refresh = now
+                self._data_stale = False
+            self._async_reset_backoff()
+
+            _LOGGER.debug(
+                "Data updated (%d requests, tiers: %s, event-first: %s): %s",
+                len(core) + len(optional),
+                sorted(tiers),
+                event_first,
+                data,
+            )
             return data
 
         except Exception as err:
+            self._async_backoff()
             raise UpdateFailed(f"Error communicating with API: {err}") from err
 
-    async def async_start_event_listener(self) -> None:
-        """Start the background event listener task."""
-        if not self.api.get_subscribed_paths():
-            return
-        self._event_listener_task = self.hass.async_create_background_task(
-            self._run_event_listener(),
-            name=f"{DOMAIN}_event_listener",
+    def _merge_fetched(
+        self, fetched: dict[str, tuple[Any, int]], full: bool
+    ) -> dict[str, Any]:
+        """Merge fetched values into the current data.
+
+        A key changed by an event or write after its read started keeps the
+        newer value. An unavailable optional key is dropped, and a full
+        refresh drops every key it did not fetch.
+        """
+        current = self.data or {}
+        data = {} if full else dict(current)
+        for key, (value, started) in fetched.items():
+            if self._key_changes.get(key, 0) > started and key in current:
+                data[key] = current[key]
+                if key == "play_time" and "play_time_updated_at" in current:
+                    data["play_time_updated_at"] = current["play_time_updated_at"]
+            elif value is _UNAVAILABLE:
+                data.pop(key, None)
+            else:
+                data[key] = value
+                if key == "play_time":
+                    data["play_time_updated_at"] = dt_util.utcnow()
+        return data
+
+    @callback
+    def _async_backoff(self) -> None:
+        """Double the refresh interval after a failure, up to a ceiling."""
+        self._consecutive_failures += 1
+        delay = min(
+            self._base_update_interval.total_seconds()
+            * 2 ** (self._consecutive_failures - 1),
+            self.MAX_BACKOFF_INTERVAL,
+        )
+        self.update_interval = timedelta(seconds=delay)
+        _LOGGER.debug(
+            "Refresh failed %d time(s), next attempt in %ds",
+            self._consecutive_failures,
+            delay,
         )
 
+    @callback
+    def _async_reset_backoff(self) -> None:
+        """Restore the configured refresh interval after a success."""
+        if self._consecutive_failures:
+            self._consecutive_failures = 0
+            self.update_interval = self._base_update_interval
+
+    def _event_shards(self) -> dict[str, list[str]]:
+        """Return the subscribed paths of each event queue to run."""
+        if not self._split_playback_events:
+            shards = {"all": self.api.get_subscribed_paths()}
+        else:
+            playback, control = self.api.partition_subscribed_paths(PLAYBACK_EVENT_KEYS)
+            shards = {"playback": playback, "control": control}
+        return {name: paths for name, paths in shards.items() if paths}
+
+    async def async_start_event_listener(self, resync: bool = False) -> None:
+        """Start one background event listener task per event queue.
+
+        With resync, the subscribed paths are read once each queue is created.
+        """
+        self._event_listener_wanted = True
+        shards = self._event_shards()
+        self._shard_paths = shards
+        self._shard_stats = {
+            name: _EventShardStats(paths=len(paths)) for name, paths in shards.items()
+        }
+        self._event_listener_tasks = [
+            self.hass.async_create_background_task(
+                self._run_event_listener(name, resync),
+                name=f"{DOMAIN}_event_listener_{name}",
+            )
+            for name in shards
+        ]
+
     async def async_stop(self) -> None:
-        """Cancel the event listener background task."""
-        if self._event_listener_task and not self._event_listener_task.done():
-            self._event_listener_task.cancel()
+        """Cancel the event listener background tasks."""
+        self._event_listener_wanted = False
+        await self._async_cancel_event_listener()
+
+    async def _async_cancel_event_listener(self) -> None:
+        """Cancel the event listener tasks and wait for them to finish."""
+        tasks, self._event_listener_tasks = self._event_listener_tasks, []
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
             with contextlib.suppress(asyncio.CancelledError):
-                await self._event_listener_task
-        self._event_listener_task = None
-
-    async def _run_event_listener(self) -> None:
-        """Background task: subscribe to device paths and react to changes."""
-        paths = self.api.get_subscribed_paths()
-        _LOGGER.debug("Starting event listener for %d paths", len(paths))
+                await task
+
+    async def _async_restart_event_listener(self) -> None:
+        """Recreate the event queues after the subscribed paths changed."""
+        await self._async_cancel_event_listener()
+        if self._event_listener_wanted:
+            await self.async_start_event_listener(resync=True)
+
+    async def _async_update_subscriptions(self) -> None:
+        """Apply changed subscribed paths to the running event queues.
+
+        Live queues are updated in place through modifyQueue, and only the
+        newly subscribed paths are read. The queues are recreated when the set
+        of queues itself changes or the device rejects a modification.
+        """
+        shards = self._event_shards()
+        async with self._subscription_lock:
+            recreate = shards.keys() != self._shard_paths.keys()
+            for name, paths in shards.items():
+                if recreate:
+                    break
+                current = set(self._shard_paths[name])
+                subscribe = [path for path in paths if path not in current]
+                unsubscribe = sorted(current.difference(paths))
+                if not subscribe and not unsubscribe:
+                    continue
+                _LOGGER.debug(
+                    "Updating %s event queue: +%s -%s", name, subscribe, unsubscribe
+                )
+                queue_id = self._shard_queues.get(name)
+                if queue_id is not None and not await self.api.modify_event_queue(
+                    queue_id, subscribe, unsubscribe
+                ):
+                    recreate = True
+                    break
+                # A queue being recreated picks up the new paths on its own.
+                self._shard_paths[name] = paths
+                self._update_live_event_paths()
+                stats = self._shard_stats[name]
+                stats.paths = len(paths)
+                if queue_id is not None and subscribe:
+                    await self._async_resync_events(subscribe, stats)
+        if recreate:
+            await self._async_restart_event_listener()
+
+    async def _run_event_listener(self, shard: str, resync: bool = False) -> None:
+        """Background task: subscribe to device paths and react to changes.
+
+        Polling and processing are pipelined: each batch is handed to a
+        consumer task through a bounded queue and the next long poll is sent
+        right away, so the device always has a poll to answer. A lost queue is
+        recreated at once, then with jittered exponential backoff, and every
+        re-subscription reads the subscribed paths to fill the gap.
+        """
+        _LOGGER.debug("Starting %s event listener", shard)
+        stats = self._shard_stats[shard]
+        # Polled batches with the time they were received.
+        batches: asyncio.Queue[tuple[float, list[dict]]] = asyncio.Queue(
+            maxsize=self.EVENT_BACKLOG_SIZE
+        )
+        consumer = self.hass.async_create_background_task(
+            self._consume_event_batches(batches, stats),
+            name=f"{DOMAIN}_event_consumer_{shard}",
+        )
+        failures = 0
 
+        try:
+            while True:
+                try:
+                    if failures:
+                        await asyncio.sleep(self._event_retry_delay(failures))
+                    async with self._subscription_lock:
+                        paths = self._shard_paths[shard]
+                        queue_id = await self.api.create_event_queue(paths)
+                        if queue_id:
+                            self._shard_queues[shard] = queue_id
+                    if not queue_id:
+                        failures += 1
+                        _LOGGER.debug(
+                            "Failed to create %s event queue (attempt %d)",
+                            shard,
+                            failures,
+                        )
+                        continue
+
+                    _LOGGER.debug("Event queue created for %s: %s", shard, queue_id)
+                    if resync:
+                        # Events queue up on the device from now on, so reading
+                        # before the first poll cannot overwrite newer values.
+                        await self._async_resync_events(paths, stats)
+                    resync = True
+                    self._healthy_shards.add(shard)
+                    self._event_queue_healthy = self._healthy_shards >= set(
+                        self._shard_stats
+                    )
+                    self._update_live_event_paths()
+
+                    while True:
+                        events = await self.api.poll_event_queue(
+                            queue_id, timeout_ms=self.POLL_TIMEOUT_MS
+                        )
+                        if events is None:
+                            failures += 1
+                            _LOGGER.debug(
+                                "Poll error, recreating %s event queue", shard
+                            )
+                            self._shard_queues.pop(shard, None)
+                            # Apply what was received before falling back.
+                            await batches.join()
+                            await self._async_event_queue_lost(shard)
+                            break
+                        failures = 0
+                        if events:
+                            # Blocks only when the consumer falls behind.
+                            await batches.put((time.monotonic(), events))
+                            stats.max_backlog = max(stats.max_backlog, batches.qsize())
+
+                except asyncio.CancelledError:
+                    _LOGGER.debug("%s event listener cancelled", shard)
+                    self._shard_queues.pop(shard, None)
+                    self._healthy_shards.discard(shard)
+                    self._event_queue_healthy = False
+                    self._update_live_event_paths()
+                    return
+                except Exception as e:  # noqa: BLE001
+                    failures += 1
+                    self._shard_queues.pop(shard, None)
+                    _LOGGER.debug("%s event listener error: %s", shard, e)
+                    await self._async_event_queue_lost(shard)
+        finally:
+            consumer.cancel()
+
+    def _event_retry_delay(self, failures: int) -> float:
+        """Return the seconds to wait before recreating a lost event queue.
+
+        The first retry is immediate; later ones back off exponentially up to
+        EVENT_LISTENER_RETRY_DELAY, with jitter so queues don't retry in step.
+        """
+        if failures <= 1:
+            return 0.0
+        delay = min(
+            self.EVENT_RETRY_BASE_DELAY * 2 ** (failures - 2),
+            self.EVENT_LISTENER_RETRY_DELAY,
+        )
+        return delay * random.uniform(0.5, 1.0)
+
+    async def _async_resync_events(
+        self, paths: list[str], stats: _EventShardStats
+    ) -> None:
+        """Read the subscribed paths once to catch changes missed while away."""
+        with request_priority(RequestPriority.RESYNC):
+            updates = await self.api.read_subscribed_paths(paths)
+        stats.resyncs += 1
+        if updates:
+            self._apply_event_updates(updates)
+
+    async def _consume_event_batches(
+        self,
+        batches: asyncio.Queue[tuple[float, list[dict]]],
+        stats: _EventShardStats,
+    ) -> None:
+        """Apply polled event batches, merging any backlog into one update.
+
+        The delivery latency of each batch, from the poll returning it to its
+        updates reaching the data and listeners, is recorded in stats.
+        """
         while True:
+            received, batch = await batches.get()
+            events = list(batch)
+            receipts = [received]
+            while not batches.empty():
+                received, batch = batches.get_nowait()
+                events.extend(batch)
+                receipts.append(received)
             try:
-                queue_id = await self.api.create_event_queue(paths)
-                if not queue_id:
-                    _LOGGER.debug(
-                        "Failed to create event queue, retrying in %ds",
-                        self.EVENT_LISTENER_RETRY_DELAY,
-                    )
-                    await asyncio.sleep(self.EVENT_LISTENER_RETRY_DELAY)
-                    continue
+                self._process_events(events, stats)
+                applied = time.monotonic()
+                for received in receipts:
+                    stats.record_delivery(applied - received)
+            except Exception:
+                _LOGGER.exception("Failed to process events")
+            finally:
+                for _ in receipts:
+                    batches.task_done()
+
+    def _process_events(self, events: list[dict], stats: _EventShardStats) -> None:
+        """Route polled events to data keys and apply them in one update."""
+        updates: dict[str, Any] = {}
+        for event in events:
+            if event.get("itemType") != "update":
+                continue
+            path = event.get("path")
+            item_value = event.get("itemValue")
+            if not path or not item_value:
+                continue
+            updates.update(self.api.process_event(path, item_value))
+        stats.batches += 1
+        stats.events += len(events)
+        stats.max_batch = max(stats.max_batch, len(events))
+        if updates:
+            self._apply_event_updates(updates, stats)
+
+    async def _async_event_queue_lost(self, shard: str | None = None) -> None:
+        """Fall back to full polling until every event queue is healthy again."""
+        if shard is not None:
+            self._healthy_shards.discard(shard)
+            self._update_live_event_paths()
+        if not self._event_queue_healthy:
+            return
+        self._event_queue_healthy = False
+        self._last_full_refresh = None
+        await self.async_request_refresh()
 
-                _LOGGER.debug("Event queue created: %s", queue_id)
+    def _update_live_event_paths(self) -> None:
+        """Tell the API which subscribed paths currently deliver events."""
+        self.api.set_live_event_paths(
+            {
+                path
+                for shard in self._healthy_shards
+                for path in self._shard_paths.get(shard, ())
+            }
+        )
 
-                while True:
-                    events = await self.api.poll_event_queue(
-                        queue_id, timeout_ms=self.POLL_TIMEOUT_MS
-                    )
-                    if events is None:
-                        _LOGGER.debug("Poll error, recreating event queue")
-                        break
-                    for event in events:
-                        if event.get("itemType") != "update":
-                            continue
-                        path = event.get("path")
-                        item_value = event.get("itemValue")
-                        if not path or not item_value:
-                            continue
-                        updates = self.api.process_event(path, item_value)
-                        for key, value in updates.items():
-                            _LOGGER.debug("Event update: %s = %r", key, value)
-                            self._apply_event_update(key, value)
-
-            except asyncio.CancelledError:
-                _LOGGER.debug("Event listener cancelled")
-                return
-            except Exception as e:  # noqa: BLE001
-                _LOGGER.debug(
-                    "Event listener error: %s, retrying in %ds",
-                    e,
-                    self.EVENT_LISTENER_RETRY_DELAY,
-                )
-                await asyncio.sleep(self.EVENT_LISTENER_RETRY_DELAY)
+    def get_event_stats(self) -> dict[str, dict[str, Any]]:
+        """Return delivery statistics per event queue."""
+        return {name: stats.as_dict() for name, stats in self._shard_stats.items()}
+
+    @property
+    def event_queue_healthy(self) -> bool:
+        """Return True while the event queue keeps data up to date."""
+        return self._event_queue_healthy
+
+    def restore_snapshot(self, data: dict[str, Any]) -> None:
+        """Use the last known data until the first full refresh completes."""
+        self.data = data
+        self._data_stale = True
+
+    def get_snapshot(self) -> dict[str, Any]:
+        """Return the data worth restoring after a restart."""
+        return {
+            key: value
+            for key, value in (self.data or {}).items()
+            if key not in self.VOLATILE_KEYS
+        }
+
+    @property
+    def data_is_stale(self) -> bool:
+        """Return True while data still comes from a restored snapshot."""
+        return self._data_stale
 
     def _optimistic_update(self, key: str, value: Any):
         """Apply an optimistic state update and notify listeners."""
         if self.data:
+            self._mark_changed(key)
             self.data[key] = value
             self.async_set_updated_data(self.data)
 
+    def _mark_changed(self, key: str) -> None:
+        """Record that a data key changed outside of a refresh."""
+        self._change_count += 1
+        self._key_changes[key] = self._change_count
+
+    async def _async_call_setter(self, api_method: str, value: Any) -> None:
+        """Call an API setter, sending any reads it makes as commands too."""
+        with request_priority(RequestPriority.INTERACTIVE):
+            await getattr(self.api, api_method)(value)
+
     async def _async_set(self, api_method: str, data_key: str, value: Any) -> None:
         """Call an API setter and apply an optimistic update."""
-        await getattr(self.api, api_method)(value)
+        self._write_started[data_key] = time.monotonic()
+        await self._async_call_setter(api_method, value)
         self._optimistic_update(data_key, value)
 
-    def _apply_event_update(self, key: str, value: Any):
-        """Apply an event-driven update with special handling for player keys."""
+    async def _async_set_latest(
+        self,
+        api_method: str,
+        data_key: str,
+        value: Any,
+        optimistic_value: Any = None,
+    ) -> None:
+        """Apply a slider-driven value, sending only the latest to the device.
+
+        The optimistic update is applied immediately. At most one write per
+        data key is in flight; a value set meanwhile replaces any queued one
+        and is sent once the current write completes. If a write fails, the
+        last value the device accepted is shown again.
+        """
+        shown = value if optimistic_value is None else optimistic_value
+        if data_key in self._writes_in_flight:
+            self._optimistic_update(data_key, shown)
+            if data_key in self._queued_writes:
+                self.writes_elided += 1
+            self._queued_writes[data_key] = (api_method, value, shown)
+            return
+
+        confirmed = self.data.get(data_key) if self.data else None
+        self._optimistic_update(data_key, shown)
+        self._writes_in_flight.add(data_key)
+        try:
+            while True:
+                self._write_started[data_key] = time.monotonic()
+                await self._async_call_setter(api_method, value)
+                confirmed = shown
+                if data_key not in self._queued_writes:
+                    break
+                api_method, value, shown = self._queued_writes.pop(data_key)
+        except Exception:
+            queued = self._queued_writes.get(data_key)
+            latest = queued[2] if queued else shown
+            # Roll back unless an event already reported the device's value.
+            if self.data and self.data.get(data_key) == latest:
+                _LOGGER.debug("%s write failed, restoring %r", data_key, confirmed)
+                self._optimistic_update(data_key, confirmed)
+            raise
+        finally:
+            self._writes_in_flight.discard(data_key)
+            if self._queued_writes.pop(data_key, None) is not None:
+                self.writes_elided += 1
+                _LOGGER.debug("Dropped queued %s write after an error", data_key)
+
+    def _apply_event_updates(
+        self, updates: dict[str, Any], stats: _EventShardStats | None = None
+    ) -> None:
+        """Merge a batch of event-driven updates and notify listeners once.
+
+        Values equal to the current data are skipped, and listeners are only
+        notified when at least one key actually changed. The refresh timer is
+        left untouched so busy event streams don't postpone polling.
+        """
         if not self.data:
             return
-        self.data[key] = value
-        if key == "play_time":
-            self.data["play_time_updated_at"] = dt_util.utcnow()
-        self.async_set_updated_data(self.data)
+        now = time.monotonic()
+        changed = False
+        for key, value in updates.items():
+            started = self._write_started.pop(key, None)
+            if started is not None and stats is not None:
+                latency = now - started
+                if latency <= self.ECHO_WINDOW:
+                    stats.record_echo(latency)
+            self._mark_changed(key)
+            if key in self.data and self.data[key] == value:
+                continue
+            _LOGGER.debug("Event update: %s = %r", key, value)
+            self.data[key] = value
+            changed = True
+            if key == "play_time":
+                self.data["play_time_updated_at"] = dt_util.utcnow()
+        if changed:
+            self.async_update_listeners()
 
     async def async_set_volume(self, volume: float):
         """Set volume."""
-        await self.api.set_volume(volume)
-        self._optimistic_update("volume", int(volume))
+        await self._async_set_latest("set_volume", "volume", volume, int(volume))
 
     async def async_set_mute(self, mute: bool):
         """Set mute."""
@@ -370,19 +1142,21 @@ class AmbeoCoordinator(DataUpdateCoordinator):
 
     async def async_set_led_bar_brightness(self, brightness: int):
         """Set LED bar brightness."""
-        await self._async_set(
+        await self._async_set_latest(
             "set_led_bar_brightness", "led_bar_brightness", brightness
         )
 
     async def async_set_codec_led_brightness(self, brightness: int):
         """Set codec LED brightness."""
-        await self._async_set(
+        await self._async_set_latest(
             "set_codec_led_brightness", "codec_led_brightness", brightness
         )
 
     async def async_set_logo_brightness(self, brightness: int):
         """Set logo brightness."""
-        await self._async_set("set_logo_brightness", "logo_brightness", brightness)
+        await self._async_set_latest(
+            "set_logo_brightness", "logo_brightness", brightness
+        )
 
     async def async_change_logo_state(self, state: bool):
         """Change logo state."""
@@ -390,7 +1164,7 @@ class AmbeoCoordinator(DataUpdateCoordinator):
 
     async def async_set_display_brightness(self, brightness: int):
         """Set display brightness."""
-        await self._async_set(
+        await self._async_set_latest(
             "set_display_brightness", "display_brightness", brightness
         )
 
@@ -420,29 +1194,33 @@ class AmbeoCoordinator(DataUpdateCoordinator):
 
     async def async_set_subwoofer_volume(self, volume: float):
         """Set subwoofer volume."""
-        await self._async_set("set_subwoofer_volume", "subwoofer_volume", volume)
+        await self._async_set_latest("set_subwoofer_volume", "subwoofer_volume", volume)
 
     async def async_set_voice_enhancement_level(self, level: int):
         """Set voice enhancement level."""
-        await self._async_set(
+        await self._async_set_latest(
             "set_voice_enhancement_level", "voice_enhancement_level", level
         )
 
     async def async_set_center_speaker_level(self, level: int):
         """Set center speaker level."""
-        await self._async_set("set_center_speaker_level", "center_speaker_level", level)
+        await self._async_set_latest(
+            "set_center_speaker_level", "center_speaker_level", level
+        )
 
     async def async_set_side_firing_level(self, level: int):
         """Set side firing level."""
-        await self._async_set("set_side_firing_level", "side_firing_level", level)
+        await self._async_set_latest(
+            "set_side_firing_level", "side_firing_level", level
+        )
 
     async def async_set_up_firing_level(self, level: int):
         """Set up firing level."""
-        await self._async_set("set_up_firing_level", "up_firing_level", level)
+        await self._async_set_latest("set_up_firing_level", "up_firing_level", level)
 
     async def async_set_center_volume(self, volume: float):
         """Set center volume."""
-        await self._async_set("set_center_volume", "center_volume", volume)
+        await self._async_set_latest("set_center_volume", "center_volume", volume)
 
     async def async_set_ambeo_mode_level(self, level: int) -> None:
         """Set the Ambeo mode level."""
@@ -460,6 +1238,35 @@ class AmbeoCoordinator(DataUpdateCoordinator):
         await self.async_request_refresh()
 
     # Lookup helpers.
+    def set_sources(self, sources: list[dict]) -> None:
+        """Replace the source list and its lookup dicts."""
+        self.sources = sources
+        # Lookup dicts for O(1) source/preset resolution.
+        self._source_title_by_id: dict = {
+            s["id"]: s["title"] for s in sources if "id" in s and "title" in s
+        }
+        self._source_id_by_title: dict = {
+            s["title"]: s["id"] for s in sources if "id" in s and "title" in s
+        }
+
+    def set_presets(self, presets: list[dict]) -> None:
+        """Replace the preset list and its lookup dicts."""
+        self.presets = presets
+        self._preset_title_by_id: dict = {
+            p["id"]: p["title"] for p in presets if "id" in p and "title" in p
+        }
+        self._preset_id_by_title: dict = {
+            p["title"]: p["id"] for p in presets if "id" in p and "title" in p
+        }
+
+    async def async_load_sources_and_presets(self) -> None:
+        """Fetch the source and preset lists concurrently."""
+        sources, presets = await asyncio.gather(
+            self.api.get_all_sources(), self.api.get_all_presets()
+        )
+        self.set_sources(sources or [])
+        self.set_presets(presets or [])
+
     def get_source_title(self, source_id) -> str | None:
         """Return the display title for a source ID."""
         return self._source_title_by_id.get(source_id)
@@ -487,7 +1294,13 @@ class AmbeoCoordinator(DataUpdateCoordinator):
 
     async def has_subwoofer(self) -> bool:
         """Check if device has a subwoofer."""
-        return await self.api.has_subwoofer()
+        if self._has_subwoofer is None:
+            self._has_subwoofer = await self.api.has_subwoofer()
+        return self._has_subwoofer
+
+    def set_has_subwoofer(self, has_subwoofer: bool | None) -> None:
+        """Seed the subwoofer presence, e.g. from cached metadata."""
+        self._has_subwoofer = has_subwoofer
 
     def get_volume_max(self) -> int:
         """Get the maximum native volume value."""
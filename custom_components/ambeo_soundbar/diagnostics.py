@@ -31,6 +31,22 @@ async def async_get_config_entry_diagnostics(
             "supported_features": coordinator.api.capabilities,
         },
         "current_state": coordinator.data or {},
+        "polling": {
+            "update_interval": coordinator.update_interval.total_seconds(),
+            "event_queue_healthy": coordinator.event_queue_healthy,
+            "data_is_stale": coordinator.data_is_stale,
+            "failing_features": coordinator.get_feature_health(),
+            "pruned_features": coordinator.get_pruned_keys(),
+            "subscribed_paths": len(coordinator.api.get_subscribed_paths()),
+        },
+        "requests": {
+            **coordinator.api.get_request_stats(),
+            "writes_elided": coordinator.writes_elided,
+        },
+        "connections": entry.runtime_data.pool.get_stats(),
+        "scheduler": coordinator.api.get_scheduler_stats(),
+        "timing": coordinator.api.get_timing_stats(),
+        "events": coordinator.get_event_stats(),
         "config": {
             "entry_id": entry.entry_id,
             "title": entry.title,
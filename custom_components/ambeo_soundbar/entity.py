@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import math
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -29,6 +30,7 @@ class LightConfig:
     data_key: str
     set_method: str
     default_brightness: int
+    extra_data_keys: tuple[str, ...] = ()
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -45,9 +47,18 @@ class AmbeoBaseEntity(CoordinatorEntity["AmbeoCoordinator"]):
         device: AmbeoDevice,
         name_suffix: str | None,
         unique_id_suffix: str,
+        data_keys: Iterable[str] | None = None,
     ):
-        """Initialize the base entity."""
-        super().__init__(coordinator)
+        """Initialize the base entity.
+
+        data_keys lists the coordinator data keys the entity state depends on,
+        so it is only refreshed when one of them changes and the coordinator
+        only polls keys some entity uses. None means any key, but keeps no
+        key polled.
+        """
+        super().__init__(
+            coordinator, None if data_keys is None else frozenset(data_keys)
+        )
         self._attr_name = name_suffix
         self._attr_unique_id = (
             f"{device.serial}_{unique_id_suffix.lower().replace(' ', '_')}"
@@ -61,6 +72,11 @@ class AmbeoBaseEntity(CoordinatorEntity["AmbeoCoordinator"]):
             "identifiers": {(DOMAIN, self.ambeo_device.serial)},
         }
 
+    @property
+    def assumed_state(self) -> bool:
+        """Return True while the state comes from data restored at startup."""
+        return self.coordinator.data_is_stale
+
 
 class BaseLight(AmbeoBaseEntity, LightEntity):
     """Base class for brightness-based light entities."""
@@ -76,7 +92,13 @@ class BaseLight(AmbeoBaseEntity, LightEntity):
         config: LightConfig,
     ):
         """Initialize the light entity."""
-        super().__init__(coordinator, device, name_suffix, unique_id_suffix)
+        super().__init__(
+            coordinator,
+            device,
+            name_suffix,
+            unique_id_suffix,
+            (config.data_key, *config.extra_data_keys),
+        )
         self._brightness_scale = config.brightness_scale
         self._data_key = config.data_key
         self._set_method = config.set_method
@@ -140,11 +162,15 @@ class AmbeoBaseSwitch(AmbeoBaseEntity, SwitchEntity):
         unique_id_suffix: str | None = None,
     ):
         """Initialize the switch entity."""
-        super().__init__(
-            coordinator, device, feature_name, unique_id_suffix or feature_name
-        )
         if data_key:
             self._data_key = data_key
+        super().__init__(
+            coordinator,
+            device,
+            feature_name,
+            unique_id_suffix or feature_name,
+            (self._data_key,) if self._data_key else None,
+        )
         if set_method:
             self._set_method = set_method
 
@@ -186,11 +212,15 @@ class AmbeoBaseNumber(AmbeoBaseEntity, NumberEntity):
         unique_id_suffix: str | None = None,
     ):
         """Initialize the number entity."""
-        super().__init__(
-            coordinator, device, feature_name, unique_id_suffix or feature_name
-        )
         if data_key:
             self._data_key = data_key
+        super().__init__(
+            coordinator,
+            device,
+            feature_name,
+            unique_id_suffix or feature_name,
+            (self._data_key,) if self._data_key else None,
+        )
         if set_method:
             self._set_method = set_method
 
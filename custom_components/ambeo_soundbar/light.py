@@ -106,6 +106,7 @@ class AmbeoLogo(BaseLight):
                 data_key="logo_brightness",
                 set_method="async_set_logo_brightness",
                 default_brightness=DEFAULT_BRIGHTNESS,
+                extra_data_keys=("logo_state",),
             ),
         )
 
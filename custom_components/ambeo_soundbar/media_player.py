@@ -13,13 +13,25 @@ from .entity import AmbeoBaseEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+# Coordinator data keys the media player state is derived from.
+MEDIA_PLAYER_DATA_KEYS = (
+    "state",
+    "player_data",
+    "decoder_status",
+    "volume",
+    "muted",
+    "current_source",
+    "current_preset",
+    "play_time",
+)
+
 
 class AmbeoMediaPlayer(AmbeoBaseEntity, MediaPlayerEntity):
     """Representation of an Ambeo device as a media player entity."""
 
     def __init__(self, coordinator, device):
         """Initialize the Ambeo media player entity."""
-        super().__init__(coordinator, device, None, "player")
+        super().__init__(coordinator, device, None, "player", MEDIA_PLAYER_DATA_KEYS)
         self._max_volume = 100
         self._volume_step = coordinator.get_volume_step()
         self._last_title: str | None = None
@@ -25,7 +25,13 @@ class AmbeoModeLevel(AmbeoBaseEntity, SelectEntity):
 
     def __init__(self, coordinator, device):
         """Initialize the Ambeo mode level select entity."""
-        super().__init__(coordinator, device, "Ambeo Mode", "ambeo_mode_level")
+        super().__init__(
+            coordinator,
+            device,
+            "Ambeo Mode",
+            "ambeo_mode_level",
+            ("ambeo_mode", "ambeo_mode_level"),
+        )
 
     @property
     def current_option(self) -> str | None:
@@ -55,7 +61,7 @@ class SourceSelect(AmbeoBaseEntity, SelectEntity):
 
     def __init__(self, coordinator, device):
         """Initialize the source select entity."""
-        super().__init__(coordinator, device, "Source", "source")
+        super().__init__(coordinator, device, "Source", "source", ("current_source",))
         self._attr_options = sorted(
             s["title"] for s in coordinator.sources if "title" in s
         )
@@ -83,7 +89,9 @@ class SoundModeSelect(AmbeoBaseEntity, SelectEntity):
 
     def __init__(self, coordinator, device):
         """Initialize the sound mode select entity."""
-        super().__init__(coordinator, device, "Sound Mode", "sound_mode")
+        super().__init__(
+            coordinator, device, "Sound Mode", "sound_mode", ("current_preset",)
+        )
         self._attr_options = sorted(
             p["title"] for p in coordinator.presets if "title" in p
         )
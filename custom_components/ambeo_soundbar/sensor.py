@@ -21,7 +21,13 @@ class DecoderStatusSensor(AmbeoBaseEntity, SensorEntity):
 
     def __init__(self, coordinator, device):
         """Initialize the decoder status sensor."""
-        super().__init__(coordinator, device, "Decoder Status", "decoder_status")
+        super().__init__(
+            coordinator,
+            device,
+            "Decoder Status",
+            "decoder_status",
+            ("decoder_status",),
+        )
 
     @property
     def native_value(self):
@@ -0,0 +1,119 @@
+"""Persistent caches for Ambeo Soundbar config entries."""
+
+import asyncio
+import logging
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .api.const import Capability
+from .api.factory import AmbeoAPIFactory
+from .api.impl.generic_api import AmbeoApi
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class DeviceMetadata:
+    """Device information that only changes with the hardware or firmware."""
+
+    serial: str
+    model: str | None
+    name: str | None
+    version: str | None
+    sources: list[dict]
+    presets: list[dict]
+    has_subwoofer: bool | None = None
+
+
+async def async_fetch_metadata(api: AmbeoApi) -> DeviceMetadata:
+    """Read the current metadata from the device."""
+    identity, sources, presets = await asyncio.gather(
+        AmbeoAPIFactory.read_identity(api),
+        api.get_all_sources(),
+        api.get_all_presets(),
+    )
+    has_subwoofer = None
+    if api.has_capability(Capability.SUBWOOFER):
+        has_subwoofer = await api.has_subwoofer()
+    return DeviceMetadata(
+        serial=identity.serial or "unknown_serial",
+        model=identity.model,
+        name=identity.name,
+        version=identity.version,
+        sources=sources or [],
+        presets=presets or [],
+        has_subwoofer=has_subwoofer,
+    )
+
+
+class AmbeoMetadataStore:
+    """Store the metadata of one config entry in Home Assistant storage."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the store."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.metadata"
+        )
+
+    async def async_load(self) -> DeviceMetadata | None:
+        """Return the cached metadata, or None if there is no usable cache."""
+        data = await self._store.async_load()
+        if not data:
+            return None
+        try:
+            metadata = DeviceMetadata(**data)
+            AmbeoAPIFactory.api_class_for_model(metadata.model)
+        except (TypeError, ValueError):
+            _LOGGER.debug("Ignoring unusable metadata cache: %s", data)
+            return None
+        return metadata
+
+    async def async_save(self, metadata: DeviceMetadata) -> None:
+        """Persist the metadata."""
+        await self._store.async_save(asdict(metadata))
+
+    async def async_remove(self) -> None:
+        """Delete the cache."""
+        await self._store.async_remove()
+
+
+class AmbeoSnapshotStore:
+    """Store the last known coordinator data of one config entry."""
+
+    # Seconds to batch data changes into a single write.
+    SAVE_DELAY = 30
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the store."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.snapshot"
+        )
+        # Data last loaded or scheduled for saving.
+        self._data: dict[str, Any] | None = None
+
+    async def async_load(self) -> dict[str, Any] | None:
+        """Return the saved data, if any."""
+        self._data = await self._store.async_load()
+        return self._data
+
+    @callback
+    def async_delay_save(self, data: dict[str, Any]) -> None:
+        """Save the data once changes settle.
+
+        Data equal to what is already saved or scheduled is ignored, so
+        updates to keys that are not persisted never postpone the write.
+        """
+        if data == self._data:
+            return
+        self._data = data
+        self._store.async_delay_save(lambda: data, self.SAVE_DELAY)
+
+    async def async_remove(self) -> None:
+        """Delete the saved data."""
+        await self._store.async_remove()
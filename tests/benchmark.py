@@ -0,0 +1,362 @@
+"""Micro-benchmarks for the Ambeo Soundbar integration.
+
+Run from the repository root, e.g. ``python -m tests.benchmark events``.
+Home Assistant must be installed, as for the tests.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import statistics
+import tempfile
+import time
+import timeit
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.ambeo_soundbar.api.const import PathSub
+from custom_components.ambeo_soundbar.api.impl.espresso_api import AmbeoEspressoApi
+from custom_components.ambeo_soundbar.api.impl.generic_api import AmbeoApi
+from custom_components.ambeo_soundbar.api.impl.popcorn_api import AmbeoPopcornApi
+from custom_components.ambeo_soundbar.api.scheduler import (
+    RequestPriority,
+    request_priority,
+)
+from custom_components.ambeo_soundbar.coordinator import (
+    CORE_FEATURES,
+    LIVENESS_PROBE,
+    OPTIONAL_FEATURES,
+    AmbeoCoordinator,
+)
+
+SAMPLE_VALUES: dict[str, Any] = {
+    "i16_": 3,
+    "i32_": 42,
+    "i64_": 123456,
+    "bool_": True,
+    "double_": 1.5,
+    "popcornInputId": "hdmi1",
+    "popcornAudioPreset": "movies",
+    "powerTarget": {"target": "online"},
+    "bluetoothState": {"pairable": True},
+    "playLogicData": {"state": "playing"},
+    "espressoDecoderStatus": {"channels": 2},
+    "imx8AfAudioFormat": {"channels": 6},
+    "espressoBrightness": {"ambeologo": 40, "display": 60},
+}
+
+
+def _linear_router(api: AmbeoApi) -> Callable[[str, dict], dict]:
+    """Return a router that scans the subscription list (pre-dispatch-table)."""
+    subs = api._active_subscriptions()
+    brightness_path = getattr(api, "_BRIGHTNESS_PATH", None)
+
+    def process(path: str, item_value: dict) -> dict:
+        for sub in subs:
+            if sub.path == path:
+                value = item_value.get(sub.type_key)
+                if sub.sub_key and isinstance(value, dict):
+                    value = value.get(sub.sub_key)
+                return {sub.data_key: value} if value is not None else {}
+        if path == brightness_path:
+            return api._extract_brightness(item_value)
+        return {}
+
+    return process
+
+
+def _sample_events(api: AmbeoApi) -> list[tuple[str, dict]]:
+    """Build one representative event per subscribed path."""
+    subs: dict[str, PathSub] = {s.path: s for s in api._active_subscriptions()}
+    events = []
+    for path in api.get_subscribed_paths():
+        type_key = subs[path].type_key if path in subs else "espressoBrightness"
+        events.append((path, {type_key: SAMPLE_VALUES[type_key]}))
+    return events
+
+
+def _per_event_ns(
+    process: Callable[[str, dict], dict], events: list[tuple[str, dict]]
+) -> float:
+    """Return the best-of-five cost of routing one event, in nanoseconds."""
+
+    def run():
+        for path, item_value in events:
+            process(path, item_value)
+
+    number = 2000
+    best = min(timeit.repeat(run, number=number, repeat=5))
+    return best / (number * len(events)) * 1e9
+
+
+def bench_events() -> None:
+    """Compare dispatch-table and linear-scan event routing per model."""
+    for name, api in (
+        ("Popcorn", AmbeoPopcornApi("ambeo.local", 80, 5, None)),
+        ("Espresso", AmbeoEspressoApi("ambeo.local", 80, 5, None)),
+    ):
+        events = _sample_events(api)
+        table = _per_event_ns(api.process_event, events)
+        linear = _per_event_ns(_linear_router(api), events)
+        print(
+            f"{name:<9} {len(events):>2} paths  "
+            f"dispatch table {table:7.0f} ns/event  "
+            f"linear scan {linear:7.0f} ns/event"
+        )
+
+
+class FakeDeviceApi(AmbeoPopcornApi):
+    """Popcorn API answered in-process with canned values instead of HTTP."""
+
+    # Polled settings nodes, answered as rows when their parent is read.
+    SETTINGS_PATHS = (
+        "settings:/popcorn/audio/nightModeStatus",
+        "settings:/popcorn/audio/voiceEnhancement",
+        "settings:/popcorn/audio/ambeoModeStatus",
+        "settings:/popcorn/audio/centerVolume",
+        "ui:/settings/interface/codecLedBrightness",
+        "ui:/settings/interface/ledBrightness",
+    )
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize the fake and its request counter."""
+        super().__init__(*args, **kwargs)
+        self.fetches = 0
+        # Simulated device service time per request, in seconds.
+        self.latency = 0.0
+
+    async def fetch_data(self, url, http_timeout=None, encoded=False, session=None):
+        """Return a canned response after yielding to the event loop once."""
+        self.fetches += 1
+        await asyncio.sleep(self.latency)
+        value = {**SAMPLE_VALUES, "string_": "fake"}
+        if url.startswith("getRows"):
+            parent = url.partition("path=")[2].partition("&")[0]
+            return {
+                "rows": [
+                    {"path": path, "value": value}
+                    for path in self.SETTINGS_PATHS
+                    if path.startswith(f"{parent}/")
+                ]
+            }
+        return {"value": value}
+
+
+def _legacy_select(coordinator: AmbeoCoordinator, now: float) -> tuple[list, list]:
+    """Select fetches the pre-plan way: filter and resolve on every refresh."""
+    api = coordinator.api
+    core = [
+        (f, getattr(api, f.api_method))
+        for f in CORE_FEATURES
+        if f is not LIVENESS_PROBE
+    ]
+    optional = [
+        (f, getattr(api, f.api_method))
+        for f in OPTIONAL_FEATURES
+        if (f.capability is None or api.has_capability(f.capability))
+        and coordinator._is_feature_active(f, now)
+    ]
+    return core, optional
+
+
+def _per_call_us(func: Callable[[], Any]) -> float:
+    """Return the best-of-five cost of one call, in microseconds."""
+    number = 5000
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+async def _bench_refresh(config_dir: str) -> None:
+    hass = HomeAssistant(config_dir)
+    coordinator = AmbeoCoordinator(
+        hass, FakeDeviceApi("ambeo.local", 80, 5, None), [], []
+    )
+    tiers = set(AmbeoCoordinator.TIER_INTERVALS)
+    now = time.monotonic()
+    compiled = _per_call_us(lambda: coordinator._select_fetches(tiers, set(), now))
+    legacy = _per_call_us(lambda: _legacy_select(coordinator, now))
+    print(f"plan selection  compiled {compiled:6.2f} us  legacy {legacy:6.2f} us")
+
+    rounds = 200
+    start = time.perf_counter()
+    for _ in range(rounds):
+        coordinator._last_full_refresh = None
+        coordinator.data = await coordinator._async_update_data()
+    elapsed = (time.perf_counter() - start) / rounds * 1e6
+    print(f"full refresh against fake device {elapsed:8.1f} us")
+
+    for label, parents in (
+        ("bulk", FakeDeviceApi._BULK_READ_PARENTS),
+        ("individual", ()),
+    ):
+        api = FakeDeviceApi("ambeo.local", 80, 5, None)
+        api._BULK_READ_PARENTS = parents
+        coordinator = AmbeoCoordinator(hass, api, [], [])
+        coordinator.data = await coordinator._async_update_data()
+        full, api.fetches = api.fetches, 0
+        coordinator.data = await coordinator._async_update_data()
+        print(
+            f"requests per refresh, {label:<10} full {full:3d}  "
+            f"hot only {api.fetches:3d}"
+        )
+    await hass.async_stop(force=True)
+
+
+def bench_refresh() -> None:
+    """Measure per-refresh planning overhead against an in-process fake device."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        asyncio.run(_bench_refresh(config_dir))
+
+
+async def _command_latencies(hass: HomeAssistant, prioritized: bool) -> list[float]:
+    """Time mute commands sent while full refreshes keep the device busy."""
+    api = FakeDeviceApi("ambeo.local", 80, 5, None)
+    api.latency = 0.005
+    coordinator = AmbeoCoordinator(hass, api, [], [], concurrent_requests=2)
+    done = asyncio.Event()
+
+    async def refresh_forever() -> None:
+        while not done.is_set():
+            coordinator._last_full_refresh = None
+            coordinator.data = await coordinator._async_update_data()
+
+    refresher = asyncio.create_task(refresh_forever())
+    latencies = []
+    for i in range(60):
+        await asyncio.sleep(0.003)
+        # Without priorities, commands queue in arrival order with polling.
+        scope = (
+            contextlib.nullcontext()
+            if prioritized
+            else request_priority(RequestPriority.BACKGROUND)
+        )
+        start = time.perf_counter()
+        with scope:
+            await api.set_mute(bool(i % 2))
+        latencies.append(time.perf_counter() - start)
+    done.set()
+    await refresher
+    return latencies
+
+
+async def _bench_commands(config_dir: str) -> None:
+    hass = HomeAssistant(config_dir)
+    for label, prioritized in (("prioritized", True), ("arrival order", False)):
+        latencies = await _command_latencies(hass, prioritized)
+        p50 = statistics.median(latencies) * 1000
+        p95 = statistics.quantiles(latencies, n=20)[18] * 1000
+        print(f"command latency, {label:<13} p50 {p50:6.1f} ms  p95 {p95:6.1f} ms")
+    await hass.async_stop(force=True)
+
+
+def bench_commands() -> None:
+    """Measure command latency under concurrent refreshes, 5 ms per request."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        asyncio.run(_bench_commands(config_dir))
+
+
+class FakeEventApi(FakeDeviceApi):
+    """Fake device that emits play time and volume events on its queues."""
+
+    PLAY_TIME = "player:player/data/playTime"
+    VOLUME = "player:volume"
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize the fake with no event queues."""
+        super().__init__(*args, **kwargs)
+        self._queues: dict[str, tuple[list[str], list[dict], asyncio.Event]] = {}
+
+    async def create_event_queue(self, paths: list[str]) -> str | None:
+        """Create a queue receiving the events of the given paths."""
+        queue_id = f"q{len(self._queues)}"
+        self._queues[queue_id] = (paths, [], asyncio.Event())
+        return queue_id
+
+    async def poll_event_queue(self, queue_id: str, timeout_ms: int = 30000):
+        """Return the pending events once there are any."""
+        _, pending, ready = self._queues[queue_id]
+        await ready.wait()
+        ready.clear()
+        events = pending[:]
+        pending.clear()
+        return events
+
+    def emit(self, path: str, item_value: dict) -> None:
+        """Queue an update event on every queue subscribed to path."""
+        for paths, pending, ready in self._queues.values():
+            if path in paths:
+                pending.append(
+                    {"itemType": "update", "path": path, "itemValue": item_value}
+                )
+                ready.set()
+
+
+def _spin(seconds: float) -> None:
+    """Keep the event loop busy, as a slow listener would."""
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+async def _delivery_stats(hass: HomeAssistant, split: bool) -> dict[str, Any]:
+    """Emit playback and volume events for a second and return queue stats."""
+    api = FakeEventApi("ambeo.local", 80, 5, None)
+    coordinator = AmbeoCoordinator(hass, api, [], [], split_playback_events=split)
+    coordinator.data = {"play_time": 0, "volume": 0}
+    # A busy media player entity: each play time update costs 2 ms to write.
+    coordinator.async_add_listener(lambda: _spin(0.002), frozenset({"play_time"}))
+    coordinator.async_add_listener(lambda: None, frozenset({"volume"}))
+    await coordinator.async_start_event_listener()
+    await asyncio.sleep(0)
+    for tick in range(1, 501):
+        api.emit(api.PLAY_TIME, {"i64_": tick})
+        if tick % 20 == 0:
+            api.emit(api.VOLUME, {"i32_": tick // 20})
+        await asyncio.sleep(0.002)
+    await asyncio.sleep(0.05)
+    await coordinator.async_stop()
+    await coordinator.async_shutdown()
+    return coordinator.get_event_stats()
+
+
+async def _bench_delivery(config_dir: str) -> None:
+    hass = HomeAssistant(config_dir)
+    for label, split in (("one queue", False), ("split", True)):
+        for shard, stats in (await _delivery_stats(hass, split)).items():
+            print(
+                f"{label:<9} {shard:<8} {stats['batches']:4d} batches  "
+                f"delivery mean {stats['delivery_mean_ms']:5.1f} ms  "
+                f"max {stats['delivery_max_ms']:5.1f} ms"
+            )
+    await hass.async_stop(force=True)
+
+
+def bench_delivery() -> None:
+    """Measure per-queue event delivery latency under a play time burst."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        asyncio.run(_bench_delivery(config_dir))
+
+
+BENCHMARKS: dict[str, Callable[[], None]] = {
+    "events": bench_events,
+    "refresh": bench_refresh,
+    "commands": bench_commands,
+    "delivery": bench_delivery,
+}
+
+
+def main() -> None:
+    """Run the selected benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("names", nargs="*", metavar="name", help=", ".join(BENCHMARKS))
+    args = parser.parse_args()
+    if unknown := set(args.names) - BENCHMARKS.keys():
+        parser.error(f"unknown benchmark(s): {', '.join(sorted(unknown))}")
+    for name in args.names or BENCHMARKS:
+        print(f"== {name}")
+        BENCHMARKS[name]()
+
+
+if __name__ == "__main__":
+    main()
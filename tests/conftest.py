@@ -32,6 +32,7 @@ def mock_api():
     api.get_volume_step = MagicMock(return_value=0.01)
     api.get_volume_max = MagicMock(return_value=100)
     api.has_subwoofer = AsyncMock(return_value=False)
+    api.bulk_read = AsyncMock(return_value=0)
     return api
 
 
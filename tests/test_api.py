@@ -0,0 +1,589 @@
+"""Tests for the Ambeo Soundbar API classes."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiohttp
+import pytest
+from aiohttp_asyncmdnsresolver.api import AsyncDualMDNSResolver
+
+from custom_components.ambeo_soundbar.api.exceptions import AmbeoConnectionError
+from custom_components.ambeo_soundbar.api.factory import (
+    AmbeoAPIFactory,
+    DeviceIdentity,
+)
+from custom_components.ambeo_soundbar.api.impl.espresso_api import AmbeoEspressoApi
+from custom_components.ambeo_soundbar.api.impl.generic_api import AmbeoApi
+from custom_components.ambeo_soundbar.api.impl.popcorn_api import AmbeoPopcornApi
+from custom_components.ambeo_soundbar.api.pool import AmbeoConnectionPool
+from custom_components.ambeo_soundbar.api.timing import RttEstimator
+
+
+def _popcorn():
+    return AmbeoPopcornApi("ambeo.local", 80, 5, None)
+
+
+def _espresso():
+    return AmbeoEspressoApi("ambeo.local", 80, 5, None)
+
+
+class TestProcessEvent:
+    """Tests for event routing through the compiled dispatch table."""
+
+    def test_base_path(self):
+        """Route a path shared by all models."""
+        api = _popcorn()
+        result = api.process_event(
+            "player:player/data/playTime", {"type": "i64_", "i64_": 1500}
+        )
+        assert result == {"play_time": 1500}
+
+    def test_sub_key(self):
+        """Descend into the typed value when the subscription has a sub_key."""
+        api = _popcorn()
+        result = api.process_event(
+            "bluetooth:state", {"bluetoothState": {"pairable": True}}
+        )
+        assert result == {"bluetooth_pairing": True}
+
+    def test_missing_value(self):
+        """Return no update when the typed value is absent."""
+        assert _popcorn().process_event("player:volume", {"type": "i32_"}) == {}
+
+    def test_unknown_path(self):
+        """Return no update for paths that are not subscribed."""
+        assert _popcorn().process_event("unknown:path", {"i32_": 1}) == {}
+
+    def test_espresso_brightness_maps_two_keys(self):
+        """Split the Espresso brightness composite into logo and display keys."""
+        result = _espresso().process_event(
+            AmbeoEspressoApi._BRIGHTNESS_PATH,
+            {"espressoBrightness": {"ambeologo": 40, "display": 60}},
+        )
+        assert result == {"logo_brightness": 40, "display_brightness": 60}
+
+    def test_capability_filtered_paths(self):
+        """Only subscribe to model paths the device supports."""
+        paths = _espresso().get_subscribed_paths()
+        assert "player:volume" in paths
+        assert AmbeoEspressoApi._BRIGHTNESS_PATH in paths
+        assert "ui:/settings/interface/ledBrightness" not in paths
+
+
+class TestSingleFlight:
+    """Tests for sharing identical in-flight read requests."""
+
+    async def test_concurrent_reads_share_one_request(self):
+        """Issue one HTTP request for identical concurrent getData calls."""
+        api = _espresso()
+        release = asyncio.Event()
+
+        async def fetch(url, *args, **kwargs):
+            await release.wait()
+            return {"value": {"espressoBrightness": {"ambeologo": 40, "display": 60}}}
+
+        api.fetch_data = AsyncMock(side_effect=fetch)
+        pending = asyncio.gather(
+            api.get_display_brightness(), api.get_logo_brightness()
+        )
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await pending == [60, 40]
+        assert api.fetch_data.await_count == 1
+        assert api.get_request_stats() == {
+            "issued": 1,
+            "coalesced": 1,
+            "memo_hits": 0,
+            "last_cycle_memo_hits": 0,
+            "bulk_rows": 0,
+        }
+
+    async def test_sequential_reads_not_shared(self):
+        """Issue a new request once the previous one has completed."""
+        api = _popcorn()
+        api.fetch_data = AsyncMock(return_value={"value": {"i32_": 30}})
+
+        assert await api.get_volume() == 30
+        assert await api.get_volume() == 30
+        assert api.fetch_data.await_count == 2
+
+    async def test_writes_never_shared(self):
+        """Send every setData request, even when identical."""
+        api = _popcorn()
+        api.fetch_data = AsyncMock(return_value=None)
+
+        await asyncio.gather(api.set_volume(30), api.set_volume(30))
+
+        assert api.fetch_data.await_count == 2
+        assert api.get_request_stats()["coalesced"] == 0
+
+    async def test_read_after_write_not_shared(self):
+        """Never answer a read issued after a write with an earlier read."""
+        api = _popcorn()
+        volume = {"value": 10}
+        release = asyncio.Event()
+
+        async def fetch(url, *args, **kwargs):
+            if url.startswith("setData"):
+                volume["value"] = 40
+                return None
+            value = volume["value"]
+            await release.wait()
+            return {"value": {"i32_": value}}
+
+        api.fetch_data = AsyncMock(side_effect=fetch)
+        early = asyncio.create_task(api.get_volume())
+        for _ in range(5):
+            await asyncio.sleep(0)
+        await api.set_volume(40)
+        late = asyncio.create_task(api.get_volume())
+        for _ in range(5):
+            await asyncio.sleep(0)
+        release.set()
+
+        assert await early == 10
+        assert await late == 40
+        assert api.get_request_stats()["coalesced"] == 0
+
+    async def test_error_propagates_to_all_callers(self):
+        """Raise the shared request's error in every waiting caller."""
+        api = _popcorn()
+        api.fetch_data = AsyncMock(side_effect=AmbeoConnectionError("offline"))
+
+        results = await asyncio.gather(
+            api.get_volume(), api.get_volume(), return_exceptions=True
+        )
+
+        assert all(isinstance(r, AmbeoConnectionError) for r in results)
+        assert api.fetch_data.await_count == 1
+
+
+class TestConnectionPool:
+    """Tests for the per-device connection pool."""
+
+    async def test_separate_connectors(self, hass):
+        """Use distinct, size-limited connectors for control and event traffic."""
+        with patch(
+            "custom_components.ambeo_soundbar.api.pool.zeroconf.async_get_async_zeroconf"
+        ):
+            pool = AmbeoConnectionPool(hass, control_connections=4, event_connections=1)
+        try:
+            assert pool.session.connector is not pool.event_session.connector
+            assert isinstance(pool.session.connector._resolver, AsyncDualMDNSResolver)
+            stats = pool.get_stats()
+            assert stats["control"]["limit"] == 4
+            assert stats["events"]["limit"] == 1
+            assert stats["control"]["open"] == 0
+            assert stats["control"]["reused"] == 0
+        finally:
+            await pool.async_close()
+
+    async def test_poll_uses_event_session(self):
+        """Send pollQueue requests through the event session."""
+        control, events = MagicMock(), MagicMock()
+        api = AmbeoPopcornApi("ambeo.local", 80, 5, control, events)
+        api.fetch_data = AsyncMock(return_value=[])
+
+        await api.poll_event_queue("queue")
+
+        assert api.fetch_data.await_args.kwargs["session"] is events
+
+    async def test_queue_management_uses_event_session(self):
+        """Keep modifyQueue requests off the control connections."""
+        control, events = MagicMock(), MagicMock()
+        api = AmbeoPopcornApi("ambeo.local", 80, 5, control, events)
+        api.fetch_data = AsyncMock(return_value="queue")
+
+        await api.create_event_queue(["player:volume"])
+        await api.modify_event_queue("queue", subscribe=["player:volume"])
+
+        assert all(
+            call.kwargs["session"] is events for call in api.fetch_data.await_args_list
+        )
+
+
+class TestAdaptiveTimeout:
+    """Tests for deriving request timeouts from measured round-trip times."""
+
+    def test_ceiling_before_samples(self):
+        """Use the configured timeout until a round trip has been measured."""
+        assert RttEstimator(0.5, 5).timeout == 5
+
+    def test_converges_to_floor(self):
+        """Shrink the timeout towards the floor for a fast, stable device."""
+        rtt = RttEstimator(0.5, 5)
+        for _ in range(50):
+            rtt.observe(0.02)
+        assert rtt.timeout == 0.5
+
+    def test_tracks_slow_device(self):
+        """Keep the timeout above the measured round-trip time."""
+        rtt = RttEstimator(0.5, 5)
+        for _ in range(50):
+            rtt.observe(1.5)
+        assert 1.5 < rtt.timeout < 5
+
+    def test_backoff_after_timeout(self):
+        """Double the timeout after a timeout and reset it on the next sample."""
+        rtt = RttEstimator(0.5, 5)
+        for _ in range(50):
+            rtt.observe(0.8)
+        base = rtt.timeout
+        rtt.on_timeout()
+        assert rtt.timeout == min(base * 2, 5)
+        assert rtt.as_dict()["timeouts"] == 1
+        rtt.observe(0.8)
+        assert rtt.timeout == pytest.approx(base, rel=1e-3)
+
+    async def test_fetch_uses_operation_class(self):
+        """Apply the estimator matching the request's function."""
+        session = MagicMock()
+        session.get.side_effect = aiohttp.ClientConnectionError
+        api = AmbeoPopcornApi("ambeo.local", 80, 5, session)
+        api._rtt["setData"].observe(2)
+
+        with pytest.raises(AmbeoConnectionError):
+            await api.fetch_data("setData?path=player:volume")
+        timeout = session.get.call_args.kwargs["timeout"]
+        assert timeout.total == 5
+        assert timeout.sock_read == api._rtt["setData"].timeout
+
+        with pytest.raises(AmbeoConnectionError):
+            await api.fetch_data("pollQueue?queueId=1", http_timeout=40)
+        timeout = session.get.call_args.kwargs["timeout"]
+        assert timeout.total == 40
+        assert timeout.sock_read is None
+
+
+class TestBootstrap:
+    """Tests for reading the device identity in a single round trip."""
+
+    async def test_identity_fetched_concurrently(self):
+        """Issue all identity reads before any of them completes."""
+        release = asyncio.Event()
+        values = {
+            "settings:/system/serialNumber": "SN123",
+            "settings:/system/productName": "AMBEO Soundbar Plus",
+            "systemmanager:/deviceName": "Living room",
+            "ui:settings/firmwareUpdate/currentVersion": "1.2.3",
+        }
+        requested = []
+
+        async def fetch(self, url, *args, **kwargs):
+            path = url.split("path=")[1].split("&")[0]
+            requested.append(path)
+            await release.wait()
+            return {"value": {"string_": values[path]}}
+
+        async def run():
+            with patch.object(AmbeoApi, "fetch_data", fetch):
+                return await AmbeoAPIFactory.bootstrap("ambeo.local", 80, 5, None)
+
+        pending = asyncio.ensure_future(run())
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert len(requested) == 4
+        release.set()
+
+        api, identity = await pending
+        assert isinstance(api, AmbeoPopcornApi)
+        assert identity == DeviceIdentity(
+            "SN123", "AMBEO Soundbar Plus", "Living room", "1.2.3"
+        )
+
+    def test_unsupported_model(self):
+        """Reject models without an API implementation."""
+        with pytest.raises(ValueError):
+            AmbeoAPIFactory.api_class_for_model("Unknown")
+
+
+class TestWantedKeys:
+    """Tests for limiting event subscriptions to the data keys in use."""
+
+    def test_filters_paths(self):
+        """Drop subscriptions whose data key is not wanted."""
+        api = _popcorn()
+        assert api.set_wanted_keys(frozenset({"volume"}))
+        assert api.get_subscribed_paths() == ["player:volume"]
+        assert api.get_subscribed_keys() == {"volume"}
+        assert api.process_event("player:mute", {"bool_": True}) == {}
+
+    def test_unchanged_paths(self):
+        """Report no change when the subscribed paths stay the same."""
+        api = _popcorn()
+        assert not api.set_wanted_keys(None)
+
+    def test_espresso_brightness_kept_for_either_key(self):
+        """Keep the composite brightness path while one of its keys is used."""
+        api = _espresso()
+        api.set_wanted_keys(frozenset({"display_brightness"}))
+        assert api.get_subscribed_paths() == [AmbeoEspressoApi._BRIGHTNESS_PATH]
+        assert api.get_subscribed_keys() == {"display_brightness"}
+
+    def test_partition_paths(self):
+        """Split the subscribed paths by the data keys they carry."""
+        api = _popcorn()
+        playback, rest = api.partition_subscribed_paths({"play_time", "player_data"})
+        assert sorted(playback) == [
+            "player:player/data/playTime",
+            "player:player/data/value",
+        ]
+        assert "player:volume" in rest
+        assert sorted(playback + rest) == sorted(api.get_subscribed_paths())
+
+
+class TestReadSubscribedPaths:
+    """Tests for reading subscribed paths as event updates."""
+
+    async def test_routes_values_and_skips_failures(self):
+        """Map each read through the dispatch table and drop failed reads."""
+        api = _popcorn()
+        responses = {
+            "player:volume": {"value": {"type": "i32_", "i32_": 25}},
+            "player:mute": AmbeoConnectionError("boom"),
+        }
+
+        async def execute(function, path, role):
+            result = responses[path]
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        api.execute_request = AsyncMock(side_effect=execute)
+
+        updates = await api.read_subscribed_paths(["player:volume", "player:mute"])
+
+        assert updates == {"volume": 25}
+        assert api.execute_request.await_count == 2
+
+
+class TestModifyEventQueue:
+    """Tests for changing the subscriptions of an existing event queue."""
+
+    async def test_subscribe_and_unsubscribe(self):
+        """Send both path lists for the given queue in one request."""
+        api = _popcorn()
+        api.fetch_data = AsyncMock(return_value="q1")
+
+        assert await api.modify_event_queue("q1", ["player:volume"], ["player:mute"])
+
+        url = api.fetch_data.await_args.args[0]
+        assert url.startswith("event/modifyQueue?queueId=q1&subscribe=")
+        assert "player%3Avolume" in url
+        assert "&unsubscribe=" in url
+        assert "player%3Amute" in url
+
+    async def test_rejected(self):
+        """Report failure so the caller can recreate the queue."""
+        api = _popcorn()
+        api.fetch_data = AsyncMock(side_effect=AmbeoConnectionError("gone"))
+
+        assert not await api.modify_event_queue("q1", ["player:volume"])
+
+
+class TestEspressoBrightnessCache:
+    """Tests for writing one half of the Espresso brightness composite."""
+
+    BRIGHTNESS = {"value": {"espressoBrightness": {"ambeologo": 40, "display": 60}}}
+
+    async def test_write_after_read_is_one_request(self):
+        """Reuse the polled composite instead of reading it before writing."""
+        api = _espresso()
+        api.fetch_data = AsyncMock(return_value=self.BRIGHTNESS)
+        await api.get_logo_brightness()
+        api.fetch_data.reset_mock()
+
+        await api.set_display_brightness(80)
+
+        assert api.fetch_data.await_count == 1
+        url = api.fetch_data.await_args.args[0]
+        assert url.startswith("setData?")
+        assert '"ambeologo": 40' in url
+        assert '"display": 80' in url
+
+    async def test_event_feeds_cache(self):
+        """Use the values from brightness events for the next write."""
+        api = _espresso()
+        api.fetch_data = AsyncMock(return_value=None)
+        api.process_event(
+            AmbeoEspressoApi._BRIGHTNESS_PATH,
+            {"espressoBrightness": {"ambeologo": 10, "display": 20}},
+        )
+
+        await api.set_logo_brightness(30)
+
+        url = api.fetch_data.await_args.args[0]
+        assert '"ambeologo": 30' in url
+        assert '"display": 20' in url
+        await api.set_display_brightness(50)
+        url = api.fetch_data.await_args.args[0]
+        assert '"ambeologo": 30' in url
+        assert api.fetch_data.await_count == 2
+
+    async def test_cold_write_reads_first(self):
+        """Read the composite once when nothing is known yet."""
+        api = _espresso()
+        api.fetch_data = AsyncMock(return_value=self.BRIGHTNESS)
+
+        await api.set_logo_brightness(30)
+
+        assert api.fetch_data.await_count == 2
+        assert api.fetch_data.await_args_list[0].args[0].startswith("getData?")
+
+    async def test_old_composite_read_again(self):
+        """Read the composite again once it is too old and no events arrive."""
+        api = _espresso()
+        api.fetch_data = AsyncMock(return_value=self.BRIGHTNESS)
+        await api.get_logo_brightness()
+        api._brightness_at -= AmbeoEspressoApi.BRIGHTNESS_CACHE_TTL + 1
+        api.fetch_data.reset_mock()
+
+        await api.set_display_brightness(80)
+
+        assert api.fetch_data.await_count == 2
+        assert api.fetch_data.await_args_list[0].args[0].startswith("getData?")
+
+    async def test_old_composite_trusted_while_events_live(self):
+        """Reuse an old composite while its events are being delivered."""
+        api = _espresso()
+        api.fetch_data = AsyncMock(return_value=self.BRIGHTNESS)
+        await api.get_logo_brightness()
+        api.set_live_event_paths([AmbeoEspressoApi._BRIGHTNESS_PATH])
+        api._brightness_at -= AmbeoEspressoApi.BRIGHTNESS_CACHE_TTL + 1
+        api.fetch_data.reset_mock()
+
+        await api.set_display_brightness(80)
+
+        assert api.fetch_data.await_count == 1
+        assert api.fetch_data.await_args.args[0].startswith("setData?")
+
+        # Once the queue is gone the age limit applies again.
+        api.set_live_event_paths([])
+        api._brightness_at -= AmbeoEspressoApi.BRIGHTNESS_CACHE_TTL + 1
+        api.fetch_data.reset_mock()
+
+        await api.set_logo_brightness(10)
+
+        assert api.fetch_data.await_count == 2
+
+    async def test_old_composite_dropped_when_events_start(self):
+        """Forget an old composite when its queue goes live, as it missed changes."""
+        api = _espresso()
+        api.fetch_data = AsyncMock(return_value=self.BRIGHTNESS)
+        await api.get_logo_brightness()
+        api._brightness_at -= AmbeoEspressoApi.BRIGHTNESS_CACHE_TTL + 1
+        api.set_live_event_paths([AmbeoEspressoApi._BRIGHTNESS_PATH])
+        api.fetch_data.reset_mock()
+
+        await api.set_display_brightness(80)
+
+        assert api.fetch_data.await_count == 2
+
+
+class TestRefreshMemo:
+    """Tests for sharing reads within one refresh cycle."""
+
+    async def test_sequential_reads_shared_in_cycle(self):
+        """Send a repeated read once per cycle and count the saved reads."""
+        api = _popcorn()
+        api.fetch_data = AsyncMock(return_value={"value": {"i32_": 30}})
+
+        with api.refresh_cycle():
+            assert await api.get_volume() == 30
+            assert await api.get_volume() == 30
+
+        assert api.fetch_data.await_count == 1
+        assert api.get_request_stats()["last_cycle_memo_hits"] == 1
+
+        await api.get_volume()
+        assert api.fetch_data.await_count == 2
+
+    async def test_write_invalidates(self):
+        """Read again after a write made during the cycle."""
+        api = _popcorn()
+        api.fetch_data = AsyncMock(return_value={"value": {"i32_": 30}})
+
+        with api.refresh_cycle():
+            await api.get_volume()
+            await api.set_volume(40)
+            await api.get_volume()
+
+        assert api.fetch_data.await_count == 3
+        assert api.get_request_stats()["memo_hits"] == 0
+
+    async def test_failed_reads_not_memoized(self):
+        """Retry a read that returned nothing."""
+        api = _popcorn()
+        api.fetch_data = AsyncMock(return_value=None)
+
+        with api.refresh_cycle():
+            await api.get_volume()
+            await api.get_volume()
+
+        assert api.fetch_data.await_count == 2
+
+
+class TestBulkRead:
+    """Tests for priming a refresh cycle with getRows of parent nodes."""
+
+    ROWS = {
+        "rows": [
+            {
+                "path": "settings:/popcorn/audio/nightModeStatus",
+                "value": {"type": "bool_", "bool_": True},
+            },
+            {"path": "settings:/popcorn/audio/voiceEnhancement"},
+            {"title": "no path", "value": {"bool_": False}},
+        ]
+    }
+
+    async def test_rows_answer_getters(self):
+        """Answer getters from the rows and read the rest individually."""
+        api = _popcorn()
+
+        async def fetch(url, *args, **kwargs):
+            if url.startswith("getRows"):
+                return self.ROWS
+            return {"value": {"bool_": False}}
+
+        api.fetch_data = AsyncMock(side_effect=fetch)
+
+        with api.refresh_cycle():
+            assert await api.bulk_read(["night_mode", "voice_enhancement"]) == 1
+            assert await api.get_night_mode() is True
+            assert await api.get_voice_enhancement() is False
+
+        assert api.fetch_data.await_count == 2
+        assert api.fetch_data.await_args_list[0].args[0].startswith("getRows?")
+        assert api.get_request_stats()["bulk_rows"] == 1
+
+    async def test_outside_cycle_is_noop(self):
+        """Skip the bulk read when no refresh cycle would use it."""
+        api = _popcorn()
+        api.fetch_data = AsyncMock()
+
+        assert await api.bulk_read(["night_mode", "voice_enhancement"]) == 0
+        api.fetch_data.assert_not_awaited()
+
+    async def test_single_due_setting_not_bulk_read(self):
+        """Read a parent only when several due settings sit under it."""
+        api = _popcorn()
+        api.fetch_data = AsyncMock()
+
+        with api.refresh_cycle():
+            # Hot keys only, then one setting per parent.
+            assert await api.bulk_read(["volume", "muted", "state"]) == 0
+            assert await api.bulk_read(["night_mode", "led_bar_brightness"]) == 0
+
+        api.fetch_data.assert_not_awaited()
+
+    async def test_espresso_brightness_is_one_setting(self):
+        """Count the two brightness keys as the single path they share."""
+        api = _espresso()
+        api.fetch_data = AsyncMock()
+
+        with api.refresh_cycle():
+            await api.bulk_read(["display_brightness", "logo_brightness"])
+
+        api.fetch_data.assert_not_awaited()
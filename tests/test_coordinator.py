@@ -0,0 +1,918 @@
+"""Tests for the Ambeo Soundbar data update coordinator."""
+
+import asyncio
+import time
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from custom_components.ambeo_soundbar.api.const import Capability
+from custom_components.ambeo_soundbar.api.exceptions import AmbeoConnectionError
+from custom_components.ambeo_soundbar.api.impl.espresso_api import AmbeoEspressoApi
+from custom_components.ambeo_soundbar.api.impl.popcorn_api import AmbeoPopcornApi
+from custom_components.ambeo_soundbar.coordinator import (
+    AmbeoCoordinator,
+    RefreshTier,
+    _EventShardStats,
+    compile_refresh_plan,
+)
+
+CORE_KEYS = {
+    "volume",
+    "muted",
+    "state",
+    "current_source",
+    "current_preset",
+    "player_data",
+}
+
+
+def _make_coordinator(hass, api):
+    return AmbeoCoordinator(hass, api, [], [])
+
+
+class TestEventFirstPolling:
+    """Tests for skipping event-driven keys while the event queue is healthy."""
+
+    async def test_full_refresh_without_event_queue(self, hass, mock_api):
+        """Fetch every core key when no event queue is running."""
+        mock_api.get_subscribed_keys.return_value = CORE_KEYS
+        coordinator = _make_coordinator(hass, mock_api)
+
+        data = await coordinator._async_update_data()
+
+        mock_api.get_volume.assert_awaited_once()
+        mock_api.player_data.assert_awaited_once()
+        assert data["volume"] == 50
+
+    async def test_event_first_skips_subscribed_keys(self, hass, mock_api):
+        """Keep previous values for subscribed keys and only poll the others."""
+        mock_api.get_subscribed_keys.return_value = CORE_KEYS - {"muted"}
+        coordinator = _make_coordinator(hass, mock_api)
+        coordinator.data = {"volume": 10, "muted": True, "state": "online"}
+        coordinator._event_queue_healthy = True
+        coordinator._last_full_refresh = time.monotonic()
+
+        data = await coordinator._async_update_data()
+
+        mock_api.get_volume.assert_not_awaited()
+        mock_api.is_mute.assert_awaited_once()
+        assert data["volume"] == 10
+        assert data["muted"] is False
+
+    async def test_reconciliation_runs_full_sweep(self, hass, mock_api):
+        """Fetch everything again once the reconciliation interval has elapsed."""
+        mock_api.get_subscribed_keys.return_value = CORE_KEYS
+        coordinator = _make_coordinator(hass, mock_api)
+        coordinator.data = {"volume": 10}
+        coordinator._event_queue_healthy = True
+        coordinator._last_full_refresh = (
+            time.monotonic() - AmbeoCoordinator.RECONCILE_INTERVAL - 1
+        )
+
+        data = await coordinator._async_update_data()
+
+        mock_api.get_volume.assert_awaited_once()
+        assert data["volume"] == 50
+
+    async def test_queue_loss_requests_full_refresh(self, hass, mock_api):
+        """Drop back to full polling as soon as the event queue breaks."""
+        coordinator = _make_coordinator(hass, mock_api)
+        coordinator._event_queue_healthy = True
+        coordinator._last_full_refresh = time.monotonic()
+        coordinator.async_request_refresh = AsyncMock()
+
+        await coordinator._async_event_queue_lost()
+
+        assert coordinator.event_queue_healthy is False
+        assert coordinator._is_full_refresh_due() is True
+        coordinator.async_request_refresh.assert_awaited_once()
+
+
+class TestRefreshMerge:
+    """Tests for keeping changes that land while a refresh is reading."""
+
+    def _block_refresh(self, mock_api):
+        """Hold the next refresh in bulk_read until the returned event is set."""
+        reading, release = asyncio.Event(), asyncio.Event()
+
+        async def bulk_read(keys):
+            reading.set()
+            await release.wait()
+            return 0
+
+        mock_api.bulk_read = AsyncMock(side_effect=bulk_read)
+        return reading, release
+
+    async def test_event_during_refresh_kept(self, hass, mock_api):
+        """Keep an event that arrives while an event-first refresh reads."""
+        mock_api.get_subscribed_keys.return_value = CORE_KEYS
+        coordinator = _make_coordinator(hass, mock_api)
+        coordinator.data = {"volume": 10, "muted": False, "state": "online"}
+        coordinator._event_queue_healthy = True
+        coordinator._last_full_refresh = time.monotonic()
+        reading, release = self._block_refresh(mock_api)
+
+        refresh = asyncio.create_task(coordinator._async_update_data())
+        await reading.wait()
+        coordinator._apply_event_updates({"volume": 42})
+        release.set()
+        data = await refresh
+
+        assert data["volume"] == 42
+
+    async def test_write_during_refresh_kept(self, hass, mock_api):
+        """Keep an optimistic write made after a fetched key's read started."""
+        coordinator = _make_coordinator(hass, mock_api)
+        coordinator.data = {"volume": 10, "muted": False, "state": "online"}
+        coordinator._last_full_refresh = time.monotonic()
+        reading, release = self._block_refresh(mock_api)
+
+        refresh = asyncio.create_task(coordinator._async_update_data())
+        await reading.wait()
+        coordinator._optimistic_update("volume", 30)
+        release.set()
+        data = await refresh
+
+        mock_api.get_volume.assert_awaited_once()
+        assert data["volume"] == 30
+        assert data["muted"] is False
+
+    async def test_change_before_refresh_overwritten(self, hass, mock_api):
+        """Take the fetched value for a key changed before its read started."""
+        coordinator = _make_coordinator(hass, mock_api)
+        coordinator.data = {"volume": 10, "muted": False, "state": "online"}
+        coordinator._last_full_refresh = time.monotonic()
+        coordinator._optimistic_update("volume", 30)
+
+        data = await coordinator._async_update_data()
+
+        assert data["volume"] == 50
+
+
+class TestEventBatching:
+    """Tests for merging one poll's events into a single notification."""
+
+    async def test_single_notification_for_batch(self, hass, mock_api):
+        """Notify listeners once for several changed keys."""
+        coordinator = _make_coordinator(hass, mock_api)
+        coordinator.data = {"volume": 10, "muted": False}
+        coordinator.async_update_listeners = MagicMock()
+
+        coordinator._apply_event_updates({"volume": 20, "muted": True})
+
+        coordinator.async_update_listeners.assert_called_once()
+        assert coordinator.data == {"volume": 20, "muted": True}
+
+    async def test_unchanged_values_skipped(self, hass, mock_api):
+        """Do not notify listeners when nothing changed."""
+        coordinator = _make_coordinator(hass, mock_api)
+        coordinator.data = {"volume": 10, "play_time": 500}
+        coordinator.async_update_listeners = MagicMock()
+
+        coordinator._apply_event_updates({"volume": 10, "play_time": 500})
+
+        coordinator.async_update_listeners.assert_not_called()
+        assert "play_time_updated_at" not in coordinator.data
+
+    async def test_play_time_stamps_update_time(self, hass, mock_api):
+        """Record when play_time last changed."""
+        coordinator = _make_coordinator(hass, mock_api)
+        coordinator.data = {"play_time": 500}
+
+        coordinator._apply_event_updates({"play_time": 1500})
+
+        assert coordinator.data["play_time"] == 1500
+        assert "play_time_updated_at" in coordinator.data
+
+
+class TestKeyedListeners:
+    """Tests for notifying only the listeners whose data keys changed."""
+
+    async def test_only_affected_listeners_notified(self, hass, mock_api):
+        """Skip listeners whose context does not include a changed key."""
+        coordinator = _make_coordinator(hass, mock_api)
+        coordinator.data = {"volume": 10, "led_bar_brightness": 50}
+        volume_cb, led_cb, any_cb = MagicMock(), MagicMock(), MagicMock()
+        coordinator.async_add_listener(volume_cb, frozenset({"volume"}))
+        coordinator.async_add_listener(led_cb, frozenset({"led_bar_brightness"}))
+        coordinator.async_add_listener(any_cb)
+        coordinator.async_update_listeners()
+        for cb in (volume_cb, led_cb, any_cb):
+            cb.reset_mock()
+
+        coordinator.data["volume"] = 20
+        coordinator.async_update_listeners()
+
+        volume_cb.assert_called_once()
+        led_cb.assert_not_called()
+        any_cb.assert_called_once()
+        await coordinator.async_shutdown()
+
+    async def test_no_change_notifies_nobody(self, hass, mock_api):
+        """Do not notify anyone when the data is unchanged."""
+        coordinator = _make_coordinator(hass, mock_api)
+        coordinator.data = {"volume": 10}
+        listener = MagicMock()
+        coordinator.async_add_listener(listener)
+        coordinator.async_update_listeners()
+        listener.reset_mock()
+
+        coordinator.async_update_listeners()
+
+        listener.assert_not_called()
+        await coordinator.async_shutdown()
+
+    async def test_availability_change_notifies_all(self, hass, mock_api):
+        """Notify every listener when the update success state flips."""
+        coordinator = _make_coordinator(hass, mock_api)
+        coordinator.data = {"volume": 10}
+        listener = MagicMock()
+        coordinator.async_add_listener(listener, frozenset({"led_bar_brightness"}))
+        coordinator.async_update_listeners()
+        listener.reset_mock()
+
+        coordinator.last_update_success = False
+        coordinator.async_update_listeners()
+
+        listener.assert_called_once()
+        await coordinator.async_shutdown()
+
+
+class TestLatestWinsWrites:
+    """Tests for coalescing slider-driven writes per data key."""
+
+    async def test_intermediate_values_elided(self, hass, mock_api):
+        """Send only the in-flight and the latest value while a write is slow."""
+        release = asyncio.Event()
+        sent = []
+
+        async def set_volume(value):
+            sent.append(value)
+            await release.wait()
+
+        mock_api.set_volume = AsyncMock(side_effect=set_volume)
+        coordinator = _make_coordinator(hass, mock_api)
+        coordinator.data = {"volume": 10}
+
+        first = asyncio.create_task(coordinator.async_set_volume(20))
+        await asyncio.sleep(0)
+        await coordinator.async_set_volume(30)
+        await coordinator.async_set_volume(40)
+        assert coordinator.data["volume"] == 40
+        release.set()
+        await first
+
+        assert sent == [20, 40]
+        assert coordinator.writes_elided == 1
+
+    async def test_failed_write_drops_queued_value(self, hass, mock_api):
+        """Propagate the error, drop the queued value and restore the old one."""
+        release = asyncio.Event()
+
+        async def set_volume(value):
+            await release.wait()
+            raise AmbeoConnectionError("offline")
+
+        mock_api.set_volume = AsyncMock(side_effect=set_volume)
+        coordinator = _make_coordinator(hass, mock_api)
+        coordinator.data = {"volume": 10}
+
+        first = asyncio.create_task(coordinator.async_set_volume(20))
+        await asyncio.sleep(0)
+        await coordinator.async_set_volume(30)
+        release.set()
+
+        with pytest.raises(AmbeoConnectionError):
+            await first
+        assert mock_api.set_volume.await_count == 1
+        assert not coordinator._writes_in_flight
+        assert not coordinator._queued_writes
+        assert coordinator.data["volume"] == 10
+
+
+class TestFailFastRefresh:
+    """Tests for aborting refreshes early when the device is unreachable."""
+
+    async def test_probe_failure_aborts_refresh(self, hass, mock_api):
+        """Skip every other request when the liveness probe fails."""
+        mock_api.get_state = AsyncMock(side_effect=AmbeoConnectionError("offline"))
+        coordinator = _make_coordinator(hass, mock_api)
+
+        with pytest.raises(UpdateFailed):
+            await coordinator._async_update_data()
+
+        mock_api.get_volume.assert_not_awaited()
+        mock_api.player_data.assert_not_awaited()
+
+    async def test_backoff_grows_and_resets(self, hass, mock_api):
+        """Double the interval per failure and restore it after a success."""
+        mock_api.get_state = AsyncMock(side_effect=AmbeoConnectionError("offline"))
+        coordinator = _make_coordinator(hass, mock_api)
+
+        for _ in range(2):
+            with pytest.raises(UpdateFailed):
+                await coordinator._async_update_data()
+        assert coordinator.update_interval == timedelta(seconds=60)
+
+        for _ in range(5):
+            with pytest.raises(UpdateFailed):
+                await coordinator._async_update_data()
+        assert coordinator.update_interval == timedelta(
+            seconds=AmbeoCoordinator.MAX_BACKOFF_INTERVAL
+        )
+
+        mock_api.get_state.side_effect = None
+        mock_api.get_state.return_value = "online"
+        await coordinator._async_update_data()
+        assert coordinator.update_interval == timedelta(seconds=30)
+
+
+class TestSourceLoading:
+    """Tests for loading sources and presets after construction."""
+
+    async def test_load_rebuilds_lookups(self, hass, mock_api):
+        """Resolve titles and IDs once the lists have been loaded."""
+        mock_api.get_all_sources = AsyncMock(
+            return_value=[{"id": "hdmi1", "title": "HDMI 1"}]
+        )
+        mock_api.get_all_presets = AsyncMock(
+            return_value=[{"id": 1, "title": "Movies"}]
+        )
+        coordinator = _make_coordinator(hass, mock_api)
+        assert coordinator.get_source_title("hdmi1") is None
+
+        await coordinator.async_load_sources_and_presets()
+
+        assert coordinator.get_source_title("hdmi1") == "HDMI 1"
+        assert coordinator.get_source_id("HDMI 1") == "hdmi1"
+        assert coordinator.get_preset_title(1) == "Movies"
+        assert coordinator.get_preset_id("Movies") == 1
+
+    async def test_load_tolerates_missing_lists(self, hass, mock_api):
+        """Fall back to empty lists when the device returns nothing."""
+        mock_api.get_all_sources = AsyncMock(return_value=None)
+        mock_api.get_all_presets = AsyncMock(return_value=None)
+        coordinator = _make_coordinator(hass, mock_api)
+
+        await coordinator.async_load_sources_and_presets()
+
+        assert coordinator.sources == []
+        assert coordinator.presets == []
+
+
+class TestSnapshot:
+    """Tests for restoring the last known data on startup."""
+
+    async def test_restored_data_stale_until_full_refresh(self, hass, mock_api):
+        """Serve restored data, flagged stale until a full sweep succeeds."""
+        coordinator = _make_coordinator(hass, mock_api)
+        coordinator.restore_snapshot({"volume": 20, "muted": True})
+
+        assert coordinator.data["volume"] == 20
+        assert coordinator.data_is_stale
+
+        coordinator.data = await coordinator._async_update_data()
+
+        assert coordinator.data["volume"] == 50
+        assert not coordinator.data_is_stale
+
+    async def test_listeners_notified_when_no_longer_stale(self, hass, mock_api):
+        """Notify keyed listeners once the data is confirmed, even if unchanged."""
+        mock_api.get_volume = AsyncMock(return_value=20)
+        coordinator = _make_coordinator(hass, mock_api)
+        coordinator.restore_snapshot({"volume": 20})
+        coordinator.async_set_updated_data(coordinator.data)
+        listener = MagicMock()
+        coordinator.async_add_listener(listener, frozenset({"volume"}))
+
+        coordinator.async_set_updated_data(await coordinator._async_update_data())
+
+        listener.assert_called_once()
+        await coordinator.async_shutdown()
+
+    async def test_snapshot_excludes_volatile_keys(self, hass, mock_api):
+        """Leave playback position out of the persisted data."""
+        coordinator = _make_coordinator(hass, mock_api)
+        coordinator.data = {
+            "volume": 20,
+            "play_time": 1500,
+            "play_time_updated_at": "now",
+        }
+
+        assert coordinator.get_snapshot() == {"volume": 20}
+
+
+class TestTieredPolling:
+    """Tests for refreshing each feature tier on its own schedule."""
+
+    async def _refreshed(self, hass, mock_api):
+        mock_api.get_night_mode = AsyncMock(return_value=True)
+        mock_api.get_sound_feedback = AsyncMock(return_value=True)
+        coordinator = _make_coordinator(hass, mock_api)
+        coordinator.data = await coordinator._async_update_data()
+        mock_api.reset_mock()
+        return coordinator
+
+    async def test_full_refresh_fetches_all_tiers(self, hass, mock_api):
+        """Fetch hot, warm and cold features on the first refresh."""
+        coordinator = await self._refreshed(hass, mock_api)
+
+        assert coordinator.data["night_mode"] is True
+        assert coordinator.data["sound_feedback"] is True
+        assert coordinator.data_is_stale is False
+
+    async def test_hot_only_between_intervals(self, hass, mock_api):
+        """Only poll hot features while warm and cold ones are still fresh."""
+        coordinator = await self._refreshed(hass, mock_api)
+
+        data = await coordinator._async_update_data()
+
+        mock_api.get_volume.assert_awaited_once()
+        mock_api.get_night_mode.assert_not_awaited()
+        mock_api.get_sound_feedback.assert_not_awaited()
+        assert data["night_mode"] is True
+        assert data["sound_feedback"] is True
+
+    async def test_warm_tier_due(self, hass, mock_api):
+        """Poll warm features again once their interval has elapsed."""
+        coordinator = await self._refreshed(hass, mock_api)
+        coordinator._tier_refreshed_at[RefreshTier.WARM] -= (
+            AmbeoCoordinator.TIER_INTERVALS[RefreshTier.WARM]
+        )
+
+        await coordinator._async_update_data()
+
+        mock_api.get_night_mode.assert_awaited_once()
+        mock_api.get_sound_feedback.assert_not_awaited()
+
+    async def test_events_during_hot_refresh_kept(self, hass, mock_api):
+        """Keep warm and cold keys changed while a hot-only refresh reads."""
+        coordinator = await self._refreshed(hass, mock_api)
+        reading, release = asyncio.Event(), asyncio.Event()
+
+        async def bulk_read(keys):
+            reading.set()
+            await release.wait()
+            return 0
+
+        mock_api.bulk_read = AsyncMock(side_effect=bulk_read)
+
+        refresh = asyncio.create_task(coordinator._async_update_data())
+        await reading.wait()
+        coordinator._apply_event_updates({"night_mode": False})
+        coordinator._optimistic_update("sound_feedback", False)
+        release.set()
+        data = await refresh
+
+        mock_api.get_night_mode.assert_not_awaited()
+        assert data["night_mode"] is False
+        assert data["sound_feedback"] is False
+
+    async def test_unavailable_feature_dropped(self, hass, mock_api):
+        """Drop a refreshed key whose fetch no longer returns a value."""
+        coordinator = await self._refreshed(hass, mock_api)
+        coordinator._tier_refreshed_at[RefreshTier.WARM] -= (
+            AmbeoCoordinator.TIER_INTERVALS[RefreshTier.WARM]
+        )
+        mock_api.get_night_mode.side_effect = AmbeoConnectionError("x")
+
+        data = await coordinator._async_update_data()
+
+        assert "night_mode" not in data
+
+
+class TestFeatureHealth:
+    """Tests for pausing optional features that keep failing."""
+
+    async def test_failing_feature_paused(self, hass, mock_api):
+        """Stop requesting a feature after repeated failures."""
+        mock_api.get_night_mode = AsyncMock(side_effect=AmbeoConnectionError("x"))
+        coordinator = _make_coordinator(hass, mock_api)
+
+        for _ in range(AmbeoCoordinator.FEATURE_FAILURE_THRESHOLD + 2):
+            coordinator._last_full_refresh = None
+            coordinator.data = await coordinator._async_update_data()
+
+        assert (
+            mock_api.get_night_mode.await_count
+            == AmbeoCoordinator.FEATURE_FAILURE_THRESHOLD
+        )
+        health = coordinator.get_feature_health()["night_mode"]
+        assert health["failures"] == AmbeoCoordinator.FEATURE_FAILURE_THRESHOLD
+        assert health["paused_for"] == AmbeoCoordinator.FEATURE_PAUSE_BASE
+
+    async def test_pause_grows_and_resets(self, hass, mock_api):
+        """Double the pause per failure and forget failures after a success."""
+        mock_api.get_night_mode = AsyncMock(side_effect=AmbeoConnectionError("x"))
+        coordinator = _make_coordinator(hass, mock_api)
+
+        for _ in range(AmbeoCoordinator.FEATURE_FAILURE_THRESHOLD + 1):
+            # Let the pause run out before each refresh.
+            for health in coordinator._feature_health.values():
+                health.paused_until = 0.0
+            coordinator._last_full_refresh = None
+            coordinator.data = await coordinator._async_update_data()
+        health = coordinator.get_feature_health()["night_mode"]
+        assert health["paused_for"] == 2 * AmbeoCoordinator.FEATURE_PAUSE_BASE
+
+        coordinator._feature_health["night_mode"].paused_until = 0.0
+        mock_api.get_night_mode.side_effect = None
+        mock_api.get_night_mode.return_value = True
+        coordinator._last_full_refresh = None
+        data = await coordinator._async_update_data()
+
+        assert data["night_mode"] is True
+        assert "night_mode" not in coordinator.get_feature_health()
+
+    async def test_unsupported_feature_removed(self, hass, mock_api):
+        """Never request a feature again once it raised NotImplementedError."""
+        mock_api.get_night_mode = AsyncMock(side_effect=NotImplementedError)
+        coordinator = _make_coordinator(hass, mock_api)
+
+        for _ in range(2):
+            coordinator._last_full_refresh = None
+            coordinator.data = await coordinator._async_update_data()
+
+        mock_api.get_night_mode.assert_awaited_once()
+        assert coordinator.get_feature_health()["night_mode"]["unsupported"]
+
+
+class TestRefreshPlan:
+    """Tests for the refresh plan compiled per device."""
+
+    def test_capability_filtered(self):
+        """Only plan optional features the device supports."""
+        plan = compile_refresh_plan(AmbeoEspressoApi("ambeo.local", 80, 5, None))
+        keys = {p.feature.data_key for p in plan.optional}
+
+        assert "display_brightness" in keys
+        assert "led_bar_brightness" not in keys
+        assert plan.probe.feature.data_key == "state"
+        assert "state" not in {p.feature.data_key for p in plan.core}
+
+    def test_bound_getters(self):
+        """Resolve each getter once, bound to the device's API."""
+        api = AmbeoPopcornApi("ambeo.local", 80, 5, None)
+        plan = compile_refresh_plan(api)
+
+        volume = next(p for p in plan.core if p.feature.data_key == "volume")
+        assert volume.fetch == api.get_volume
+
+    async def test_rebuild_after_capability_change(self, hass, mock_api):
+        """Pick up features that became available."""
+        mock_api.capabilities = []
+        coordinator = _make_coordinator(hass, mock_api)
+        assert "eco_mode" not in {
+            p.feature.data_key for p in coordinator._plan.optional
+        }
+
+        mock_api.capabilities = [Capability.ECO_MODE]
+        coordinator.rebuild_refresh_plan()
+
+        assert "eco_mode" in {p.feature.data_key for p in coordinator._plan.optional}
+
+
+class TestPruning:
+    """Tests for polling only the keys used by registered entities."""
+
+    def _plan_keys(self, coordinator):
+        plan = coordinator._plan
+        return {p.feature.data_key for p in (plan.probe, *plan.core, *plan.optional)}
+
+    async def test_prunes_to_listener_keys(self, hass, mock_api):
+        """Poll and subscribe only to keys some listener depends on."""
+        mock_api.set_wanted_keys.return_value = False
+        coordinator = _make_coordinator(hass, mock_api)
+        coordinator.async_add_listener(lambda: None, frozenset({"volume"}))
+        coordinator.async_add_listener(lambda: None)
+
+        coordinator.async_enable_pruning()
+
+        assert self._plan_keys(coordinator) == {"state", "volume"}
+        mock_api.set_wanted_keys.assert_called_with(frozenset({"state", "volume"}))
+        assert "night_mode" in coordinator.get_pruned_keys()
+        await coordinator.async_shutdown()
+
+    async def test_follows_listener_changes(self, hass, mock_api):
+        """Re-add keys when an entity appears and drop them when it goes."""
+        mock_api.set_wanted_keys.return_value = False
+        coordinator = _make_coordinator(hass, mock_api)
+        coordinator.async_add_listener(lambda: None, frozenset({"volume"}))
+        coordinator.async_enable_pruning()
+
+        remove = coordinator.async_add_listener(lambda: None, frozenset({"night_mode"}))
+        await asyncio.sleep(0)
+        assert "night_mode" in self._plan_keys(coordinator)
+
+        remove()
+        await asyncio.sleep(0)
+        assert "night_mode" not in self._plan_keys(coordinator)
+        await coordinator.async_shutdown()
+
+    async def test_no_pruning_before_enabled(self, hass, mock_api):
+        """Poll every supported key until the platforms are set up."""
+        coordinator = _make_coordinator(hass, mock_api)
+        coordinator.async_add_listener(lambda: None, frozenset({"volume"}))
+        await asyncio.sleep(0)
+
+        assert "night_mode" in self._plan_keys(coordinator)
+        mock_api.set_wanted_keys.assert_not_called()
+        await coordinator.async_shutdown()
+
+    async def test_resubscribes_when_paths_change(self, hass, mock_api):
+        """Update the event subscriptions when the subscribed paths change."""
+        mock_api.set_wanted_keys.return_value = True
+        coordinator = _make_coordinator(hass, mock_api)
+        coordinator._event_listener_wanted = True
+        coordinator._async_update_subscriptions = AsyncMock()
+        coordinator.async_add_listener(lambda: None, frozenset({"volume"}))
+
+        coordinator.async_enable_pruning()
+        await hass.async_block_till_done()
+
+        coordinator._async_update_subscriptions.assert_awaited_once()
+        await coordinator.async_shutdown()
+
+
+class TestEventShards:
+    """Tests for splitting playback events onto their own event queue."""
+
+    PLAYBACK = ["player:player/data/value", "player:player/data/playTime"]
+    CONTROL = ["player:volume", "player:mute"]
+
+    def _setup_api(self, mock_api):
+        mock_api.get_subscribed_paths.return_value = self.PLAYBACK + self.CONTROL
+        mock_api.partition_subscribed_paths.return_value = (
+            self.PLAYBACK,
+            self.CONTROL,
+        )
+        mock_api.create_event_queue = AsyncMock(side_effect=lambda paths: paths[0])
+        never = asyncio.Event()
+
+        async def poll(queue_id, timeout_ms):
+            await never.wait()
+
+        mock_api.poll_event_queue = AsyncMock(side_effect=poll)
+
+    async def test_single_queue_by_default(self, hass, mock_api):
+        """Subscribe every path on one queue unless splitting is enabled."""
+        self._setup_api(mock_api)
+        coordinator = _make_coordinator(hass, mock_api)
+
+        assert coordinator._event_shards() == {"all": self.PLAYBACK + self.CONTROL}
+
+    async def test_split_queues(self, hass, mock_api):
+        """Poll playback and control paths on separate queues."""
+        self._setup_api(mock_api)
+        coordinator = AmbeoCoordinator(
+            hass, mock_api, [], [], split_playback_events=True
+        )
+
+        await coordinator.async_start_event_listener()
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+        created = [c.args[0] for c in mock_api.create_event_queue.await_args_list]
+        assert sorted(created) == sorted([self.PLAYBACK, self.CONTROL])
+        assert coordinator.event_queue_healthy
+        assert set(coordinator.get_event_stats()) == {"playback", "control"}
+
+        await coordinator.async_stop()
+        assert not coordinator.event_queue_healthy
+
+    async def test_losing_one_queue_falls_back(self, hass, mock_api):
+        """Poll fully again as soon as any of the queues is lost."""
+        self._setup_api(mock_api)
+        coordinator = AmbeoCoordinator(
+            hass, mock_api, [], [], split_playback_events=True
+        )
+        coordinator.async_request_refresh = AsyncMock()
+        await coordinator.async_start_event_listener()
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+        await coordinator._async_event_queue_lost("playback")
+
+        assert not coordinator.event_queue_healthy
+        coordinator.async_request_refresh.assert_awaited_once()
+        await coordinator.async_stop()
+
+    async def test_delivery_latency_per_queue(self, hass, mock_api):
+        """Time the delivery of polled batches on queues without writes too."""
+        self._setup_api(mock_api)
+        never = asyncio.Event()
+        delivered = set()
+
+        async def poll(queue_id, timeout_ms):
+            if queue_id in delivered:
+                await never.wait()
+            delivered.add(queue_id)
+            return [{"itemType": "update", "path": queue_id, "itemValue": {"i32_": 1}}]
+
+        mock_api.poll_event_queue = AsyncMock(side_effect=poll)
+        mock_api.process_event = MagicMock(return_value={"play_time": 1})
+        coordinator = AmbeoCoordinator(
+            hass, mock_api, [], [], split_playback_events=True
+        )
+        coordinator.data = {"play_time": 0}
+
+        await coordinator.async_start_event_listener()
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+        stats = coordinator.get_event_stats()
+        assert stats["playback"]["deliveries"] == 1
+        assert stats["control"]["deliveries"] == 1
+        assert stats["playback"]["echoes"] == 0
+        assert stats["playback"]["delivery_mean_ms"] is not None
+        await coordinator.async_stop()
+
+    async def test_write_echo_latency(self, hass, mock_api):
+        """Time the event confirming a write, per queue."""
+        mock_api.set_volume = AsyncMock()
+        coordinator = _make_coordinator(hass, mock_api)
+        coordinator.data = {"volume": 10}
+        await coordinator.async_set_volume(20)
+        coordinator._write_started["volume"] -= 0.05
+        stats = _EventShardStats(paths=1)
+
+        coordinator._apply_event_updates({"volume": 20}, stats)
+
+        result = stats.as_dict()
+        assert result["echoes"] == 1
+        assert 50 <= result["echo_mean_ms"] < 1000
+
+
+class TestPipelinedEvents:
+    """Tests for polling the next event batch while the previous one applies."""
+
+    @staticmethod
+    def _event(path, value):
+        return {"itemType": "update", "path": path, "itemValue": value}
+
+    async def test_next_poll_before_processing(self, hass, mock_api):
+        """Send the next long poll before the received batch is processed."""
+        mock_api.get_subscribed_paths.return_value = ["player:volume"]
+        mock_api.create_event_queue = AsyncMock(return_value="q1")
+        polled = asyncio.Event()
+        never = asyncio.Event()
+        calls = []
+
+        async def poll(queue_id, timeout_ms):
+            calls.append(queue_id)
+            if len(calls) == 1:
+                return [self._event("player:volume", {"i32_": 20})]
+            polled.set()
+            await never.wait()
+
+        mock_api.poll_event_queue = AsyncMock(side_effect=poll)
+        processed_after_poll = []
+        mock_api.process_event = MagicMock(
+            side_effect=lambda path, value: (
+                processed_after_poll.append(polled.is_set()) or {"volume": 20}
+            )
+        )
+        coordinator = _make_coordinator(hass, mock_api)
+        coordinator.data = {"volume": 10}
+
+        await coordinator.async_start_event_listener()
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        assert processed_after_poll == [True]
+        assert coordinator.data["volume"] == 20
+        await coordinator.async_stop()
+
+    async def test_backlog_merged_into_one_update(self, hass, mock_api):
+        """Apply batches that queued up while busy as a single update."""
+        mock_api.process_event = MagicMock(
+            side_effect=lambda path, value: {path: value}
+        )
+        coordinator = _make_coordinator(hass, mock_api)
+        coordinator.data = {"a": 0, "b": 0}
+        stats = _EventShardStats(paths=2)
+        listener = MagicMock()
+        coordinator.async_add_listener(listener)
+        batches = asyncio.Queue()
+        batches.put_nowait((time.monotonic() - 0.05, [self._event("a", 1)]))
+        batches.put_nowait((time.monotonic(), [self._event("b", 2)]))
+
+        consumer = asyncio.create_task(
+            coordinator._consume_event_batches(batches, stats)
+        )
+        await batches.join()
+        consumer.cancel()
+
+        assert coordinator.data == {"a": 1, "b": 2}
+        assert listener.call_count == 1
+        assert stats.batches == 1
+        assert stats.events == 2
+        assert stats.deliveries == 2
+        assert stats.delivery_max >= 0.05
+        await coordinator.async_shutdown()
+
+
+class TestEventRecovery:
+    """Tests for recreating lost event queues and filling the gap."""
+
+    def test_retry_delay_backs_off(self, hass, mock_api):
+        """Retry at once, then back off exponentially up to the cap."""
+        coordinator = _make_coordinator(hass, mock_api)
+
+        assert coordinator._event_retry_delay(1) == 0
+        assert 0.5 <= coordinator._event_retry_delay(2) <= 1
+        assert 2 <= coordinator._event_retry_delay(4) <= 4
+        cap = coordinator.EVENT_LISTENER_RETRY_DELAY
+        assert cap / 2 <= coordinator._event_retry_delay(20) <= cap
+
+    async def test_resync_after_resubscribing(self, hass, mock_api):
+        """Read the subscribed paths once the lost queue is recreated."""
+        mock_api.get_subscribed_paths.return_value = ["player:volume"]
+        mock_api.create_event_queue = AsyncMock(side_effect=["q1", "q2"])
+        mock_api.read_subscribed_paths = AsyncMock(return_value={"volume": 30})
+        never = asyncio.Event()
+        polls = []
+
+        async def poll(queue_id, timeout_ms):
+            polls.append(queue_id)
+            if queue_id == "q1":
+                return None
+            await never.wait()
+
+        mock_api.poll_event_queue = AsyncMock(side_effect=poll)
+        coordinator = _make_coordinator(hass, mock_api)
+        coordinator.data = {"volume": 10}
+        coordinator.async_request_refresh = AsyncMock()
+
+        await coordinator.async_start_event_listener()
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+        assert polls == ["q1", "q2"]
+        mock_api.read_subscribed_paths.assert_awaited_once_with(["player:volume"])
+        assert coordinator.data["volume"] == 30
+        assert coordinator.event_queue_healthy
+        assert coordinator.get_event_stats()["all"]["resyncs"] == 1
+        # The API heard when the path stopped and started delivering again.
+        live = [c.args[0] for c in mock_api.set_live_event_paths.call_args_list]
+        assert live == [{"player:volume"}, set(), {"player:volume"}]
+        await coordinator.async_stop()
+        mock_api.set_live_event_paths.assert_called_with(set())
+
+
+class TestIncrementalSubscriptions:
+    """Tests for updating live event queues in place."""
+
+    async def _start(self, hass, mock_api, paths):
+        mock_api.get_subscribed_paths.return_value = paths
+        mock_api.create_event_queue = AsyncMock(return_value="q1")
+        never = asyncio.Event()
+
+        async def poll(queue_id, timeout_ms):
+            await never.wait()
+
+        mock_api.poll_event_queue = AsyncMock(side_effect=poll)
+        mock_api.read_subscribed_paths = AsyncMock(return_value={})
+        coordinator = _make_coordinator(hass, mock_api)
+        coordinator.data = {"volume": 10}
+        await coordinator.async_start_event_listener()
+        for _ in range(3):
+            await asyncio.sleep(0)
+        return coordinator
+
+    async def test_diff_applied_to_live_queue(self, hass, mock_api):
+        """Modify the queue and read only the newly subscribed paths."""
+        coordinator = await self._start(
+            hass, mock_api, ["player:volume", "player:mute"]
+        )
+        mock_api.modify_event_queue = AsyncMock(return_value=True)
+        mock_api.get_subscribed_paths.return_value = ["player:volume", "ui:night"]
+
+        await coordinator._async_update_subscriptions()
+
+        mock_api.modify_event_queue.assert_awaited_once_with(
+            "q1", ["ui:night"], ["player:mute"]
+        )
+        mock_api.read_subscribed_paths.assert_awaited_once_with(["ui:night"])
+        mock_api.create_event_queue.assert_awaited_once()
+        assert coordinator.get_event_stats()["all"]["paths"] == 2
+        await coordinator.async_stop()
+
+    async def test_rejected_change_recreates_queue(self, hass, mock_api):
+        """Recreate the queues when the device rejects the modification."""
+        coordinator = await self._start(hass, mock_api, ["player:volume"])
+        mock_api.modify_event_queue = AsyncMock(return_value=False)
+        mock_api.get_subscribed_paths.return_value = ["player:mute"]
+
+        await coordinator._async_update_subscriptions()
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+        assert mock_api.create_event_queue.await_args_list[-1].args[0] == [
+            "player:mute"
+        ]
+        mock_api.read_subscribed_paths.assert_awaited_once_with(["player:mute"])
+        await coordinator.async_stop()
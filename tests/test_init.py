@@ -0,0 +1,87 @@
+"""Tests for the Ambeo Soundbar config entry setup."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.ambeo_soundbar.api.factory import DeviceIdentity
+from custom_components.ambeo_soundbar.const import CONFIG_HOST, DOMAIN
+from custom_components.ambeo_soundbar.store import AmbeoMetadataStore, DeviceMetadata
+
+METADATA = DeviceMetadata(
+    serial="SN123456",
+    model="AMBEO Soundbar Plus",
+    name="Ambeo Soundbar Plus",
+    version="1.0.0",
+    sources=[{"id": "hdmi1", "title": "HDMI 1"}],
+    presets=[{"id": 1, "title": "Movies"}],
+)
+
+
+def _make_entry(hass):
+    entry = MockConfigEntry(domain=DOMAIN, data={CONFIG_HOST: "ambeo.local"})
+    entry.add_to_hass(hass)
+    return entry
+
+
+async def _setup(hass, entry, mock_api, bootstrap):
+    """Set up the entry without platforms, network or event queues."""
+    with (
+        patch("custom_components.ambeo_soundbar.AmbeoConnectionPool"),
+        patch("custom_components.ambeo_soundbar.AmbeoAPIFactory.bootstrap", bootstrap),
+        patch(
+            "custom_components.ambeo_soundbar.AmbeoAPIFactory.api_class_for_model",
+            return_value=MagicMock(return_value=mock_api),
+        ),
+        patch(
+            "custom_components.ambeo_soundbar.AmbeoCoordinator.async_start_event_listener",
+            AsyncMock(),
+        ),
+        patch.object(hass.config_entries, "async_forward_entry_setups", AsyncMock()),
+        patch.object(hass.config_entries, "async_reload", AsyncMock()) as reload,
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+    coordinator = entry.runtime_data.coordinator
+    await coordinator.async_stop()
+    await coordinator.async_shutdown()
+    return coordinator, reload
+
+
+@pytest.mark.usefixtures("mock_async_zeroconf")
+class TestSetupEntry:
+    """Tests for setting up an entry with and without cached metadata."""
+
+    async def test_first_setup_saves_fetched_metadata(self, hass, mock_api):
+        """Cache what setup read instead of fetching it all again."""
+        mock_api.get_all_sources = AsyncMock(return_value=METADATA.sources)
+        mock_api.get_all_presets = AsyncMock(return_value=METADATA.presets)
+        entry = _make_entry(hass)
+        identity = DeviceIdentity(
+            METADATA.serial, METADATA.model, METADATA.name, METADATA.version
+        )
+        bootstrap = AsyncMock(return_value=(mock_api, identity))
+
+        await _setup(hass, entry, mock_api, bootstrap)
+
+        assert await AmbeoMetadataStore(hass, entry.entry_id).async_load() == METADATA
+        assert mock_api.get_all_sources.await_count == 1
+        assert mock_api.get_serial.await_count == 0
+
+    async def test_cached_setup_skips_bootstrap(self, hass, mock_api):
+        """Come up from the cache and keep it when the device still matches."""
+        mock_api.get_all_sources = AsyncMock(return_value=METADATA.sources)
+        mock_api.get_all_presets = AsyncMock(return_value=METADATA.presets)
+        entry = _make_entry(hass)
+        await AmbeoMetadataStore(hass, entry.entry_id).async_save(METADATA)
+        bootstrap = AsyncMock()
+
+        coordinator, reload = await _setup(hass, entry, mock_api, bootstrap)
+
+        bootstrap.assert_not_awaited()
+        assert coordinator.sources == METADATA.sources
+        assert coordinator.presets == METADATA.presets
+        # The background revalidation found nothing to reload for.
+        assert mock_api.get_serial.await_count == 1
+        reload.assert_not_awaited()
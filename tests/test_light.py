@@ -74,6 +74,11 @@ class TestBaseLight:
         entity = LEDBar(coordinator, _make_device())
         assert entity.brightness is None
 
+    def test_listens_to_own_data_key(self):
+        """Register only the brightness key as the coordinator context."""
+        entity = LEDBar(_make_coordinator(), _make_device())
+        assert entity.coordinator_context == frozenset({"led_bar_brightness"})
+
     async def test_turn_on_without_brightness_uses_default(self):
         """Set brightness to the entity's default when turned on without a brightness arg."""
         coordinator = _make_coordinator(data={"led_bar_brightness": 0})
@@ -101,6 +106,13 @@ class TestBaseLight:
 class TestAmbeoLogo:
     """Tests for the AmbeoLogo light entity, which combines state and brightness."""
 
+    def test_listens_to_state_and_brightness(self):
+        """Register both logo keys as the coordinator context."""
+        entity = AmbeoLogo(_make_coordinator(), _make_device())
+        assert entity.coordinator_context == frozenset(
+            {"logo_brightness", "logo_state"}
+        )
+
     def test_is_on_requires_state_and_brightness(self):
         """Return True only when both logo_state is True and brightness is positive."""
         coordinator = _make_coordinator(
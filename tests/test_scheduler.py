@@ -0,0 +1,278 @@
+"""Tests for the Ambeo Soundbar request scheduler."""
+
+import asyncio
+import random
+from unittest.mock import AsyncMock
+
+import pytest
+
+from custom_components.ambeo_soundbar.api.exceptions import AmbeoConnectionError
+from custom_components.ambeo_soundbar.api.impl.espresso_api import AmbeoEspressoApi
+from custom_components.ambeo_soundbar.api.impl.popcorn_api import AmbeoPopcornApi
+from custom_components.ambeo_soundbar.api.scheduler import (
+    AimdLimiter,
+    RequestPriority,
+    RequestScheduler,
+    request_priority,
+)
+from custom_components.ambeo_soundbar.coordinator import AmbeoCoordinator
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestRequestScheduler:
+    """Tests for capping concurrency and ordering waiters by priority."""
+
+    async def test_cap_and_priority_order(self):
+        """Hand freed slots to the most urgent waiter first."""
+        scheduler = RequestScheduler(1)
+        order = []
+
+        async def request(name, priority):
+            async with scheduler.slot(priority):
+                order.append(name)
+                await asyncio.sleep(0)
+
+        await scheduler.acquire(RequestPriority.BACKGROUND)
+        tasks = [
+            asyncio.create_task(request("poll", RequestPriority.BACKGROUND)),
+            asyncio.create_task(request("resync", RequestPriority.RESYNC)),
+            asyncio.create_task(request("mute", RequestPriority.INTERACTIVE)),
+        ]
+        await _settle()
+        assert order == []
+        assert scheduler.as_dict()["waiting"] == 3
+
+        scheduler.release()
+        await asyncio.gather(*tasks)
+
+        assert order == ["mute", "resync", "poll"]
+        assert scheduler.active == 0
+        assert scheduler.as_dict()["interactive"]["queued"] == 1
+
+    async def test_cancelled_waiter_leaves_queue(self):
+        """Drop a cancelled waiter without leaking its slot."""
+        scheduler = RequestScheduler(1)
+        await scheduler.acquire(RequestPriority.BACKGROUND)
+        waiter = asyncio.create_task(scheduler.acquire(RequestPriority.INTERACTIVE))
+        await _settle()
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        scheduler.release()
+
+        assert scheduler.active == 0
+        assert scheduler.as_dict()["waiting"] == 0
+
+    async def test_raising_limit_starts_waiters(self):
+        """Start queued requests as soon as the cap grows."""
+        scheduler = RequestScheduler(1)
+        await scheduler.acquire(RequestPriority.BACKGROUND)
+        waiter = asyncio.create_task(scheduler.acquire(RequestPriority.BACKGROUND))
+        await _settle()
+
+        scheduler.limit = 2
+        await waiter
+
+        assert scheduler.active == 2
+
+    async def test_no_limit(self):
+        """Never queue while no cap is set."""
+        scheduler = RequestScheduler()
+        for _ in range(10):
+            await scheduler.acquire(RequestPriority.BACKGROUND)
+        assert scheduler.active == 10
+
+
+class TestApiScheduling:
+    """Tests for the priorities the API gives its requests."""
+
+    async def test_command_overtakes_polling(self):
+        """Send a write before reads that were queued earlier."""
+        api = AmbeoPopcornApi("ambeo.local", 80, 5, None)
+        api.set_request_limit(1)
+        release = asyncio.Event()
+        sent = []
+
+        async def fetch(url, *args, **kwargs):
+            sent.append(url.split("?")[0] + ":" + url.split("path=")[1].split("&")[0])
+            await release.wait()
+            return {"value": {"i32_": 1, "bool_": True, "double_": 1.0}}
+
+        api.fetch_data = AsyncMock(side_effect=fetch)
+        reads = [
+            asyncio.create_task(api.get_volume()),
+            asyncio.create_task(api.get_night_mode()),
+        ]
+        await _settle()
+        write = asyncio.create_task(api.set_mute(True))
+        await _settle()
+        release.set()
+        await asyncio.gather(*reads, write)
+
+        assert sent == [
+            "getData:player:volume",
+            "setData:settings:/mediaPlayer/mute",
+            "getData:settings:/popcorn/audio/nightModeStatus",
+        ]
+
+    async def test_command_read_overtakes_polling(self, hass):
+        """Send the read a brightness write needs ahead of queued polling."""
+        api = AmbeoEspressoApi("ambeo.local", 80, 5, None)
+        coordinator = AmbeoCoordinator(hass, api, [], [])
+        coordinator.data = {"display_brightness": 60}
+        api.set_request_limit(1)
+        gates = []
+        sent = []
+
+        async def fetch(url, *args, **kwargs):
+            sent.append(url.split("?")[0] + ":" + url.split("path=")[1].split("&")[0])
+            gates.append(asyncio.Event())
+            await gates[-1].wait()
+            return {
+                "value": {
+                    "i32_": 1,
+                    "bool_": True,
+                    "espressoBrightness": {"ambeologo": 40, "display": 60},
+                }
+            }
+
+        api.fetch_data = AsyncMock(side_effect=fetch)
+        tasks = [
+            asyncio.create_task(api.get_volume()),
+            asyncio.create_task(api.get_night_mode()),
+            asyncio.create_task(api.get_sound_feedback()),
+        ]
+        await _settle()
+        tasks.append(asyncio.create_task(coordinator.async_set_display_brightness(80)))
+        await _settle()
+        # Answer one request at a time so each freed slot sees every waiter.
+        while not all(task.done() for task in tasks):
+            gates[-1].set()
+            await _settle()
+
+        # The write can only queue once its read returned, but both go ahead
+        # of the polling queued before them.
+        assert sent == [
+            "getData:player:volume",
+            "getData:settings:/espresso/brightnessSensor",
+            "getData:espresso:nightModeUi",
+            "setData:settings:/espresso/brightnessSensor",
+            "getData:settings:/espresso/soundFeedback",
+        ]
+        assert coordinator.data["display_brightness"] == 80
+
+    async def test_explicit_priority(self):
+        """Use the priority requested by the calling task."""
+        api = AmbeoPopcornApi("ambeo.local", 80, 5, None)
+        api.fetch_data = AsyncMock(return_value={"value": {"i32_": 1}})
+
+        with request_priority(RequestPriority.RESYNC):
+            await api.get_volume()
+
+        stats = api.get_scheduler_stats()
+        assert stats["resync"]["requests"] == 1
+        assert stats["background"]["requests"] == 0
+
+
+class TestAimdLimiter:
+    """Tests for adapting the concurrency limit to the device."""
+
+    def test_error_halves_once_per_window(self):
+        """Halve on an error, ignoring errors from requests already in flight."""
+        limiter = AimdLimiter(8)
+
+        limiter.on_error()
+        limiter.on_error()
+
+        assert limiter.limit == 4
+        assert [h["reason"] for h in limiter.history] == ["error"]
+
+    def test_additive_increase_up_to_bound(self):
+        """Grow by one per window of healthy requests, never past the bound."""
+        limiter = AimdLimiter(3)
+        limiter.on_error()
+        assert limiter.limit == 1
+
+        for _ in range(20):
+            limiter.on_success("getData", 0.05)
+
+        assert limiter.limit == 3
+        assert [h["limit"] for h in limiter.history] == [1, 2, 3]
+
+    def _warm_up(self, limiter, kind="getData volume", latency=0.05):
+        for _ in range(AimdLimiter.MIN_SAMPLES):
+            limiter.on_success(kind, latency)
+
+    def test_sustained_slowdown_decreases(self):
+        """Treat several requests in a row much slower than usual as congestion."""
+        limiter = AimdLimiter(4)
+        self._warm_up(limiter)
+
+        for _ in range(AimdLimiter.SLOW_STREAK):
+            limiter.on_success("getData volume", 0.5)
+
+        assert limiter.limit == 2
+        assert limiter.history[-1]["reason"] == "latency"
+
+    def test_single_spike_ignored(self):
+        """Keep the limit when one slow request is followed by normal ones."""
+        limiter = AimdLimiter(4)
+        self._warm_up(limiter)
+
+        limiter.on_success("getData volume", 0.5)
+        limiter.on_success("getData volume", 0.05)
+        limiter.on_success("getData volume", 0.5)
+
+        assert limiter.limit == 4
+
+    def test_latency_per_request_kind(self):
+        """Compare each request with the usual latency of its own kind."""
+        limiter = AimdLimiter(4)
+        self._warm_up(limiter)
+
+        for _ in range(AimdLimiter.SLOW_STREAK):
+            limiter.on_success("getData player:player/data/value", 0.5)
+            limiter.on_success("getRows settings:/popcorn/audio", 0.5)
+
+        assert limiter.limit == 4
+
+    def test_jittered_latency_keeps_limit(self):
+        """Hold the limit when latencies merely vary around a steady mean."""
+        rng = random.Random(1)
+        limiter = AimdLimiter(4)
+        limits = []
+        for _ in range(2000):
+            kind = rng.choice(["getData volume", "getData player:player/data/value"])
+            base = 0.02 if kind == "getData volume" else 0.08
+            limiter.on_success(kind, base * rng.uniform(0.5, 2.0))
+            limits.append(limiter.limit)
+
+        assert limits.count(1) == 0
+        assert sum(limit == 4 for limit in limits) / len(limits) > 0.9
+
+    def test_lower_bound_applies_at_once(self):
+        """Clamp the limit when the configured bound is lowered."""
+        limiter = AimdLimiter(6)
+
+        limiter.set_max_limit(2)
+
+        assert limiter.limit == 2
+
+    async def test_api_errors_lower_scheduler_cap(self):
+        """Feed request failures back into the scheduler's cap."""
+        api = AmbeoPopcornApi("ambeo.local", 80, 5, None)
+        api.set_request_limit(4)
+        api.fetch_data = AsyncMock(side_effect=AmbeoConnectionError("timeout"))
+
+        with pytest.raises(AmbeoConnectionError):
+            await api.get_volume()
+
+        stats = api.get_scheduler_stats()
+        assert stats["limit"] == 2
+        assert stats["adaptive"]["max_limit"] == 4
+        assert stats["adaptive"]["history"][-1]["reason"] == "error"
@@ -0,0 +1,102 @@
+"""Tests for the Ambeo Soundbar metadata cache."""
+
+from unittest.mock import AsyncMock, patch
+
+from custom_components.ambeo_soundbar.store import (
+    AmbeoMetadataStore,
+    AmbeoSnapshotStore,
+    DeviceMetadata,
+    async_fetch_metadata,
+)
+
+METADATA = DeviceMetadata(
+    serial="SN123456",
+    model="AMBEO Soundbar Plus",
+    name="Ambeo Soundbar Plus",
+    version="1.0.0",
+    sources=[{"id": "hdmi1", "title": "HDMI 1"}],
+    presets=[{"id": 1, "title": "Movies"}],
+    has_subwoofer=True,
+)
+
+
+class TestMetadataStore:
+    """Tests for persisting device metadata."""
+
+    async def test_round_trip(self, hass):
+        """Load the metadata that was saved."""
+        store = AmbeoMetadataStore(hass, "entry")
+        assert await store.async_load() is None
+
+        await store.async_save(METADATA)
+
+        assert await AmbeoMetadataStore(hass, "entry").async_load() == METADATA
+
+    async def test_unsupported_model_ignored(self, hass):
+        """Ignore a cache whose model has no API implementation."""
+        store = AmbeoMetadataStore(hass, "entry")
+        await store.async_save(
+            DeviceMetadata("SN1", "Unknown", None, None, [], [], None)
+        )
+
+        assert await store.async_load() is None
+
+    async def test_remove(self, hass):
+        """Forget the metadata once removed."""
+        store = AmbeoMetadataStore(hass, "entry")
+        await store.async_save(METADATA)
+
+        await store.async_remove()
+
+        assert await store.async_load() is None
+
+
+class TestFetchMetadata:
+    """Tests for reading the metadata from the device."""
+
+    async def test_fetch(self, mock_api):
+        """Combine identity, sources, presets and subwoofer presence."""
+        mock_api.get_all_sources = AsyncMock(return_value=METADATA.sources)
+        mock_api.get_all_presets = AsyncMock(return_value=METADATA.presets)
+        mock_api.has_capability.return_value = True
+        mock_api.has_subwoofer = AsyncMock(return_value=True)
+
+        assert await async_fetch_metadata(mock_api) == METADATA
+
+    async def test_changed_version_differs(self, mock_api):
+        """Detect a firmware update as a metadata change."""
+        mock_api.get_version = AsyncMock(return_value="2.0.0")
+
+        metadata = await async_fetch_metadata(mock_api)
+
+        assert metadata.version == "2.0.0"
+        assert metadata != METADATA
+        assert metadata.has_subwoofer is None
+
+
+class TestSnapshotStore:
+    """Tests for persisting the last known data."""
+
+    async def test_unchanged_data_does_not_postpone_save(self, hass):
+        """Schedule a save only when the persisted data changes."""
+        store = AmbeoSnapshotStore(hass, "entry")
+        await store.async_load()
+
+        with patch.object(store._store, "async_delay_save") as delay_save:
+            store.async_delay_save({"volume": 20})
+            store.async_delay_save({"volume": 20})
+            store.async_delay_save({"volume": 30})
+
+        assert delay_save.call_count == 2
+        assert delay_save.call_args.args[0]() == {"volume": 30}
+
+    async def test_restored_data_not_saved_again(self, hass):
+        """Skip the save when the data still matches what was loaded."""
+        await AmbeoSnapshotStore(hass, "entry")._store.async_save({"volume": 20})
+        store = AmbeoSnapshotStore(hass, "entry")
+        await store.async_load()
+
+        with patch.object(store._store, "async_delay_save") as delay_save:
+            store.async_delay_save({"volume": 20})
+
+        delay_save.assert_not_called()
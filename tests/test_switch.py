@@ -57,6 +57,21 @@ class TestAmbeoBaseSwitch:
         entity = NightMode(coordinator, _make_device())
         assert entity.is_on is None
 
+    def test_assumed_state_while_stale(self):
+        """Flag the state as assumed while it comes from restored data."""
+        coordinator = _make_coordinator(data={"night_mode": True})
+        coordinator.data_is_stale = True
+        entity = NightMode(coordinator, _make_device())
+        assert entity.assumed_state is True
+
+        coordinator.data_is_stale = False
+        assert entity.assumed_state is False
+
+    def test_listens_to_own_data_key(self):
+        """Register only the switch data key as the coordinator context."""
+        entity = NightMode(_make_coordinator(), _make_device())
+        assert entity.coordinator_context == frozenset({"night_mode"})
+
     def test_is_on_none_when_no_data(self):
         """Return None when coordinator has no data yet."""
         coordinator = _make_coordinator()